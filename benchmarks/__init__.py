@@ -0,0 +1 @@
+"""Performance benchmarks for the game engine (run as modules, not under pytest)."""
@@ -0,0 +1,344 @@
+"""
+Microbenchmarks for prompt assembly at large game sizes.
+
+Builds synthetic games (10, 20 and 50 rounds by default, long speeches,
+a revote every other round) and times each ContextBuilder section and
+TranscriptManager.get_transcript_for_player separately.
+
+    python -m benchmarks.context_assembly
+    python -m benchmarks.context_assembly --rounds 50 --profile
+    python -m benchmarks.context_assembly --save-baseline
+
+--profile runs cProfile over build_context and shows the hottest functions
+plus how much time goes to string building, pydantic and json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import io
+import pstats
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.harness import compare, environment, load_json, write_json
+from src.engine.context import ContextBuilder, compile_prompt
+from src.engine.transcript import TranscriptManager
+from src.personas.initial import get_personas
+from src.schemas import ActionType, DefenseSpeech, GameState, PlayerMemory
+
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = BENCH_DIR / "results"
+BASELINE_PATH = BENCH_DIR / "baselines" / "context_assembly.json"
+
+DEFAULT_ROUNDS = [10, 20, 50]
+
+_SENTENCE = (
+    "I have been watching the votes closely and the pattern does not add up, "
+    "so I want answers before we lock anything in today. "
+)
+
+
+def _speech(words: int, index: int) -> str:
+    text = (_SENTENCE * (words // len(_SENTENCE.split()) + 1)).split()[:words]
+    return f"[{index}] " + " ".join(text)
+
+
+def build_game(
+    rounds: int, players: int = 10, speech_words: int = 140, revote_every: int = 2
+) -> tuple[TranscriptManager, PlayerMemory, GameState, list[str]]:
+    """
+    Build a synthetic finished game of the given length.
+
+    Every player speaks every round (nobody dies, so prompts stay at their
+    largest), and every `revote_every`-th round ends in a tie with defense
+    speeches and a revote.
+
+    Returns:
+        Transcript manager with a live round in progress, a player's memory,
+        the current game state, and the player names
+    """
+    names = [f"Player{i}" for i in range(players)]
+    manager = TranscriptManager()
+    for round_number in range(1, rounds + 1):
+        night_kill = names[round_number % players] if round_number > 1 else None
+        manager.start_round(round_number, night_kill)
+        for seat, name in enumerate(names):
+            text = _speech(speech_words, round_number * players + seat)
+            manager.add_speech(name, text, names[(seat + 1) % players])
+        votes = {name: names[(seat + 2) % players] for seat, name in enumerate(names)}
+        tied = revote_every and round_number % revote_every == 0
+        manager.finalize_round(
+            round_number=round_number,
+            night_kill=night_kill,
+            votes=votes,
+            vote_outcome="revote" if tied else f"eliminated:{names[2]}",
+            last_words=None if tied else _speech(speech_words // 2, round_number),
+            defense_speeches=[
+                DefenseSpeech(speaker=name, text=_speech(speech_words, round_number))
+                for name in names[:2]
+            ]
+            if tied
+            else None,
+            revote=votes if tied else None,
+            revote_outcome=f"eliminated:{names[1]}" if tied else None,
+        )
+
+    # Live round so windowed transcripts include in-progress speeches
+    current_round = rounds + 1
+    manager.start_round(current_round, names[0])
+    for seat, name in enumerate(names[: players // 2]):
+        manager.add_speech(name, _speech(speech_words, seat), names[seat + 1])
+
+    memory = PlayerMemory(
+        facts={
+            "investigation_results": [
+                {"target": names[r % players], "result": "town"} for r in range(rounds)
+            ],
+            "mafia_kill_history": [
+                {"target": names[r % players], "outcome": "killed"} for r in range(rounds)
+            ],
+            "doctor_protection_history": [{"target": names[r % players]} for r in range(rounds)],
+        },
+        beliefs={
+            "suspicions": _speech(60, 0),
+            "strategy": _speech(60, 1),
+        },
+    )
+    state = GameState(
+        phase=f"day_{current_round}",
+        round_number=current_round,
+        living_players=names,
+        dead_players=[],
+        nominated_players=names[:3],
+    )
+    return manager, memory, state, names
+
+
+def build_cases(rounds: int) -> dict[str, Callable[[], Any]]:
+    """Named zero-argument callables to time for one game size."""
+    manager, memory, state, names = build_game(rounds)
+    builder = ContextBuilder()
+    persona = next(iter(get_personas().values()))
+    compiled = compile_prompt(names[5], "town", persona)
+    windowed = manager.get_transcript_for_player(state.round_number)
+    full = manager.get_transcript_for_player(state.round_number, full=True)
+    extra = {
+        "speaking_order": {
+            "position": 6,
+            "total": len(names),
+            "spoken": names[:5],
+            "remaining": names[6:],
+        }
+    }
+
+    return {
+        "get_transcript_for_player": lambda: manager.get_transcript_for_player(
+            state.round_number
+        ),
+        "get_transcript_for_player_full": lambda: manager.get_transcript_for_player(
+            state.round_number, full=True
+        ),
+        "identity_section": lambda: builder._build_identity_section(names[5], "town", persona),
+        "game_state_section": lambda: builder._build_game_state_section(state),
+        "transcript_section": lambda: builder._build_transcript_section(windowed),
+        "transcript_section_full": lambda: builder._build_transcript_section(full),
+        "summarize_facts": lambda: builder._summarize_facts(memory.facts),
+        "memory_section": lambda: builder._build_memory_section(memory),
+        "action_prompt": lambda: builder._build_action_prompt(
+            ActionType.SPEAK, state, names[5], "town", extra
+        ),
+        "build_context": lambda: builder.build_context(
+            names[5], "town", persona, state, windowed, memory, ActionType.SPEAK, extra
+        ),
+        "build_context_compiled": lambda: builder.build_context(
+            names[5],
+            "town",
+            persona,
+            state,
+            windowed,
+            memory,
+            ActionType.SPEAK,
+            extra,
+            compiled=compiled,
+        ),
+        "build_context_with_transcript": lambda: builder.build_context(
+            names[5],
+            "town",
+            persona,
+            state,
+            manager.get_transcript_for_player(state.round_number),
+            memory,
+            ActionType.SPEAK,
+            extra,
+        ),
+    }
+
+
+def time_case(
+    func: Callable[[], Any], repeat: int = 5, min_time: float = 0.05
+) -> dict[str, float]:
+    """
+    Time a callable in microseconds per call.
+
+    Args:
+        func: Zero-argument callable
+        repeat: Timing runs after calibration
+        min_time: Target seconds per run (loop count is calibrated to it)
+
+    Returns:
+        Best and median microseconds per call, plus loops per run
+    """
+    timer = timeit.Timer(func)
+    # Calibrate on a single call so each run takes about min_time
+    loops = max(1, int(min_time / max(timer.timeit(number=1), 1e-9)))
+    runs = [t / loops * 1e6 for t in timer.repeat(repeat=repeat, number=loops)]
+    return {"best_us": min(runs), "median_us": statistics.median(runs), "loops": loops}
+
+
+def run(rounds_list: list[int], repeat: int = 5, min_time: float = 0.05) -> dict[str, Any]:
+    """Time every case for every game size."""
+    scenarios: dict[str, Any] = {}
+    for rounds in rounds_list:
+        cases = build_cases(rounds)
+        scenarios[f"rounds={rounds}"] = {
+            name: time_case(func, repeat, min_time) for name, func in cases.items()
+        }
+        context = cases["build_context"]()
+        scenarios[f"rounds={rounds}"]["context_chars"] = len(context)
+    return scenarios
+
+
+# Profile buckets: (label, predicate on (filename, function name))
+_CATEGORIES: list[tuple[str, Callable[[str, str], bool]]] = [
+    ("pydantic", lambda file, name: "pydantic" in file or "pydantic" in name),
+    ("json", lambda file, name: "/json/" in file or "json" in name),
+    (
+        "string building",
+        lambda file, name: any(
+            token in name for token in ("'join' of 'str'", "'format' of 'str'", "'split' of 'str'")
+        ),
+    ),
+    ("context builder", lambda file, name: file.endswith("engine/context.py")),
+    ("prompts", lambda file, name: file.endswith("engine/prompts.py")),
+    ("transcript", lambda file, name: file.endswith("engine/transcript.py")),
+]
+
+
+def profile(rounds: int, loops: int, top: int, output: str | None) -> str:
+    """
+    Profile repeated build_context calls (with transcript windowing).
+
+    Args:
+        rounds: Game size to profile
+        loops: Calls to profile
+        top: Number of functions to list
+        output: Optional path for the raw .prof file
+
+    Returns:
+        Text report
+    """
+    func = build_cases(rounds)["build_context_with_transcript"]
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(loops):
+        func()
+    profiler.disable()
+    if output:
+        profiler.dump_stats(output)
+
+    stats = pstats.Stats(profiler)
+    totals: dict[str, float] = {label: 0.0 for label, _ in _CATEGORIES}
+    totals["other"] = 0.0
+    for (file, _line, name), row in stats.stats.items():  # type: ignore[attr-defined]
+        own_time = row[2]
+        for label, matches in _CATEGORIES:
+            if matches(file, name):
+                totals[label] += own_time
+                break
+        else:
+            totals["other"] += own_time
+    overall = sum(totals.values()) or 1.0
+
+    buffer = io.StringIO()
+    buffer.write(f"Profile: build_context x{loops} at {rounds} rounds\n\n")
+    buffer.write("Own time by category:\n")
+    for label, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+        buffer.write(f"  {label:<16} {seconds * 1000:9.2f} ms  {seconds / overall:6.1%}\n")
+    buffer.write("\n")
+    pstats.Stats(profiler, stream=buffer).sort_stats("tottime").print_stats(top)
+    return buffer.getvalue()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Prompt assembly microbenchmarks",
+        prog="python -m benchmarks.context_assembly",
+    )
+    parser.add_argument("--rounds", type=int, nargs="+", default=DEFAULT_ROUNDS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="Seconds per timing run")
+    parser.add_argument("--profile", action="store_true", help="cProfile build_context")
+    parser.add_argument("--profile-loops", type=int, default=200)
+    parser.add_argument("--profile-top", type=int, default=25)
+    parser.add_argument("--profile-output", type=str, default=None, help="Write .prof file")
+    parser.add_argument("--output", type=str, default=None, help="Result JSON path")
+    parser.add_argument("--baseline", type=str, default=None)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    scenarios = run(args.rounds, args.repeat, args.min_time)
+    for scenario, cases in scenarios.items():
+        print(f"\n{scenario} (context {cases['context_chars']} chars)")
+        for name, timing in cases.items():
+            if isinstance(timing, dict):
+                print(
+                    f"  {name:<32} {timing['best_us']:10.1f} us  "
+                    f"(median {timing['median_us']:.1f})"
+                )
+
+    if args.profile:
+        print()
+        print(profile(max(args.rounds), args.profile_loops, args.profile_top, args.profile_output))
+
+    report = {
+        "benchmark": "context_assembly",
+        "timestamp": datetime.now(UTC).isoformat(),
+        "environment": environment(),
+        "scenarios": scenarios,
+    }
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+    output = Path(args.output) if args.output else RESULTS_DIR / f"context_assembly-{stamp}.json"
+    write_json(output, report)
+    print(f"Results: {output}")
+    if args.save_baseline:
+        write_json(BASELINE_PATH, report)
+        print(f"Baseline: {BASELINE_PATH}")
+        return 0
+
+    baseline_path = Path(args.baseline) if args.baseline else BASELINE_PATH
+    if not baseline_path.exists():
+        return 0
+    metrics = [f"{name}.best_us" for name in build_cases(1)]
+    rows = compare(scenarios, load_json(baseline_path)["scenarios"], metrics, args.tolerance)
+    regressions = [row for row in rows if row["regression"]]
+    for row in regressions:
+        print(
+            f"REGRESSION {row['scenario']} {row['metric']}: "
+            f"{row['baseline']:.1f} -> {row['current']:.1f} us ({row['change']:+.1%})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
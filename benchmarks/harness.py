@@ -0,0 +1,227 @@
+"""Shared benchmark helpers: component CPU timers, loop-lag sampling, baselines."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import json
+import math
+import platform
+import resource
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in 0-100); 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def environment() -> dict[str, str]:
+    """Machine description stored with results."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+_STATS_LOCK = threading.Lock()
+
+
+@dataclass
+class ComponentStats:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class ComponentTimer:
+    """
+    Charges thread CPU time for calls into engine components.
+
+    Methods (or module functions) are patched for the duration of a block.
+    Nested calls into the same component are counted once, per thread, so
+    work offloaded to worker threads (log writing) is measured too. A call
+    made from inside another component is charged to both components, but
+    `top_level_seconds` counts it once, so use it for totals.
+    """
+
+    stats: dict[str, ComponentStats] = field(default_factory=dict)
+    top_level_seconds: float = 0.0
+    _local: threading.local = field(default_factory=threading.local)
+
+    @contextmanager
+    def patch(
+        self, component: str, target: type | ModuleType, names: list[str] | None = None
+    ) -> Iterator[None]:
+        """
+        Instrument functions on a class or module for the duration of the block.
+
+        Args:
+            component: Name results are reported under
+            target: Class or module to patch
+            names: Functions to wrap (default: all public functions on a class)
+        """
+        if names is None:
+            names = [
+                name
+                for name, value in vars(target).items()
+                if not name.startswith("_") and inspect.isfunction(value)
+            ]
+        originals = {name: vars(target)[name] for name in names}
+        for name, original in originals.items():
+            if inspect.iscoroutinefunction(original):
+                raise TypeError(f"Cannot time coroutine function {name}; patch its sync work")
+        self.stats.setdefault(component, ComponentStats())
+        try:
+            for name, original in originals.items():
+                setattr(target, name, self._wrap(component, original))
+            yield
+        finally:
+            for name, original in originals.items():
+                setattr(target, name, original)
+
+    def _wrap(self, component: str, func: Callable) -> Callable:
+        stats = self.stats[component]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            active = self._local.__dict__.setdefault("active", set())
+            if component in active:
+                return func(*args, **kwargs)
+            top_level = not active
+            active.add(component)
+            started = time.thread_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.thread_time() - started
+                active.discard(component)
+                with _STATS_LOCK:
+                    stats.calls += 1
+                    stats.seconds += elapsed
+                    if top_level:
+                        self.top_level_seconds += elapsed
+
+        return wrapper
+
+
+class LoopLagMonitor:
+    """Samples event-loop lag: how late a periodic sleep wakes up."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - started - self.interval))
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def summary(self) -> dict[str, float]:
+        """Lag percentiles in milliseconds."""
+        return {
+            "p50_ms": percentile(self.samples, 50) * 1000,
+            "p99_ms": percentile(self.samples, 99) * 1000,
+            "max_ms": max(self.samples, default=0.0) * 1000,
+        }
+
+
+# Metric name -> True if higher is better
+HIGHER_IS_BETTER = {"games_per_sec": True}
+
+
+def flatten_metrics(result: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Flatten nested numeric metrics into dotted keys."""
+    flat: dict[str, float] = {}
+    for key, value in result.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_metrics(value, f"{name}."))
+        elif isinstance(value, int | float) and not isinstance(value, bool):
+            flat[name] = float(value)
+    return flat
+
+
+def compare(
+    current: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    metrics: list[str],
+    tolerance: float,
+) -> list[dict[str, Any]]:
+    """
+    Compare keyed results against a baseline.
+
+    Args:
+        current: Results keyed by scenario name
+        baseline: Baseline results with the same keys
+        metrics: Dotted metric names to compare
+        tolerance: Allowed relative change in the bad direction (0.1 = 10%)
+
+    Returns:
+        One row per scenario/metric present in both, with a regression flag
+    """
+    rows = []
+    for scenario, result in current.items():
+        if scenario not in baseline:
+            continue
+        now = flatten_metrics(result)
+        before = flatten_metrics(baseline[scenario])
+        for metric in metrics:
+            if metric not in now or metric not in before or before[metric] == 0:
+                continue
+            change = (now[metric] - before[metric]) / before[metric]
+            higher_better = HIGHER_IS_BETTER.get(metric.rsplit(".", 1)[-1], False)
+            worse = -change if higher_better else change
+            rows.append({
+                "scenario": scenario,
+                "metric": metric,
+                "baseline": before[metric],
+                "current": now[metric],
+                "change": change,
+                "regression": worse > tolerance,
+            })
+    return rows
+
+
+def load_json(path: Path) -> dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
@@ -0,0 +1,254 @@
+"""
+End-to-end throughput benchmark for GameRunner.
+
+Runs waves of concurrent games against an in-process FakeProvider, either
+instant or with injected latency, and reports games/s, provider calls per
+game, engine CPU per call split by component, peak RSS and event-loop lag.
+Each scenario runs in a fresh interpreter so peak RSS is per scenario.
+
+    python -m benchmarks.throughput                      # 1, 10, 100, 1000 games
+    python -m benchmarks.throughput --levels 1 10 --providers instant
+    python -m benchmarks.throughput --save-baseline      # store for later runs
+
+Results are written as JSON; when a baseline exists, regressions beyond
+--tolerance are reported and the exit code is 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.harness import (
+    ComponentTimer,
+    LoopLagMonitor,
+    compare,
+    environment,
+    load_json,
+    peak_rss_mb,
+    write_json,
+)
+from src.engine.context import ContextBuilder
+from src.engine.events import EventLog
+from src.engine.game import GameConfig, GameRunner
+from src.engine.transcript import TranscriptManager
+from src.personas.initial import get_personas
+from src.providers.fake import FakeProvider
+from src.storage.json_logs import GameLogWriter
+
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = BENCH_DIR / "results"
+BASELINE_PATH = BENCH_DIR / "baselines" / "throughput.json"
+
+DEFAULT_LEVELS = [1, 10, 100, 1000]
+
+# Provider profiles: (latency, jitter) in seconds
+PROVIDERS: dict[str, tuple[float, float]] = {
+    "instant": (0.0, 0.0),
+    "latency": (0.05, 0.1),
+}
+
+COMPARED_METRICS = [
+    "games_per_sec",
+    "cpu_ms_per_call.total",
+    "peak_rss_mb",
+    "loop_lag.p99_ms",
+]
+
+
+async def run_scenario(
+    concurrency: int, provider_name: str, waves: int = 1, seed: int = 0
+) -> dict[str, Any]:
+    """
+    Run `waves` rounds of `concurrency` simultaneous games.
+
+    Args:
+        concurrency: Games running at once
+        provider_name: Key into PROVIDERS
+        waves: Sequential batches of concurrent games
+        seed: Base seed for game setup and provider answers
+
+    Returns:
+        Metrics dict for this scenario
+    """
+    latency, jitter = PROVIDERS[provider_name]
+    personas = get_personas()
+    timer = ComponentTimer()
+    lag = LoopLagMonitor()
+    providers: list[FakeProvider] = []
+    games = 0
+
+    with (
+        tempfile.TemporaryDirectory() as output_dir,
+        timer.patch("context_builder", ContextBuilder),
+        timer.patch("transcript", TranscriptManager),
+        timer.patch("event_log", EventLog),
+        timer.patch("log_writing", GameRunner, ["_build_log_data"]),
+        # The log is serialized in a worker thread
+        timer.patch("log_writing", GameLogWriter, ["_dump"]),
+    ):
+        lag.start()
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        for wave in range(waves):
+            runners = []
+            for index in range(concurrency):
+                game_seed = seed + wave * concurrency + index
+                provider = FakeProvider(latency=latency, jitter=jitter, seed=game_seed)
+                providers.append(provider)
+                config = GameConfig(
+                    player_names=list(personas),
+                    personas=personas,
+                    provider=provider,
+                    output_dir=output_dir,
+                    seed=game_seed,
+                )
+                runners.append(GameRunner(config))
+            await asyncio.gather(*(runner.run() for runner in runners))
+            games += len(runners)
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+        await lag.stop()
+
+    calls = sum(p.calls for p in providers)
+    per_call = {
+        name: (stats.seconds * 1000 / calls if calls else 0.0)
+        for name, stats in timer.stats.items()
+    }
+    # Components nest (_build_log_data reads the event log and transcript)
+    per_call["total"] = timer.top_level_seconds * 1000 / calls if calls else 0.0
+    return {
+        "concurrency": concurrency,
+        "provider": provider_name,
+        "games": games,
+        "elapsed_sec": elapsed,
+        "games_per_sec": games / elapsed if elapsed else 0.0,
+        "calls_per_game": calls / games if games else 0.0,
+        "process_cpu_ms_per_call": cpu * 1000 / calls if calls else 0.0,
+        "cpu_ms_per_call": per_call,
+        "peak_rss_mb": peak_rss_mb(),
+        "loop_lag": lag.summary(),
+    }
+
+
+def _run_isolated(concurrency: int, provider_name: str, waves: int) -> dict[str, Any]:
+    """Run one scenario in a child interpreter and read back its result."""
+    with tempfile.NamedTemporaryFile(suffix=".json") as result_file:
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.throughput",
+                "--single",
+                "--levels",
+                str(concurrency),
+                "--providers",
+                provider_name,
+                "--waves",
+                str(waves),
+                "--output",
+                result_file.name,
+            ],
+            check=True,
+            cwd=BENCH_DIR.parent,
+        )
+        return load_json(Path(result_file.name))
+
+
+def scenario_key(provider_name: str, concurrency: int) -> str:
+    return f"{provider_name}/{concurrency}"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="End-to-end game throughput benchmark",
+        prog="python -m benchmarks.throughput",
+    )
+    parser.add_argument("--levels", type=int, nargs="+", default=DEFAULT_LEVELS)
+    parser.add_argument(
+        "--providers", nargs="+", choices=sorted(PROVIDERS), default=sorted(PROVIDERS)
+    )
+    parser.add_argument("--waves", type=int, default=1, help="Batches per level")
+    parser.add_argument("--output", type=str, default=None, help="Result JSON path")
+    parser.add_argument(
+        "--baseline", type=str, default=None, help="Baseline JSON to compare against"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help=f"Also write {BASELINE_PATH}"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1, help="Allowed relative regression"
+    )
+    parser.add_argument(
+        "--in-process", action="store_true", help="Skip per-scenario subprocesses"
+    )
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    if args.single:
+        result = asyncio.run(run_scenario(args.levels[0], args.providers[0], args.waves))
+        write_json(Path(args.output), result)
+        return 0
+
+    scenarios: dict[str, dict[str, Any]] = {}
+    for provider_name in args.providers:
+        for concurrency in args.levels:
+            if args.in_process:
+                result = asyncio.run(run_scenario(concurrency, provider_name, args.waves))
+            else:
+                result = _run_isolated(concurrency, provider_name, args.waves)
+            scenarios[scenario_key(provider_name, concurrency)] = result
+            print(
+                f"{provider_name:>8} x{concurrency:<5} "
+                f"{result['games_per_sec']:8.2f} games/s  "
+                f"{result['calls_per_game']:5.1f} calls/game  "
+                f"{result['cpu_ms_per_call']['total']:6.3f} ms cpu/call  "
+                f"{result['peak_rss_mb']:7.1f} MiB  "
+                f"lag p99 {result['loop_lag']['p99_ms']:6.1f} ms"
+            )
+
+    report = {
+        "benchmark": "throughput",
+        "timestamp": datetime.now(UTC).isoformat(),
+        "environment": environment(),
+        "scenarios": scenarios,
+    }
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+    output = Path(args.output) if args.output else RESULTS_DIR / f"throughput-{stamp}.json"
+    write_json(output, report)
+    print(f"Results: {output}")
+    if args.save_baseline:
+        write_json(BASELINE_PATH, report)
+        print(f"Baseline: {BASELINE_PATH}")
+
+    baseline_path = Path(args.baseline) if args.baseline else BASELINE_PATH
+    if args.save_baseline or not baseline_path.exists():
+        return 0
+    rows = compare(
+        scenarios, load_json(baseline_path)["scenarios"], COMPARED_METRICS, args.tolerance
+    )
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['scenario']:>14} {row['metric']:<22} "
+            f"{row['baseline']:10.3f} -> {row['current']:10.3f} "
+            f"({row['change']:+.1%}) {flag}"
+        )
+    print(json.dumps({"regressions": sum(r["regression"] for r in rows)}))
+    return 1 if any(r["regression"] for r in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Offline analysis of stored game logs."""
@@ -0,0 +1,379 @@
+"""
+Critical-path latency analysis over stored game logs.
+
+The engine runs every LLM call sequentially and logs an event right after
+most calls, so the gap between consecutive event timestamps is the latency
+of the call that produced the later event (plus a little engine time).
+Votes are the exception: one vote_round event follows all voters, so each
+voter is charged an equal share of the gap (marked as estimated).
+
+    python -m src.analysis.latency logs/
+    python -m src.analysis.latency logs/game_*.json --json latency.json
+
+The report gives p50/p95/p99 per action type, persona and phase kind, time
+per stage of the critical path, and how much wall time running the
+independent stages concurrently would save: votes and revotes (voters do
+not see each other's ballots), Mafia round 2 (every proposal depends only
+on round 1), and the three night roles (Mafia, Doctor, Detective).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# Stages whose calls are independent of each other
+PARALLEL_STAGES = {"vote", "revote", "mafia_round_2"}
+# Night stages that could run alongside each other
+NIGHT_ROLE_STAGES = {
+    "mafia": ("mafia_round_1", "mafia_round_2"),
+    "doctor": ("doctor",),
+    "detective": ("detective",),
+}
+
+
+@dataclass
+class CallTiming:
+    """Reconstructed latency of one player action."""
+
+    game_id: str
+    phase: str
+    stage: str
+    action: str
+    player: str | None
+    persona: str | None
+    seconds: float
+    estimated: bool = False  # Equal share of a multi-call gap
+    timed_out: bool = False
+
+
+@dataclass
+class GameLatency:
+    """Latency breakdown of one game."""
+
+    game_id: str
+    wall: float
+    calls: list[CallTiming] = field(default_factory=list)
+    # (phase, stage) -> seconds; includes non-call stages such as "engine"
+    stages: dict[tuple[str, str], float] = field(default_factory=dict)
+    stage_calls: dict[tuple[str, str], int] = field(default_factory=dict)
+
+    def parallel_savings(self) -> dict[str, float]:
+        """Seconds saved per stage group if independent calls ran concurrently."""
+        savings: dict[str, float] = defaultdict(float)
+        for (phase, stage), seconds in self.stages.items():
+            calls = self.stage_calls.get((phase, stage), 0)
+            if stage in PARALLEL_STAGES and calls > 1:
+                # Upper bound: assumes the concurrent calls take equal time
+                savings[stage] += seconds * (1 - 1 / calls)
+
+        for phase in {phase for phase, _ in self.stages if phase.startswith("night_")}:
+            durations = []
+            for stages in NIGHT_ROLE_STAGES.values():
+                total = 0.0
+                for stage in stages:
+                    seconds = self.stages.get((phase, stage), 0.0)
+                    calls = self.stage_calls.get((phase, stage), 0)
+                    if stage in PARALLEL_STAGES and calls > 1:
+                        seconds /= calls
+                    total += seconds
+                durations.append(total)
+            savings["night_roles"] += sum(durations) - max(durations)
+        return dict(savings)
+
+
+def _parse_time(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _phase_kind(phase: str) -> str:
+    return phase.rstrip("0123456789").rstrip("_") or phase
+
+
+def analyze_log(log: dict[str, Any]) -> GameLatency:
+    """
+    Reconstruct call and stage latencies from one game log.
+
+    Args:
+        log: Parsed game log (schema 1.3)
+
+    Returns:
+        GameLatency for the game
+    """
+    game_id = str(log.get("game_id", "unknown"))
+    personas = {p["name"]: p.get("persona_id", p["name"]) for p in log.get("players", [])}
+    detectives = [p["name"] for p in log.get("players", []) if p.get("role") == "detective"]
+    events = log.get("events", [])
+    result = GameLatency(game_id=game_id, wall=0.0)
+    if not events:
+        return result
+
+    times = [_parse_time(event["timestamp"]) for event in events]
+    result.wall = times[-1] - times[0]
+    stages: dict[tuple[str, str], float] = defaultdict(float)
+    stage_calls: dict[tuple[str, str], int] = defaultdict(int)
+    phase = "setup"
+    pending_timeout: CallTiming | None = None
+    # Vote timeouts are logged mid-ballot; their gaps belong to the vote round
+    vote_carry = 0.0
+    timed_out_voters: set[str] = set()
+
+    def add_call(stage: str, action: str, player: str | None, seconds: float, **kw: Any) -> None:
+        call = CallTiming(
+            game_id=game_id,
+            phase=phase,
+            stage=stage,
+            action=action,
+            player=player,
+            persona=personas.get(player) if player else None,
+            seconds=seconds,
+            **kw,
+        )
+        result.calls.append(call)
+        stage_calls[(phase, stage)] += 1
+
+    for index, event in enumerate(events):
+        gap = times[index] - times[index - 1] if index else 0.0
+        data = event.get("data", {})
+        kind = event.get("type")
+        phase = str(data.get("phase") or phase)
+        speaker = data.get("speaker")
+
+        if pending_timeout is not None and kind != "timeout":
+            # The action that timed out is logged right after its timeout event
+            pending_timeout.seconds += gap
+            stages[(pending_timeout.phase, pending_timeout.stage)] += gap
+            pending_timeout = None
+            continue
+
+        if kind == "timeout" and data.get("action_type") == "vote":
+            vote_carry += gap
+            timed_out_voters.add(str(data.get("player")))
+        elif kind == "timeout":
+            action = str(data.get("action_type", "unknown"))
+            stage = _stage_for_action(action, data)
+            add_call(stage, action, data.get("player"), gap, timed_out=True)
+            pending_timeout = result.calls[-1]
+            stages[(phase, stage)] += gap
+        elif kind == "speech":
+            add_call("discussion", "speak", speaker, gap)
+            stages[(phase, "discussion")] += gap
+        elif kind == "night_zero_strategy":
+            add_call("night_zero", "speak", speaker, gap)
+            stages[(phase, "night_zero")] += gap
+        elif kind == "defense":
+            add_call("defense", "defense", speaker, gap)
+            stages[(phase, "defense")] += gap
+        elif kind == "last_words":
+            if not _follows_revote(events, index):
+                add_call("last_words", "last_words", speaker, gap)
+            stages[(phase, "last_words")] += gap
+        elif kind == "vote_round":
+            stage = "vote" if data.get("round", 1) == 1 else "revote"
+            voters = list(data.get("votes", {}))
+            gap += vote_carry
+            vote_carry = 0.0
+            # Revote gaps also include the eliminated player's last words
+            extra_last_words = stage == "revote" and data.get("outcome") == "eliminated"
+            shares = len(voters) + (1 if extra_last_words else 0)
+            share = gap / shares if shares else 0.0
+            for voter in voters:
+                timed_out = voter in timed_out_voters
+                add_call(stage, "vote", voter, share, estimated=True, timed_out=timed_out)
+            timed_out_voters.clear()
+            stages[(phase, stage)] += share * len(voters) if shares else gap
+            if extra_last_words:
+                eliminated = _next_last_words_speaker(events, index)
+                add_call("last_words", "last_words", eliminated, share, estimated=True)
+                stages[(phase, "last_words")] += share
+        elif kind == "mafia_discussion":
+            stage = f"mafia_round_{data.get('coordination_round', 1)}"
+            add_call(stage, "night_kill", speaker, gap)
+            stages[(phase, stage)] += gap
+        elif kind == "doctor_protection":
+            add_call("doctor", "doctor_protect", data.get("protector"), gap)
+            stages[(phase, "doctor")] += gap
+        elif kind == "investigation":
+            add_call("detective", "investigation", detectives[0] if detectives else None, gap)
+            stages[(phase, "detective")] += gap
+        else:
+            # phase_start, elimination, mafia_vote, night_resolution, game_end:
+            # engine bookkeeping, or calls whose event was not logged
+            stages[(phase, "engine")] += gap
+
+    result.stages = dict(stages)
+    result.stage_calls = dict(stage_calls)
+    return result
+
+
+def _stage_for_action(action: str, data: dict[str, Any]) -> str:
+    return {
+        "speak": "night_zero" if data.get("stage") == "night_zero" else "discussion",
+        "vote": "vote",
+        "defense": "defense",
+        "last_words": "last_words",
+        "night_kill": "mafia_round_1",
+        "doctor_protect": "doctor",
+        "investigation": "detective",
+    }.get(action, action)
+
+
+def _follows_revote(events: list[dict[str, Any]], index: int) -> bool:
+    previous = events[index - 1] if index else {}
+    return previous.get("type") == "vote_round" and previous.get("data", {}).get("round") == 2
+
+
+def _next_last_words_speaker(events: list[dict[str, Any]], index: int) -> str | None:
+    for event in events[index + 1 : index + 3]:
+        if event.get("type") == "last_words":
+            return event.get("data", {}).get("speaker")
+    return None
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """Count, mean and nearest-rank p50/p95/p99 of the values."""
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+    def rank(pct: float) -> float:
+        return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "p50": rank(50),
+        "p95": rank(95),
+        "p99": rank(99),
+    }
+
+
+def summarize(games: list[GameLatency]) -> dict[str, Any]:
+    """
+    Aggregate latencies across games.
+
+    Returns:
+        Dict with percentile tables, critical-path stage totals and
+        parallelization savings
+    """
+    by_action: dict[str, list[float]] = defaultdict(list)
+    by_persona: dict[str, list[float]] = defaultdict(list)
+    by_phase: dict[str, list[float]] = defaultdict(list)
+    for game in games:
+        for call in game.calls:
+            by_action[call.action].append(call.seconds)
+            by_phase[_phase_kind(call.phase)].append(call.seconds)
+            if call.persona:
+                by_persona[call.persona].append(call.seconds)
+
+    stage_totals: dict[str, float] = defaultdict(float)
+    savings: dict[str, float] = defaultdict(float)
+    for game in games:
+        for (_, stage), seconds in game.stages.items():
+            stage_totals[stage] += seconds
+        for group, seconds in game.parallel_savings().items():
+            savings[group] += seconds
+
+    wall = sum(game.wall for game in games)
+    return {
+        "games": len(games),
+        "wall_sec": wall,
+        "calls": sum(len(game.calls) for game in games),
+        "by_action": {key: percentiles(values) for key, values in sorted(by_action.items())},
+        "by_persona": {key: percentiles(values) for key, values in sorted(by_persona.items())},
+        "by_phase": {key: percentiles(values) for key, values in sorted(by_phase.items())},
+        "critical_path": {
+            stage: {"seconds": seconds, "share": seconds / wall if wall else 0.0}
+            for stage, seconds in sorted(stage_totals.items(), key=lambda item: -item[1])
+        },
+        "parallel_savings": {
+            group: {"seconds": seconds, "share": seconds / wall if wall else 0.0}
+            for group, seconds in sorted(savings.items(), key=lambda item: -item[1])
+        },
+    }
+
+
+def format_report(summary: dict[str, Any]) -> str:
+    """Plain-text report of a summary."""
+    lines = [
+        f"Games: {summary['games']}  calls: {summary['calls']}  "
+        f"wall: {summary['wall_sec']:.1f} s",
+    ]
+    for title, key in (
+        ("By action", "by_action"),
+        ("By phase", "by_phase"),
+        ("By persona", "by_persona"),
+    ):
+        lines.append("")
+        lines.append(f"{title:<24}{'calls':>7}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+        for name, row in summary[key].items():
+            lines.append(
+                f"  {name:<22}{row['count']:>7}{row['mean']:>9.2f}{row['p50']:>9.2f}"
+                f"{row['p95']:>9.2f}{row['p99']:>9.2f}"
+            )
+
+    lines.append("")
+    lines.append("Critical path (seconds, share of wall time)")
+    for stage, row in summary["critical_path"].items():
+        lines.append(f"  {stage:<22}{row['seconds']:>10.1f}{row['share']:>9.1%}")
+
+    lines.append("")
+    lines.append("Potential savings from running independent calls concurrently")
+    total = 0.0
+    for group, row in summary["parallel_savings"].items():
+        total += row["seconds"]
+        lines.append(f"  {group:<22}{row['seconds']:>10.1f}{row['share']:>9.1%}")
+    wall = summary["wall_sec"]
+    lines.append(f"  {'total':<22}{total:>10.1f}{(total / wall if wall else 0.0):>9.1%}")
+    return "\n".join(lines)
+
+
+def load_logs(paths: list[str]) -> list[dict[str, Any]]:
+    """Read game logs from files and directories (game_*.json)."""
+    files: list[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        files.extend(sorted(path.glob("game_*.json")) if path.is_dir() else [path])
+    logs = []
+    for file in files:
+        with open(file) as f:
+            logs.append(json.load(f))
+    return logs
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Critical-path latency analysis of game logs",
+        prog="python -m src.analysis.latency",
+    )
+    parser.add_argument("paths", nargs="+", help="Game log files or directories")
+    parser.add_argument("--json", type=str, default=None, help="Also write the summary here")
+    parser.add_argument("--calls", action="store_true", help="Include per-call rows in --json")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    games = [analyze_log(log) for log in load_logs(args.paths)]
+    if not games:
+        print("No game logs found")
+        return 1
+    summary = summarize(games)
+    print(format_report(summary))
+    if args.json:
+        if args.calls:
+            summary["calls_detail"] = [asdict(call) for game in games for call in game.calls]
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
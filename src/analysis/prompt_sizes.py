@@ -0,0 +1,366 @@
+"""
+Prompt-size breakdown per ContextBuilder section.
+
+Every prompt is split into its sections (identity, playbook, rules, state,
+transcript, memory, action prompt, ...) and measured in characters and
+estimated tokens. Calls are aggregated by action type and by round, which
+shows the heaviest sections and how each one grows over a game.
+
+Prompts can be recorded live (`--prompt-sizes` on the game CLI, or
+`PromptSizeRecorder.wrap` around any provider) or measured afterwards:
+
+    python -m src.analysis.prompt_sizes logs/prompts/game_*.json
+    python -m src.analysis.prompt_sizes telemetry.jsonl   # sampled generations
+    python -m src.analysis.prompt_sizes --fake 5          # replay seeded fake games
+    python -m src.analysis.prompt_sizes --fake 5 --transcript-style compact
+    python -m src.analysis.prompt_sizes --fake 5 --sessions
+    python -m src.analysis.prompt_sizes --fake 5 --retrieve-speeches 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import re
+import sys
+import tempfile
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.engine.context import TranscriptStyle, split_sections
+
+if TYPE_CHECKING:
+    from src.providers.base import PlayerProvider
+    from src.schemas import ActionType
+
+# Rough average for English prose; good enough to rank sections
+CHARS_PER_TOKEN = 4
+
+_PHASE_RE = re.compile(r"^Phase: (\S+)$", re.MULTILINE)
+_ROUND_RE = re.compile(r"^Round: (\d+)$", re.MULTILINE)
+
+
+def estimate_tokens(chars: int) -> int:
+    return math.ceil(chars / CHARS_PER_TOKEN)
+
+
+@dataclass
+class PromptSize:
+    """Size of one prompt, by section."""
+
+    action: str
+    phase: str
+    round: int
+    sections: dict[str, int] = field(default_factory=dict)  # Section name -> characters
+
+    @property
+    def chars(self) -> int:
+        return sum(self.sections.values())
+
+
+def measure_prompt(action: str, context: str, history: int = 0) -> PromptSize:
+    """
+    Split a prompt into sections and measure each one.
+
+    Args:
+        action: Action type value
+        context: Prompt text (in session mode, only the new turn)
+        history: Characters of session history sent before the prompt,
+            reported as the "history" section
+    """
+    sections = split_sections(context)
+    state = sections.get("state", "")
+    phase = _PHASE_RE.search(state)
+    round_number = _ROUND_RE.search(state)
+    sizes = {name: len(text) for name, text in sections.items()}
+    if history:
+        sizes["history"] = history
+    return PromptSize(
+        action=action,
+        phase=phase.group(1) if phase else "unknown",
+        round=int(round_number.group(1)) if round_number else 0,
+        sections=sizes,
+    )
+
+
+class _RecordedProvider:
+    """Provider wrapper that measures every prompt it is given."""
+
+    def __init__(self, provider: PlayerProvider, recorder: PromptSizeRecorder):
+        self.provider = provider
+        self.recorder = recorder
+
+    @property
+    def model(self) -> Any:
+        return getattr(self.provider, "model", "unknown")
+
+    async def act(self, action_type: ActionType, context: str, **kwargs: Any) -> dict:
+        session = kwargs.get("session")
+        self.recorder.record(action_type.value, context, session.chars if session else 0)
+        return await self.provider.act(action_type, context, **kwargs)
+
+
+class PromptSizeRecorder:
+    """Collects prompt sizes for one or more games."""
+
+    def __init__(self) -> None:
+        self.prompts: list[PromptSize] = []
+
+    def wrap(self, provider: PlayerProvider) -> PlayerProvider:
+        """Wrap a provider so every prompt sent through it is measured."""
+        return _RecordedProvider(provider, self)  # type: ignore[return-value]
+
+    def record(self, action: str, context: str, history: int = 0) -> PromptSize:
+        prompt = measure_prompt(action, context, history)
+        self.prompts.append(prompt)
+        return prompt
+
+    def summary(self) -> dict[str, Any]:
+        return summarize(self.prompts)
+
+    def write(self, path: str | Path) -> Path:
+        """
+        Write per-call sizes and the summary as JSON.
+
+        Args:
+            path: Output file (parent directories are created)
+
+        Returns:
+            The output path
+        """
+        out = Path(path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "summary": self.summary(),
+            "calls": [asdict(prompt) for prompt in self.prompts],
+        }
+        out.write_text(json.dumps(data, indent=2))
+        return out
+
+
+def _section_stats(prompts: list[PromptSize]) -> dict[str, dict[str, float]]:
+    """Mean characters and tokens per call for each section."""
+    totals: dict[str, int] = defaultdict(int)
+    for prompt in prompts:
+        for name, chars in prompt.sections.items():
+            totals[name] += chars
+    count = len(prompts) or 1
+    return {
+        name: {"chars": chars / count, "tokens": estimate_tokens(chars) / count}
+        for name, chars in sorted(totals.items(), key=lambda item: -item[1])
+    }
+
+
+def summarize(prompts: list[PromptSize]) -> dict[str, Any]:
+    """
+    Aggregate prompt sizes.
+
+    Returns:
+        Dict with totals, the heaviest sections, per-action and per-round
+        means, and the per-round growth of each section
+    """
+    total_chars = sum(prompt.chars for prompt in prompts)
+    section_totals: dict[str, int] = defaultdict(int)
+    by_action: dict[str, list[PromptSize]] = defaultdict(list)
+    by_round: dict[int, list[PromptSize]] = defaultdict(list)
+    for prompt in prompts:
+        by_action[prompt.action].append(prompt)
+        by_round[prompt.round].append(prompt)
+        for name, chars in prompt.sections.items():
+            section_totals[name] += chars
+
+    def group(items: list[PromptSize]) -> dict[str, Any]:
+        chars = sum(prompt.chars for prompt in items)
+        return {
+            "calls": len(items),
+            "mean_chars": chars / len(items),
+            "mean_tokens": estimate_tokens(chars) / len(items),
+            "sections": _section_stats(items),
+        }
+
+    rounds = {number: group(items) for number, items in sorted(by_round.items())}
+    return {
+        "calls": len(prompts),
+        "chars": total_chars,
+        "tokens": estimate_tokens(total_chars),
+        "heaviest": {
+            name: {
+                "chars": chars,
+                "tokens": estimate_tokens(chars),
+                "share": chars / total_chars if total_chars else 0.0,
+            }
+            for name, chars in sorted(section_totals.items(), key=lambda item: -item[1])
+        },
+        "by_action": {action: group(items) for action, items in sorted(by_action.items())},
+        "by_round": rounds,
+        # Section -> mean tokens per call in each round
+        "growth": {
+            name: {
+                number: row["sections"].get(name, {}).get("tokens", 0.0)
+                for number, row in rounds.items()
+            }
+            for name in section_totals
+        },
+    }
+
+
+def format_report(summary: dict[str, Any], top: int = 8) -> str:
+    """Plain-text report of a summary."""
+    lines = [
+        f"Calls: {summary['calls']}  chars: {summary['chars']:,}  "
+        f"est. tokens: {summary['tokens']:,} ({CHARS_PER_TOKEN} chars/token)",
+        "",
+        f"{'Heaviest sections':<24}{'tokens':>12}{'share':>9}",
+    ]
+    for name, row in list(summary["heaviest"].items())[:top]:
+        lines.append(f"  {name:<22}{row['tokens']:>12,}{row['share']:>9.1%}")
+
+    names = list(summary["heaviest"])[:top]
+    header = "".join(f"{name[:11]:>12}" for name in names)
+
+    lines.append("")
+    lines.append(f"{'Mean tokens by action':<24}{'calls':>7}{'total':>9}{header}")
+    for action, row in summary["by_action"].items():
+        cells = "".join(
+            f"{row['sections'].get(name, {}).get('tokens', 0.0):>12.0f}" for name in names
+        )
+        lines.append(f"  {action:<22}{row['calls']:>7}{row['mean_tokens']:>9.0f}{cells}")
+
+    lines.append("")
+    lines.append(f"{'Mean tokens by round':<24}{'calls':>7}{'total':>9}{header}")
+    for number, row in summary["by_round"].items():
+        cells = "".join(
+            f"{summary['growth'][name].get(number, 0.0):>12.0f}" for name in names
+        )
+        lines.append(f"  {number!s:<22}{row['calls']:>7}{row['mean_tokens']:>9.0f}{cells}")
+    return "\n".join(lines)
+
+
+def load_prompts(paths: list[str]) -> list[PromptSize]:
+    """
+    Read prompt sizes from recorder output or telemetry files.
+
+    Args:
+        paths: Prompt-size files written by PromptSizeRecorder, or
+            telemetry JSONL files (generation events carry the full prompt)
+    """
+    prompts: list[PromptSize] = []
+    for raw in paths:
+        path = Path(raw)
+        if path.suffix == ".jsonl":
+            with open(path) as f:
+                for line in f:
+                    event = json.loads(line)
+                    if event.get("type") == "generation" and event.get("input"):
+                        prompts.append(
+                            measure_prompt(event.get("action") or "unknown", event["input"])
+                        )
+        else:
+            with open(path) as f:
+                data = json.load(f)
+            prompts.extend(PromptSize(**call) for call in data["calls"])
+    return prompts
+
+
+async def record_fake_games(
+    games: int,
+    seed: int = 0,
+    transcript_style: TranscriptStyle = TranscriptStyle.FULL,
+    sessions: bool = False,
+    retrieved_speeches: int = 0,
+) -> list[PromptSize]:
+    """
+    Measure the prompts of seeded FakeProvider games (no API calls).
+
+    The fake provider picks its answers from the valid options in the action
+    prompt, so the same seeds replay the same games under either transcript
+    style and their sizes can be compared call for call.
+    """
+    from src.engine.game import GameConfig, GameRunner
+    from src.personas.initial import get_personas
+    from src.providers.fake import FakeProvider
+
+    recorder = PromptSizeRecorder()
+    personas = get_personas()
+    with tempfile.TemporaryDirectory() as output_dir:
+        for game_seed in range(seed, seed + games):
+            config = GameConfig(
+                player_names=list(personas),
+                personas=personas,
+                provider=recorder.wrap(FakeProvider(seed=game_seed)),
+                output_dir=output_dir,
+                seed=game_seed,
+                transcript_style=transcript_style,
+                sessions=sessions,
+                retrieved_speeches=retrieved_speeches,
+            )
+            await GameRunner(config).run()
+    return recorder.prompts
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Prompt-size breakdown per context section",
+        prog="python -m src.analysis.prompt_sizes",
+    )
+    parser.add_argument(
+        "paths", nargs="*", help="Recorded prompt-size files or telemetry .jsonl files"
+    )
+    parser.add_argument(
+        "--fake", type=int, default=0, help="Also measure this many seeded fake games"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="First seed for --fake")
+    parser.add_argument(
+        "--transcript-style",
+        choices=[style.value for style in TranscriptStyle],
+        default=TranscriptStyle.FULL.value,
+        help="Transcript renderer for --fake games",
+    )
+    parser.add_argument(
+        "--sessions",
+        action="store_true",
+        help="Run --fake games in session mode (history reported as its own section)",
+    )
+    parser.add_argument(
+        "--retrieve-speeches",
+        type=int,
+        default=0,
+        metavar="K",
+        help="Run --fake games with K retrieved past speeches instead of whole rounds",
+    )
+    parser.add_argument("--json", type=str, default=None, help="Also write the summary here")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    prompts = load_prompts(args.paths)
+    if args.fake:
+        prompts.extend(
+            asyncio.run(
+                record_fake_games(
+                    args.fake,
+                    args.seed,
+                    TranscriptStyle(args.transcript_style),
+                    args.sessions,
+                    args.retrieve_speeches,
+                )
+            )
+        )
+    if not prompts:
+        print("No prompts found")
+        return 1
+    summary = summarize(prompts)
+    print(format_report(summary))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
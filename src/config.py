@@ -25,12 +25,46 @@ class Settings(BaseSettings):
     anthropic_api_key: str = ""
     gemini_api_key: str = ""
     model_name: str = "gemini-3-flash-preview"
+    # API endpoint overrides, e.g. the local fake server (src.providers.fake_server)
+    anthropic_base_url: str = ""
+    gemini_base_url: str = ""
+    routing_file: str = ""  # JSON RoutingPolicy (per-action model/thinking/timeout)
 
     # Langfuse observability (optional)
     langfuse_public_key: str = ""
     langfuse_secret_key: str = ""
     langfuse_host: str = "https://cloud.langfuse.com"
     langfuse_base_url: str = ""
+    # Telemetry export (background, batched); Langfuse is used when keys are set
+    telemetry_sample_rate: float = 0.05  # Share of games traced fully
+    telemetry_file: str = ""  # Also append telemetry events to this JSONL file
+
+    # Request shaping (opt-in)
+    hedge_requests: bool = False
+    hedge_percentile: float = 0.95
+    rate_limit_rps: float = 0.0  # 0 disables the shared limiter
+
+    # Fail over to Anthropic when the primary provider's circuit opens (opt-in)
+    failover: bool = False
+    fallback_model_name: str = "claude-haiku-4-5-20251001"
+
+    # Runtime monitor (loop lag, in-flight calls, stalls); off unless one is set
+    monitor_port: int = 0  # Serve JSON snapshots on this local port
+    monitor_file: str = ""  # Periodically rewrite this file with a snapshot
+    monitor_stall_ms: float = 250.0
+    metrics_port: int = 0  # Serve Prometheus metrics on this local port (0 = off)
+
+    # Game wall-clock budget in seconds (0 = unlimited)
+    max_game_seconds: float = 0.0
+
+    # Transcript rendering in prompts: "full" or "compact" (seat aliases)
+    transcript_style: str = "full"
+    # Keep per-player message histories (session mode) instead of full rebuilds
+    player_sessions: bool = False
+    # LLM-summarize finished rounds in the background for the compressed window
+    summarize_rounds: bool = False
+    # Past speeches retrieved by relevance per prompt (0 = send whole rounds)
+    retrieved_speeches: int = 0
 
     # Retry settings
     max_retries: int = 3
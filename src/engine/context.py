@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 import json
+import re
+from collections import Counter
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from src.engine.prompts import (
@@ -28,7 +33,146 @@ from src.schemas import (
 )
 
 if TYPE_CHECKING:
-    pass
+    from src.engine.retrieval import SpeechIndex
+
+# Header that opens each ContextBuilder section -> section name, in build order
+SECTION_HEADERS: dict[str, str] = {
+    "[YOUR IDENTITY]": "identity",
+    "[ROLE PLAYBOOK]": "playbook",
+    "[GAME RULES]": "rules",
+    "[MAFIA INFO]": "role_info",
+    "[PARTNER STRATEGIES]": "coordination",
+    "[COORDINATION ROUND": "coordination",
+    "[CURRENT STATE]": "state",
+    "[SPEAKING ORDER]": "speaking_order",
+    "[DEFENSE CONTEXT]": "defense",
+    "[TRANSCRIPT]": "transcript",
+    "[RELEVANT PAST SPEECHES]": "retrieved",
+    "[YOUR MEMORY]": "memory",
+    "[YOUR TASK": "action",
+}
+
+
+class TranscriptStyle(StrEnum):
+    """How the [TRANSCRIPT] section is rendered."""
+
+    FULL = "full"  # Full names on every line
+    COMPACT = "compact"  # Seat aliases, grouped nominations and votes
+
+
+def split_sections(context: str) -> dict[str, str]:
+    """
+    Split an assembled context back into its named sections.
+
+    Works on any string built by ContextBuilder.build_context, so prompts
+    recorded elsewhere (telemetry files) can be measured too. Text before
+    the first known header is returned under "other".
+
+    Args:
+        context: Context string from build_context
+
+    Returns:
+        Section name -> section text, in prompt order
+    """
+    sections: dict[str, list[str]] = {}
+    current = "other"
+    for chunk in context.split("\n\n"):
+        for header, name in SECTION_HEADERS.items():
+            if chunk.startswith(header):
+                current = name
+                break
+        sections.setdefault(current, []).append(chunk)
+    return {name: "\n\n".join(chunks) for name, chunks in sections.items()}
+
+
+def render_identity(name: str, role: str, persona: Persona) -> str:
+    """Render the [YOUR IDENTITY] section: persona, voice and role tactics."""
+    lines = [
+        "[YOUR IDENTITY]",
+        f"You are {name}. Your role is {role.upper()}.",
+        "",
+        f"Persona: {persona.identity.name}",
+        f"Background: {persona.identity.background}",
+        f"Core traits: {', '.join(persona.identity.core_traits)}",
+        "",
+        f"Voice: {persona.play_style.voice}",
+        f"Approach: {persona.play_style.approach}",
+    ]
+
+    if persona.play_style.signature_phrases:
+        lines.append(f"Signature phrases: {', '.join(persona.play_style.signature_phrases)}")
+
+    if persona.play_style.signature_moves:
+        lines.append(f"Signature moves: {', '.join(persona.play_style.signature_moves)}")
+
+    tactics: list[str] | None = None
+    if role == "town":
+        tactics = persona.tactics.town
+    elif role == "mafia":
+        tactics = persona.tactics.mafia
+    elif role == "detective":
+        tactics = persona.tactics.detective
+    elif role == "doctor":
+        tactics = persona.tactics.doctor
+
+    if tactics:
+        lines.append("")
+        lines.append("Role tactics:")
+        lines.extend([f"- {item}" for item in tactics])
+
+    return "\n".join(lines)
+
+
+def _join_sections(*sections: str | None) -> str:
+    return "\n\n".join(filter(None, sections))
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """
+    Prompt blocks that depend only on (player name, persona, role).
+
+    `prefix` (identity, role playbook, rules) opens every full context and
+    every session system prompt; it is byte-identical across calls and
+    games, so providers can cache it as a prompt prefix.
+    """
+
+    identity: str
+    playbook: str | None
+    rules: str
+    prefix: str
+
+
+def compile_prompt(name: str, role: str, persona: Persona) -> CompiledPrompt:
+    """
+    Render a player's static prompt blocks once.
+
+    Results are cached by value: agents with the same name, role and
+    persona (in this game or any later one) share one CompiledPrompt.
+
+    Args:
+        name: Player name
+        role: Player role
+        persona: Player persona
+
+    Returns:
+        The compiled blocks
+    """
+    return _compile_prompt(name, role, persona.model_dump_json())
+
+
+@lru_cache(maxsize=256)
+def _compile_prompt(name: str, role: str, persona_json: str) -> CompiledPrompt:
+    persona = Persona.model_validate_json(persona_json)
+    identity = render_identity(name, role, persona)
+    playbook = build_role_playbook(role)
+    rules = f"[GAME RULES]\n{RULES_SUMMARY}"
+    return CompiledPrompt(
+        identity=identity,
+        playbook=playbook,
+        rules=rules,
+        prefix=_join_sections(identity, playbook, rules),
+    )
 
 
 class ContextBuilder:
@@ -46,6 +190,29 @@ class ContextBuilder:
     - Action-specific prompt
     """
 
+    def __init__(
+        self,
+        transcript_style: TranscriptStyle = TranscriptStyle.FULL,
+        seats: dict[str, int] | None = None,
+        speech_index: SpeechIndex | None = None,
+        retrieved_speeches: int = 0,
+    ):
+        """
+        Initialize context builder.
+
+        Args:
+            transcript_style: Renderer for the transcript section
+            seats: Player name -> seat number, used as aliases by the
+                compact transcript (default: alphabetical order)
+            speech_index: Index of past speeches to retrieve from
+            retrieved_speeches: Past speeches added per prompt, picked by
+                relevance to the player, nominees and suspects (0 = off)
+        """
+        self.transcript_style = TranscriptStyle(transcript_style)
+        self.seats = seats
+        self.speech_index = speech_index
+        self.retrieved_speeches = retrieved_speeches
+
     def build_context(
         self,
         player_name: str,
@@ -56,6 +223,7 @@ class ContextBuilder:
         memory: PlayerMemory,
         action_type: ActionType,
         extra: dict | None = None,
+        compiled: CompiledPrompt | None = None,
     ) -> str:
         """
         Assemble full context string for LLM.
@@ -69,66 +237,110 @@ class ContextBuilder:
             memory: Player's memory state
             action_type: Type of action to take
             extra: Role-specific or action-specific info (partners, defense context)
+            compiled: The player's compiled static blocks (rendered here if omitted)
 
         Returns:
             Complete context string for LLM system prompt
         """
         sections = [
-            self._build_identity_section(player_name, role, persona),
+            compiled.prefix if compiled else self._build_prefix(player_name, role, persona),
             self._build_role_specific_section(role, extra),
             self._build_mafia_coordination_section(extra),
-            self._build_role_playbook_section(role),
-            self._build_rules_section(),
             self._build_game_state_section(game_state),
             self._build_speaking_order_section(action_type, extra),
             self._build_defense_context_section(action_type, extra),
-            self._build_transcript_section(transcript),
+            self._build_transcript_section(transcript, game_state),
+            self._build_retrieved_section(player_name, game_state, transcript, memory),
             self._build_memory_section(memory),
             self._build_action_prompt(action_type, game_state, player_name, role, extra),
         ]
 
         return "\n\n".join(filter(None, sections))
 
-    def _build_identity_section(
-        self, name: str, role: str, persona: Persona
+    def build_system_prompt(
+        self,
+        player_name: str,
+        role: str,
+        persona: Persona,
+        extra: dict | None = None,
+        compiled: CompiledPrompt | None = None,
     ) -> str:
-        """Build identity section of context."""
-        lines = [
-            "[YOUR IDENTITY]",
-            f"You are {name}. Your role is {role.upper()}.",
-            "",
-            f"Persona: {persona.identity.name}",
-            f"Background: {persona.identity.background}",
-            f"Core traits: {', '.join(persona.identity.core_traits)}",
-            "",
-            f"Voice: {persona.play_style.voice}",
-            f"Approach: {persona.play_style.approach}",
-        ]
+        """
+        Assemble the static part of a player's context (session mode).
 
-        if persona.play_style.signature_phrases:
-            lines.append(
-                f"Signature phrases: {', '.join(persona.play_style.signature_phrases)}"
-            )
+        Args:
+            player_name: Name of the player
+            role: Player's role
+            persona: Player's persona definition
+            extra: Role-specific info (Mafia partners)
+            compiled: The player's compiled static blocks (rendered here if omitted)
 
-        if persona.play_style.signature_moves:
-            lines.append(f"Signature moves: {', '.join(persona.play_style.signature_moves)}")
+        Returns:
+            Identity, playbook, rules and role info, sent once per session
+        """
+        return _join_sections(
+            compiled.prefix if compiled else self._build_prefix(player_name, role, persona),
+            self._build_role_specific_section(role, extra),
+        )
 
-        tactics: list[str] | None = None
-        if role == "town":
-            tactics = persona.tactics.town
-        elif role == "mafia":
-            tactics = persona.tactics.mafia
-        elif role == "detective":
-            tactics = persona.tactics.detective
-        elif role == "doctor":
-            tactics = persona.tactics.doctor
+    def build_turn(
+        self,
+        player_name: str,
+        role: str,
+        game_state: GameState,
+        transcript: Transcript,
+        memory: PlayerMemory,
+        action_type: ActionType,
+        extra: dict | None = None,
+        seen: dict[int, list[str]] | None = None,
+    ) -> tuple[str, dict[int, list[str]]]:
+        """
+        Assemble one session turn: what changed since the player's last turn.
 
-        if tactics:
-            lines.append("")
-            lines.append("Role tactics:")
-            lines.extend([f"- {item}" for item in tactics])
+        The transcript is reduced to lines not in `seen`; state, memory and
+        the action prompt are restated every turn since they are small.
 
-        return "\n".join(lines)
+        Args:
+            player_name: Name of the player
+            role: Player's role
+            game_state: Current game state
+            transcript: Game transcript (may be compressed)
+            memory: Player's memory state
+            action_type: Type of action to take
+            extra: Role-specific or action-specific info
+            seen: Transcript lines the session has already been sent
+
+        Returns:
+            (user message for this turn, transcript lines sent including it)
+        """
+        transcript_section, updated = self._build_transcript_delta_section(
+            transcript, game_state, seen or {}
+        )
+        sections = [
+            self._build_mafia_coordination_section(extra),
+            self._build_game_state_section(game_state),
+            self._build_speaking_order_section(action_type, extra),
+            self._build_defense_context_section(action_type, extra),
+            transcript_section,
+            self._build_retrieved_section(player_name, game_state, transcript, memory),
+            self._build_memory_section(memory),
+            self._build_action_prompt(action_type, game_state, player_name, role, extra),
+        ]
+        return "\n\n".join(filter(None, sections)), updated
+
+    def _build_identity_section(
+        self, name: str, role: str, persona: Persona
+    ) -> str:
+        """Build identity section of context."""
+        return render_identity(name, role, persona)
+
+    def _build_prefix(self, name: str, role: str, persona: Persona) -> str:
+        """Identity, playbook and rules (what CompiledPrompt.prefix caches)."""
+        return _join_sections(
+            self._build_identity_section(name, role, persona),
+            self._build_role_playbook_section(role),
+            self._build_rules_section(),
+        )
 
     def _build_rules_section(self) -> str:
         """Build rules section of context."""
@@ -287,61 +499,275 @@ Nominated for vote: {nominated_str}"""
 
         return "\n".join(lines)
 
-    def _build_transcript_section(self, transcript: Transcript) -> str:
+    def render_transcript(self, transcript: Transcript, state: GameState | None = None) -> str:
+        """Render transcript rounds as they appear in the [TRANSCRIPT] section."""
+        return self._build_transcript_section(transcript, state)
+
+    def _build_transcript_section(
+        self, transcript: Transcript, state: GameState | None = None
+    ) -> str:
         """Build transcript section of context."""
         if not transcript:
             return "[TRANSCRIPT]\nNo previous discussion."
 
         lines = ["[TRANSCRIPT]"]
+        aliases = None
+        if self.transcript_style == TranscriptStyle.COMPACT:
+            aliases = self._seat_aliases(state)
+            lines.append(self._seat_legend(aliases))
+
+        for item in transcript:
+            lines.extend(self._round_lines(item, aliases))
+
+        return "\n".join(lines)
 
+    def _build_transcript_delta_section(
+        self,
+        transcript: Transcript,
+        state: GameState,
+        seen: dict[int, list[str]],
+    ) -> tuple[str | None, dict[int, list[str]]]:
+        """
+        Build the transcript lines a session has not been sent yet.
+
+        Args:
+            transcript: Current transcript window
+            state: Current game state (for seat aliases)
+            seen: Lines already sent, per round number
+
+        Returns:
+            (section text or None if nothing is new, updated seen lines)
+        """
+        aliases = None
+        if self.transcript_style == TranscriptStyle.COMPACT:
+            aliases = self._seat_aliases(state)
+
+        updated = dict(seen)
+        lines: list[str] = []
         for item in transcript:
-            if isinstance(item, CompressedRoundSummary):
-                lines.append(f"\n--- Day {item.round_number} (summary) ---")
-                if item.night_death:
-                    lines.append(f"Night kill: {item.night_death}")
-                if item.vote_death:
-                    lines.append(f"Vote elimination: {item.vote_death}")
-                if item.vote_line:
-                    lines.append(f"Votes: {item.vote_line}")
-                if item.defense_note:
-                    lines.append(item.defense_note)
-                lines.append(f"Vote result: {item.vote_result}")
-            elif isinstance(item, DayRoundTranscript):
-                lines.append(f"\n--- Day {item.round_number} (full) ---")
-                if item.night_kill:
-                    lines.append(f"Night kill: {item.night_kill}")
+            round_lines = self._round_lines(item, aliases)
+            sent = seen.get(item.round_number)
+            if sent is None:
+                lines.extend(round_lines)
+            elif isinstance(item, CompressedRoundSummary):
+                # Already sent in full; only the LLM summary can be new
+                summary = [line for line in round_lines if line.startswith("Summary: ")]
+                if summary and summary[0] not in sent:
+                    lines.append(f"\n--- Day {item.round_number} (summary) ---")
+                    lines.extend(summary)
+                    updated[item.round_number] = [*sent, *summary]
+                continue
+            else:
+                lines.extend(self._new_round_lines(item.round_number, sent, round_lines))
+            updated[item.round_number] = round_lines
+
+        if not lines:
+            return None, updated
+        header = ["[TRANSCRIPT]"]
+        if aliases is not None and not seen:
+            header.append(self._seat_legend(aliases))
+        return "\n".join(header + lines), updated
+
+    @staticmethod
+    def _new_round_lines(round_number: int, sent: list[str], round_lines: list[str]) -> list[str]:
+        """Lines of a round not yet sent, under a "(new)" header (empty if none)."""
+        if round_lines[: len(sent)] == sent:
+            new = round_lines[len(sent) :]
+        else:
+            # Compact rounds rewrite their grouped lines, so diff by content;
+            # counting keeps repeated lines such as two identical nominations
+            remaining = Counter(sent)
+            new = []
+            for line in round_lines:
+                if remaining[line] > 0:
+                    remaining[line] -= 1
                 else:
-                    lines.append("No night kill")
-
-                for speech in item.speeches:
-                    lines.append(f"\n{speech.speaker}: \"{speech.text}\"")
-                    lines.append(f"  Nominated: {speech.nomination}")
-
-                if item.votes:
-                    vote_summary = ", ".join(
-                        f"{voter}->{target}" for voter, target in item.votes.items()
-                    )
-                    lines.append(f"\nVotes: {vote_summary}")
-                    lines.append(f"Outcome: {item.vote_outcome}")
-
-                if item.defense_speeches:
-                    lines.append("\nDefense speeches:")
-                    for defense in item.defense_speeches:
-                        lines.append(f"  {defense.speaker}: \"{defense.text}\"")
-
-                if item.revote:
-                    revote_summary = ", ".join(
-                        f"{voter}->{target}" for voter, target in item.revote.items()
-                    )
-                    lines.append(f"Revote: {revote_summary}")
-                    lines.append(f"Final outcome: {item.revote_outcome}")
-
-                # Last words only for day eliminations (voted out players)
-                if item.last_words:
-                    lines.append(f"Last words: \"{item.last_words}\"")
+                    new.append(line)
+        if not new:
+            return []
+        return [f"\n--- Day {round_number} (new) ---", *new]
 
+    def _build_retrieved_section(
+        self,
+        player_name: str,
+        state: GameState,
+        transcript: Transcript,
+        memory: PlayerMemory,
+    ) -> str | None:
+        """
+        Build the past speeches most relevant to this decision.
+
+        The query is the player's own name, the current nominees and the
+        players named in the player's suspicions; rounds already shown in
+        full are skipped.
+        """
+        if self.speech_index is None or self.retrieved_speeches <= 0:
+            return None
+
+        players = state.living_players + state.dead_players
+        suspicions = str(memory.beliefs.get("suspicions", ""))
+        suspects = [name for name in players if name in suspicions]
+        query = " ".join([player_name, *state.nominated_players, *suspects])
+        shown = {item.round_number for item in transcript if isinstance(item, DayRoundTranscript)}
+        results = self.speech_index.search(query, self.retrieved_speeches, exclude_rounds=shown)
+        if not results:
+            return None
+
+        aliases = None
+        if self.transcript_style == TranscriptStyle.COMPACT:
+            aliases = self._seat_aliases(state)
+        labels = {"defense": " (defense)", "last_words": " (last words)"}
+        lines = ["[RELEVANT PAST SPEECHES]"]
+        for _, speech in sorted(results, key=lambda item: item[1].round_number):
+            speaker = aliases.get(speech.speaker, speech.speaker) if aliases else speech.speaker
+            line = f"Day {speech.round_number} {speaker}{labels.get(speech.kind, '')}: "
+            line += f"\"{speech.text}\""
+            if speech.nomination:
+                nominee = speech.nomination
+                if aliases:
+                    nominee = aliases.get(nominee, nominee)
+                line += f" Nominated: {nominee}"
+            lines.append(line)
         return "\n".join(lines)
 
+    def _seat_aliases(self, state: GameState | None) -> dict[str, str]:
+        """Player name -> "#seat" alias for the compact transcript."""
+        seats = self.seats
+        if seats is None:
+            names = sorted((state.living_players + state.dead_players) if state else [])
+            seats = {name: seat for seat, name in enumerate(names)}
+        return {
+            name: f"#{seat}" for name, seat in sorted(seats.items(), key=lambda item: item[1])
+        }
+
+    def _seat_legend(self, aliases: dict[str, str]) -> str:
+        return "Seats: " + ", ".join(f"{alias} {name}" for name, alias in aliases.items())
+
+    def _round_lines(
+        self,
+        item: DayRoundTranscript | CompressedRoundSummary,
+        aliases: dict[str, str] | None = None,
+    ) -> list[str]:
+        """Render one transcript round (compact when aliases are given)."""
+        if aliases is not None:
+            return self._compact_round_lines(item, aliases)
+
+        lines: list[str] = []
+        if isinstance(item, CompressedRoundSummary):
+            lines.append(f"\n--- Day {item.round_number} (summary) ---")
+            if item.night_death:
+                lines.append(f"Night kill: {item.night_death}")
+            if item.vote_death:
+                lines.append(f"Vote elimination: {item.vote_death}")
+            if item.vote_line:
+                lines.append(f"Votes: {item.vote_line}")
+            if item.defense_note:
+                lines.append(item.defense_note)
+            lines.append(f"Vote result: {item.vote_result}")
+            if item.summary:
+                lines.append(f"Summary: {item.summary}")
+            return lines
+
+        lines.append(f"\n--- Day {item.round_number} (full) ---")
+        if item.night_kill:
+            lines.append(f"Night kill: {item.night_kill}")
+        else:
+            lines.append("No night kill")
+
+        for speech in item.speeches:
+            lines.append(f"\n{speech.speaker}: \"{speech.text}\"")
+            lines.append(f"  Nominated: {speech.nomination}")
+
+        if item.votes:
+            vote_summary = ", ".join(
+                f"{voter}->{target}" for voter, target in item.votes.items()
+            )
+            lines.append(f"\nVotes: {vote_summary}")
+            lines.append(f"Outcome: {item.vote_outcome}")
+
+        if item.defense_speeches:
+            lines.append("\nDefense speeches:")
+            for defense in item.defense_speeches:
+                lines.append(f"  {defense.speaker}: \"{defense.text}\"")
+
+        if item.revote:
+            revote_summary = ", ".join(
+                f"{voter}->{target}" for voter, target in item.revote.items()
+            )
+            lines.append(f"Revote: {revote_summary}")
+            lines.append(f"Final outcome: {item.revote_outcome}")
+
+        # Last words only for day eliminations (voted out players)
+        if item.last_words:
+            lines.append(f"Last words: \"{item.last_words}\"")
+
+        return lines
+
+    def _compact_round_lines(
+        self,
+        item: DayRoundTranscript | CompressedRoundSummary,
+        aliases: dict[str, str],
+    ) -> list[str]:
+        """
+        Render one round with seat aliases.
+
+        Players are referred to as #seat (introduced once by the "Seats:"
+        legend); nominations and votes are grouped by target.
+        """
+
+        def alias(name: str | None) -> str:
+            return aliases.get(name, name) if name else "none"
+
+        def outcome(value: str) -> str:
+            if value.startswith("eliminated:"):
+                return f"eliminated {alias(value.split(':', 1)[1])}"
+            return value
+
+        def grouped(pairs: dict[str, str]) -> str:
+            by_target: dict[str, list[str]] = {}
+            for voter, target in pairs.items():
+                by_target.setdefault(target, []).append(alias(voter))
+            return " | ".join(
+                f"{alias(target)} <- {' '.join(voters)} ({len(voters)})"
+                for target, voters in sorted(by_target.items(), key=lambda item: -len(item[1]))
+            )
+
+        lines: list[str] = []
+        if isinstance(item, CompressedRoundSummary):
+            lines.append(f"\n--- Day {item.round_number} (summary) ---")
+            if item.night_death:
+                lines.append(f"Night kill: {alias(item.night_death)}")
+            if item.vote_death:
+                lines.append(f"Vote elimination: {alias(item.vote_death)}")
+            if item.vote_line:
+                lines.append(f"Votes: {_replace_names(item.vote_line, aliases)}")
+            if item.defense_note:
+                lines.append(item.defense_note)
+            lines.append(f"Vote result: {outcome(item.vote_result)}")
+            if item.summary:
+                lines.append(f"Summary: {_replace_names(item.summary, aliases)}")
+            return lines
+
+        lines.append(f"\n--- Day {item.round_number} (full) ---")
+        lines.append(f"Night kill: {alias(item.night_kill)}")
+        for speech in item.speeches:
+            lines.append(f"{alias(speech.speaker)}: \"{speech.text}\"")
+        nominations = {speech.speaker: speech.nomination for speech in item.speeches}
+        if nominations:
+            lines.append(f"Nominations: {grouped(nominations)}")
+        if item.votes:
+            lines.append(f"Votes: {grouped(item.votes)}")
+            lines.append(f"Outcome: {outcome(item.vote_outcome)}")
+        if item.defense_speeches:
+            for defense in item.defense_speeches:
+                lines.append(f"Defense {alias(defense.speaker)}: \"{defense.text}\"")
+        if item.revote:
+            lines.append(f"Revote: {grouped(item.revote)}")
+            lines.append(f"Final outcome: {outcome(item.revote_outcome or '')}")
+        if item.last_words:
+            lines.append(f"Last words: \"{item.last_words}\"")
+        return lines
+
     def _build_memory_section(self, memory: PlayerMemory) -> str:
         """Build memory section of context."""
         facts = memory.facts or {}
@@ -353,7 +779,7 @@ Nominated for vote: {nominated_str}"""
                 f"- {line}" for line in summary_lines
             )
         elif facts:
-            summary_block = "Facts (raw):\n" + json.dumps(facts, indent=2)
+            summary_block = "Facts (raw):\n" + json.dumps(facts, indent=2, default=list)
 
         return f"""[YOUR MEMORY]
 {summary_block}
@@ -518,3 +944,14 @@ Your current beliefs:
         if action_type == ActionType.DEFENSE:
             return DEFENSE_PROMPT
         return "[YOUR TASK]\nTake your action."
+
+
+def _replace_names(text: str, aliases: dict[str, str]) -> str:
+    """Replace whole player names in pre-rendered text with their aliases."""
+    if not aliases:
+        return text
+    # Longest first so a name containing another name wins
+    pattern = re.compile(
+        "|".join(re.escape(name) for name in sorted(aliases, key=len, reverse=True))
+    )
+    return pattern.sub(lambda match: aliases[match.group(0)], text)
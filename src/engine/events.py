@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import bisect
 import logging
-from typing import Callable
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import UTC, datetime
 
 from src.schemas import Event
 
@@ -16,6 +18,12 @@ class EventLog:
     During gameplay, events are collected for logs and viewer replay but are not
     used to build player context. After game ends, the full event log is saved
     to JSON with private reasoning for entertainment value.
+
+    The log is append-only and an event's index in `events` is its sequence
+    number. Events are indexed by type and phase as they are added, and the
+    public view is projected once per event and cached, so catching up on
+    `k` new events or querying one type costs O(k), not O(total events).
+    Events must be added through `add` for the indexes to stay in sync.
     """
 
     def __init__(self, game_id: str | None = None):
@@ -25,6 +33,21 @@ class EventLog:
         self.game_id = game_id or str(uuid.uuid4())
         self.events: list[Event] = []
         self._observers: list[Callable[[Event], None]] = []
+        self._by_type: dict[str, list[Event]] = defaultdict(list)
+        self._by_phase: dict[str, list[Event]] = defaultdict(list)
+        # Public projection: events[:_projected] have been filtered into
+        # _public, with _public_seq holding each public event's sequence number
+        self._public: list[Event] = []
+        self._public_seq: list[int] = []
+        self._projected = 0
+        # Wall-clock timestamps can step backwards; bisect only while ordered
+        self._last_time: datetime | None = None
+        self._ordered = True
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next event will get (= number of events)."""
+        return len(self.events)
 
     def add(
         self,
@@ -64,13 +87,21 @@ class EventLog:
         if state_after is not None:
             payload["state_after"] = state_after
 
+        now = datetime.now(UTC)
         event = Event(
             type=event_type,
-            timestamp=datetime.now(UTC).isoformat(),
+            timestamp=now.isoformat(),
             data=payload,
             private_fields=private_fields or [],
         )
         self.events.append(event)
+        self._by_type[event_type].append(event)
+        event_phase = payload.get("phase")
+        if isinstance(event_phase, str):
+            self._by_phase[event_phase].append(event)
+        if self._last_time is not None and now < self._last_time:
+            self._ordered = False
+        self._last_time = now
         if self._observers:
             logger = logging.getLogger(__name__)
             for observer in list(self._observers):
@@ -88,20 +119,28 @@ class EventLog:
         """
         Get events with private fields filtered out.
 
+        Public events are projected once and shared between calls; callers
+        must not modify them.
+
         Args:
-            since_index: Start from this event index
+            since_index: Start from this event index (sequence number)
 
         Returns:
             List of events with private data removed
         """
-        public_events = []
-        for event in self.events[since_index:]:
-            if event.private_fields and set(event.private_fields) >= set(event.data.keys()):
+        self._extend_public_view()
+        start = bisect.bisect_left(self._public_seq, since_index)
+        return self._public[start:]
+
+    def _extend_public_view(self) -> None:
+        """Project events added since the last public view."""
+        for seq in range(self._projected, len(self.events)):
+            event = self.events[seq]
+            private = set(event.private_fields)
+            if private and private >= event.data.keys():
                 continue
-            public_data = {
-                k: v for k, v in event.data.items() if k not in event.private_fields
-            }
-            public_events.append(
+            public_data = {k: v for k, v in event.data.items() if k not in private}
+            self._public.append(
                 Event(
                     type=event.type,
                     timestamp=event.timestamp,
@@ -109,7 +148,8 @@ class EventLog:
                     private_fields=[],
                 )
             )
-        return public_events
+            self._public_seq.append(seq)
+        self._projected = len(self.events)
 
     def get_full_view(self) -> list[Event]:
         """
@@ -131,6 +171,12 @@ class EventLog:
             else since_timestamp
         )
         since_dt = datetime.fromisoformat(normalized)
+        if self._ordered:
+            # Parses O(log n) timestamps instead of all of them
+            start = bisect.bisect_right(
+                self.events, since_dt, key=lambda e: datetime.fromisoformat(e.timestamp)
+            )
+            return self.events[start:]
         return [
             event
             for event in self.events
@@ -139,7 +185,11 @@ class EventLog:
 
     def get_events_of_type(self, event_type: str) -> list[Event]:
         """Get all events of a specific type."""
-        return [e for e in self.events if e.type == event_type]
+        return list(self._by_type.get(event_type, ()))
+
+    def get_events_of_phase(self, phase: str) -> list[Event]:
+        """Get all events logged with a phase (e.g. "day_1", "night_2")."""
+        return list(self._by_phase.get(phase, ()))
 
     def get_last_event(self) -> Event | None:
         """Get the most recent event."""
@@ -147,7 +197,7 @@ class EventLog:
 
     def get_all_events(self) -> list[dict]:
         """Get all events as dicts for serialization."""
-        return [e.model_dump() for e in self.events]
+        return [e.to_dict() for e in self.events]
 
     # =========================================================================
     # Convenience methods for common event types
@@ -544,6 +594,52 @@ class EventLog:
             state_public=state_public,
         )
 
+    def add_timeout(
+        self,
+        player: str,
+        action_type: str,
+        reason: str,
+        deadline: float,
+        *,
+        phase: str | None = None,
+        round_number: int | None = None,
+        stage: str | None = None,
+    ) -> Event:
+        """
+        Log an action that ran out of time and fell back to the default.
+
+        Fully private: the action type would reveal night roles.
+
+        Args:
+            player: Player whose action timed out
+            action_type: Action that timed out
+            reason: "action_deadline" or "game_deadline"
+            deadline: Seconds the action was allowed
+        """
+        if stage is None:
+            stage = "timeout"
+        return self.add(
+            "timeout",
+            {
+                "player": player,
+                "action_type": action_type,
+                "reason": reason,
+                "deadline": deadline,
+            },
+            private_fields=[
+                "player",
+                "action_type",
+                "reason",
+                "deadline",
+                "phase",
+                "round_number",
+                "stage",
+            ],
+            phase=phase,
+            round_number=round_number,
+            stage=stage,
+        )
+
     def add_game_end(
         self,
         winner: str,
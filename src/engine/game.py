@@ -2,22 +2,45 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from src.engine.context import ContextBuilder
+from src.analysis.prompt_sizes import PromptSizeRecorder
+from src.engine.context import ContextBuilder, TranscriptStyle
 from src.engine.events import EventLog
 from src.engine.phases import DayPhase, NightPhase, NightZeroPhase
+from src.engine.profiling import PhaseProfiler
 from src.engine.state import GameStateManager
+from src.engine.summarizer import RoundSummarizer
 from src.engine.transcript import TranscriptManager
+from src.metrics import (
+    GAMES_FINISHED,
+    GAMES_IN_PROGRESS,
+    GAMES_STARTED,
+    PHASE_DURATION,
+    MetricsRegistry,
+    reset_game_metrics,
+    set_game_metrics,
+)
 from src.players.agent import PlayerAgent
+from src.providers.retry import RetryBudget, reset_game_retry_budget, set_game_retry_budget
+from src.providers.routing import ActionRouter
 from src.schemas import PlayerMemory
-from src.storage.json_logs import GameLogWriter
+from src.storage.json_logs import GameLogWriter, sidecar_path
+from src.storage.timeline import write_timeline
+from src.telemetry import emit, reset_game_trace, start_game_trace
 
 if TYPE_CHECKING:
+    from src.engine.monitor import RuntimeMonitor
     from src.providers.base import PlayerProvider
-    from src.schemas import Persona
+    from src.providers.routing import RoutingPolicy
+    from src.schemas import ActionType, Persona
 
 
 @dataclass
@@ -29,6 +52,30 @@ class GameConfig:
     provider: PlayerProvider
     output_dir: str = "logs"
     seed: int | None = None
+    routing: RoutingPolicy | None = None  # Per-action model/thinking/timeout tiers
+    # Seconds per action type, retries included (None = agent defaults)
+    action_deadlines: dict[ActionType, float] | None = None
+    # Wall-clock budget for the whole game; once spent, actions use defaults
+    max_game_seconds: float | None = None
+    # Retries allowed per first attempt across this game (transport and re-asks)
+    retry_budget_ratio: float = 0.2
+    # Profile each phase; results are written next to the game log
+    profile: bool = False
+    # Measure every prompt by context section; written next to the game log
+    prompt_sizes: bool = False
+    # Compile a seekable viewer timeline next to the game log
+    timeline: bool = False
+    # Transcript renderer for prompts (compact uses seat aliases)
+    transcript_style: TranscriptStyle = TranscriptStyle.FULL
+    # Per-player message histories instead of rebuilding the full context
+    sessions: bool = False
+    # LLM-summarize each finished round in the background; used once it leaves the window
+    summarize_rounds: bool = False
+    # Past speeches retrieved by relevance per prompt (BM25); when set, only the
+    # current round stays in full and older ones are compressed (0 = off)
+    retrieved_speeches: int = 0
+    # Shared runtime monitor (loop lag, in-flight calls); see src.engine.monitor
+    monitor: RuntimeMonitor | None = None
 
 
 @dataclass
@@ -40,6 +87,9 @@ class GameResult:
     log_path: str
     final_living: list[str] = field(default_factory=list)
     eliminations: list[dict] = field(default_factory=list)
+    profile_path: str | None = None  # Directory with per-phase profiles (--profile)
+    prompt_sizes_path: str | None = None  # Prompt-size breakdown (--prompt-sizes)
+    timeline_path: str | None = None  # Compiled viewer timeline (--timeline)
 
 
 class GameRunner:
@@ -58,8 +108,28 @@ class GameRunner:
         self.config = config
         self.state = GameStateManager(config.player_names, config.seed)
         self.event_log = EventLog()
-        self.transcript = TranscriptManager()
-        self.context_builder = ContextBuilder()
+        self.router = ActionRouter(config.routing) if config.routing else None
+        self.retry_budget = RetryBudget(ratio=config.retry_budget_ratio)
+        self.metrics = MetricsRegistry()  # This game's share of the process metrics
+        self.profiler = PhaseProfiler() if config.profile else None
+        self.provider = config.provider
+        if config.monitor:
+            self.provider = config.monitor.wrap(self.provider, self.event_log.game_id)
+        if self.profiler:
+            self.provider = self.profiler.wrap(self.provider)
+        self.prompt_sizes = PromptSizeRecorder() if config.prompt_sizes else None
+        if self.prompt_sizes:
+            self.provider = self.prompt_sizes.wrap(self.provider)
+        self.summarizer = RoundSummarizer(self.provider) if config.summarize_rounds else None
+        self.transcript = TranscriptManager(
+            summarizer=self.summarizer, full_rounds=1 if config.retrieved_speeches else 2
+        )
+        self.context_builder = ContextBuilder(
+            transcript_style=config.transcript_style,
+            seats={name: player.seat for name, player in self.state.players.items()},
+            speech_index=self.transcript.speech_index,
+            retrieved_speeches=config.retrieved_speeches,
+        )
 
         # Track game timing
         self.timestamp_start = datetime.now(UTC).isoformat()
@@ -99,8 +169,13 @@ class GameRunner:
                 persona=persona,
                 role=role,
                 seat=seat,
-                provider=self.config.provider,
+                provider=self.provider,
                 partners=partners,
+                router=self.router,
+                deadlines=self.config.action_deadlines,
+                event_log=self.event_log,
+                context_builder=self.context_builder,
+                sessions=self.config.sessions,
             )
 
     async def run(self) -> GameResult:
@@ -110,16 +185,69 @@ class GameRunner:
         Returns:
             GameResult with winner, rounds played, and log path
         """
+        # Provider and agent retries in this task draw from this game's budget
+        token = set_game_retry_budget(self.retry_budget)
+        metrics_token = set_game_metrics(self.metrics)
+        trace_token = start_game_trace(self.event_log.game_id)
+        if self.config.monitor:
+            self.config.monitor.game_started(self.event_log.game_id)
+        GAMES_STARTED.inc()
+        GAMES_IN_PROGRESS.inc()
+        try:
+            result = await self._run()
+        finally:
+            if self.summarizer:
+                await self.summarizer.close()
+            GAMES_IN_PROGRESS.dec()
+            reset_game_trace(trace_token)
+            reset_game_metrics(metrics_token)
+            reset_game_retry_budget(token)
+            if self.config.monitor:
+                self.config.monitor.game_finished(self.event_log.game_id)
+
+        if self.profiler:
+            profile_dir = Path(result.log_path).with_suffix(".profile")
+            result.profile_path = str(self.profiler.write(profile_dir))
+        if self.prompt_sizes:
+            sizes_path = sidecar_path(Path(result.log_path), "prompts")
+            result.prompt_sizes_path = str(self.prompt_sizes.write(sizes_path))
+        if self.config.timeline:
+            path = await asyncio.to_thread(write_timeline, Path(result.log_path))
+            result.timeline_path = str(path)
+        return result
+
+    @asynccontextmanager
+    async def _phase(self, name: str) -> AsyncIterator[None]:
+        """Time a phase for metrics, and profile it when profiling is enabled."""
+        started = time.monotonic()
+        try:
+            if self.profiler:
+                async with self.profiler.phase(name):
+                    yield
+            else:
+                yield
+        finally:
+            # day_3 -> day, night_zero stays night_zero
+            kind = name.rstrip("0123456789").rstrip("_")
+            PHASE_DURATION.observe(time.monotonic() - started, phase=kind)
+
+    async def _run(self) -> GameResult:
+        if self.config.max_game_seconds is not None:
+            game_deadline = time.monotonic() + self.config.max_game_seconds
+            for agent in self.agents.values():
+                agent.game_deadline = game_deadline
+
         # Advance to night_zero before running Night Zero phase
         self.state.advance_phase()  # setup → night_zero
 
         # Night Zero: Mafia coordination
-        self.memories = await self.night_zero.run(
-            self.agents,
-            self.state,
-            self.event_log,
-            self.memories,
-        )
+        async with self._phase(self.state.phase):
+            self.memories = await self.night_zero.run(
+                self.agents,
+                self.state,
+                self.event_log,
+                self.memories,
+            )
 
         night_kill: str | None = None
 
@@ -129,14 +257,15 @@ class GameRunner:
             self.state.advance_phase()  # night_zero → day_1, night_N → day_(N+1)
 
             # Day Phase
-            eliminated, self.memories = await self.day_phase.run(
-                self.agents,
-                self.state,
-                self.transcript,
-                self.event_log,
-                self.memories,
-                night_kill,
-            )
+            async with self._phase(self.state.phase):
+                eliminated, self.memories = await self.day_phase.run(
+                    self.agents,
+                    self.state,
+                    self.transcript,
+                    self.event_log,
+                    self.memories,
+                    night_kill,
+                )
 
             if eliminated:
                 role = self.state.get_player_role(eliminated)
@@ -160,13 +289,14 @@ class GameRunner:
             self.state.advance_phase()  # day_N → night_N
 
             # Night Phase (no last words - night kills are silent)
-            night_kill, self.memories = await self.night_phase.run(
-                self.agents,
-                self.state,
-                self.transcript,
-                self.event_log,
-                self.memories,
-            )
+            async with self._phase(self.state.phase):
+                night_kill, self.memories = await self.night_phase.run(
+                    self.agents,
+                    self.state,
+                    self.transcript,
+                    self.event_log,
+                    self.memories,
+                )
 
             if night_kill:
                 role = self.state.get_player_role(night_kill)
@@ -186,6 +316,11 @@ class GameRunner:
 
     async def _finalize_game(self, winner: str) -> GameResult:
         """Finalize game and write log."""
+        async with self._phase("finalize"):
+            return await self._write_result(winner)
+
+    async def _write_result(self, winner: str) -> GameResult:
+        GAMES_FINISHED.inc(winner=winner)
         final_roles = self.state.get_all_roles()
         self.event_log.add_game_end(
             winner,
@@ -203,6 +338,19 @@ class GameRunner:
         writer = GameLogWriter(self.config.output_dir)
         log_path = await writer.write_game_log(log_data)
 
+        # One summary per game, whether or not the game is sampled for tracing
+        emit(
+            {
+                "type": "game",
+                "model": log_data["metadata"]["model"],
+                "seed": self.config.seed,
+                "winner": winner,
+                "rounds": self.state.round_number,
+                "log_path": log_path,
+            },
+            always=True,
+        )
+
         return GameResult(
             winner=winner,
             rounds=self.state.round_number,
@@ -219,6 +367,17 @@ class GameRunner:
         if not isinstance(model, str):
             model = "unknown"
 
+        metadata: dict[str, object] = {
+            "seed": self.config.seed,
+            "model": model,
+            "player_count": len(self.config.player_names),
+        }
+        if self.router:
+            metadata["routing"] = self.router.summary()
+        if self.retry_budget.retries or self.retry_budget.denied:
+            metadata["retries"] = self.retry_budget.summary()
+        metadata["metrics"] = self.metrics.snapshot()
+
         # Build elimination lookup for player outcomes
         eliminated_players = {e["player"]: e["phase"] for e in self.eliminations}
 
@@ -248,11 +407,7 @@ class GameRunner:
             ],
             "events": self.event_log.get_all_events(),
             # Extra fields for enrichment (not in Phase 3 spec but useful)
-            "metadata": {
-                "seed": self.config.seed,
-                "model": model,
-                "player_count": len(self.config.player_names),
-            },
+            "metadata": metadata,
             "transcript": self.transcript.get_full_transcript(),
             "result": {
                 "rounds": self.state.round_number,
@@ -267,6 +422,7 @@ async def run_game(
     provider: PlayerProvider,
     output_dir: str = "logs",
     seed: int | None = None,
+    routing: RoutingPolicy | None = None,
 ) -> GameResult:
     """
     Convenience function to run a game.
@@ -276,6 +432,7 @@ async def run_game(
         provider: LLM provider instance
         output_dir: Directory for game logs
         seed: Optional random seed
+        routing: Optional per-action routing policy
 
     Returns:
         GameResult with winner and log path
@@ -286,6 +443,7 @@ async def run_game(
         provider=provider,
         output_dir=output_dir,
         seed=seed,
+        routing=routing,
     )
 
     runner = GameRunner(config)
@@ -0,0 +1,321 @@
+"""
+Runtime monitor for concurrent games: event-loop lag, in-flight calls, stalls.
+
+CPU-heavy work on the event loop (log serialization, pydantic validation,
+large prompt joins) delays every other game's I/O. The monitor samples how
+late the loop wakes up, counts provider calls in flight per game, reads
+registered queue depths, and flags stalls together with the stack of the
+code blocking the loop. Snapshots are served as JSON over HTTP and/or
+dumped to a file periodically:
+
+    python -m src.engine.run --monitor-port 9464 --monitor-file monitor.json
+    curl localhost:9464
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.providers.base import PlayerProvider
+    from src.schemas import ActionType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stall:
+    """A period during which the event loop did not run other tasks."""
+
+    detected_at: str  # ISO8601 time the watchdog noticed the stall
+    duration: float  # Seconds the loop was blocked (updated when it resumes)
+    task: str | None  # Name of the task running on the loop when detected
+    stack: list[str]  # Loop thread stack when detected, outermost frame first
+    ongoing: bool = True
+
+
+class _MonitoredProvider:
+    """Provider wrapper that counts in-flight calls for one game."""
+
+    def __init__(self, provider: PlayerProvider, monitor: RuntimeMonitor, game_id: str):
+        self.provider = provider
+        self.monitor = monitor
+        self.game_id = game_id
+
+    @property
+    def model(self) -> Any:
+        return getattr(self.provider, "model", "unknown")
+
+    async def act(self, action_type: ActionType, context: str, **kwargs: Any) -> dict:
+        self.monitor._call_started(self.game_id)
+        try:
+            return await self.provider.act(action_type, context, **kwargs)
+        finally:
+            self.monitor._call_finished(self.game_id)
+
+
+class RuntimeMonitor:
+    """
+    Optional background monitor shared by all games in a process.
+
+    A task on the loop wakes up every `interval` seconds and records how late
+    it ran (loop lag). A watchdog thread checks the task's heartbeat; if the
+    loop has been blocked for more than `stall_threshold` seconds it captures
+    the loop thread's stack, which shows the synchronous code that is holding
+    the loop, and logs a warning.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.05,
+        stall_threshold: float = 0.25,
+        window: int = 1200,
+        max_stalls: int = 50,
+    ):
+        """
+        Initialize monitor.
+
+        Args:
+            interval: Seconds between loop-lag samples
+            stall_threshold: Lag in seconds reported as a stall
+            window: Recent lag samples kept for percentiles
+            max_stalls: Recent stalls kept in snapshots
+        """
+        if interval <= 0 or stall_threshold <= 0:
+            raise ValueError("Monitor interval and stall threshold must be positive")
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.lag: deque[float] = deque(maxlen=window)
+        self.stalls: deque[Stall] = deque(maxlen=max_stalls)
+        self.stall_count = 0
+        self.in_flight: dict[str, int] = {}
+        self.provider_calls = 0
+        self.queues: dict[str, Callable[[], int]] = {}
+        self.started_at: float | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread = 0
+        self._heartbeat = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watchdog: threading.Thread | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._server: asyncio.Server | None = None
+
+    # Games and providers
+
+    def wrap(self, provider: PlayerProvider, game_id: str) -> PlayerProvider:
+        """Wrap a game's provider so its in-flight calls are counted."""
+        return _MonitoredProvider(provider, self, game_id)  # type: ignore[return-value]
+
+    def game_started(self, game_id: str) -> None:
+        self.in_flight.setdefault(game_id, 0)
+
+    def game_finished(self, game_id: str) -> None:
+        self.in_flight.pop(game_id, None)
+
+    def add_queue(self, name: str, depth: Callable[[], int]) -> None:
+        """
+        Report a queue's depth in snapshots.
+
+        Args:
+            name: Name shown in snapshots
+            depth: Returns the current number of waiters
+        """
+        self.queues[name] = depth
+
+    def _call_started(self, game_id: str) -> None:
+        self.in_flight[game_id] = self.in_flight.get(game_id, 0) + 1
+        self.provider_calls += 1
+
+    def _call_finished(self, game_id: str) -> None:
+        if game_id in self.in_flight:
+            self.in_flight[game_id] -= 1
+
+    # Lifecycle
+
+    async def start(
+        self,
+        port: int | None = None,
+        host: str = "127.0.0.1",
+        dump_path: str | Path | None = None,
+        dump_interval: float = 5.0,
+    ) -> None:
+        """
+        Start sampling on the running loop.
+
+        Args:
+            port: Serve JSON snapshots on this port (0 = any free port)
+            host: Interface for the HTTP endpoint
+            dump_path: Rewrite this file with a snapshot every dump_interval
+            dump_interval: Seconds between file dumps
+        """
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self.started_at = self._heartbeat
+        self._tasks.append(asyncio.create_task(self._sample_lag(), name="monitor-lag"))
+        if dump_path is not None:
+            self._tasks.append(
+                asyncio.create_task(self._dump(Path(dump_path), dump_interval), name="monitor-dump")
+            )
+        if port is not None:
+            self._server = await asyncio.start_server(self._handle_request, host, port)
+        self._stop.clear()
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> RuntimeMonitor:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    @property
+    def port(self) -> int | None:
+        """Port of the HTTP endpoint, if serving."""
+        if self._server is None:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+
+    # Sampling
+
+    async def _sample_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self.lag.append(lag)
+            self._heartbeat = time.monotonic()
+            with self._lock:
+                stall = self.stalls[-1] if self.stalls else None
+                if stall is not None and stall.ongoing:
+                    stall.duration = lag
+                    stall.ongoing = False
+
+    def _watch(self) -> None:
+        flagged = False
+        while not self._stop.wait(self.interval / 2):
+            blocked = time.monotonic() - self._heartbeat - self.interval
+            if blocked < self.stall_threshold:
+                flagged = False
+                continue
+            if not flagged:
+                flagged = True
+                self._record_stall(blocked)
+
+    def _record_stall(self, blocked: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread)
+        stack = traceback.format_stack(frame) if frame is not None else []
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        stall = Stall(
+            detected_at=datetime.now(UTC).isoformat(),
+            duration=blocked,
+            task=task.get_name() if task is not None else None,
+            stack=[line.rstrip() for line in stack],
+        )
+        with self._lock:
+            self.stalls.append(stall)
+            self.stall_count += 1
+        logger.warning(
+            "Event loop blocked for %.0f ms in task %s:\n%s",
+            blocked * 1000,
+            stall.task,
+            "\n".join(stall.stack[-8:]),
+        )
+
+    # Reporting
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current monitor state as a JSON-serializable dict."""
+        samples = sorted(self.lag)
+        with self._lock:
+            stalls = [asdict(stall) for stall in self.stalls]
+        queues: dict[str, int | None] = {}
+        for name, depth in self.queues.items():
+            try:
+                queues[name] = depth()
+            except Exception:
+                logger.exception("Queue depth callback %s failed", name)
+                queues[name] = None
+        return {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "uptime_sec": time.monotonic() - self.started_at if self.started_at else 0.0,
+            "loop_lag_ms": {
+                "last": self.lag[-1] * 1000 if self.lag else 0.0,
+                "p50": _percentile(samples, 50) * 1000,
+                "p99": _percentile(samples, 99) * 1000,
+                "max": (samples[-1] if samples else 0.0) * 1000,
+                "samples": len(samples),
+            },
+            "tasks": len(asyncio.all_tasks(self._loop)) if self._loop else 0,
+            "games": len(self.in_flight),
+            "in_flight": {
+                "total": sum(self.in_flight.values()),
+                "by_game": dict(self.in_flight),
+            },
+            "provider_calls": self.provider_calls,
+            "queues": queues,
+            "stalls": {"count": self.stall_count, "recent": stalls},
+        }
+
+    async def _dump(self, path: Path, interval: float) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            await asyncio.sleep(interval)
+            data = json.dumps(self.snapshot(), indent=2)
+            await asyncio.to_thread(path.write_text, data)
+
+    async def _handle_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            body = json.dumps(self.snapshot()).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                + f"content-length: {len(body)}\r\nconnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted values (0.0 when empty)."""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
@@ -94,11 +94,11 @@ class NightZeroPhase:
             )
 
         # Store all strategies in each Mafia's memory for future reference
+        shared = dict(strategies)
         for agent in mafia_agents:
-            memory = memories[agent.name]
-            facts = dict(memory.facts)
-            facts["night_zero_strategies"] = dict(strategies)
-            memories[agent.name] = PlayerMemory(facts=facts, beliefs=dict(memory.beliefs))
+            memories[agent.name] = memories[agent.name].update(
+                facts={"night_zero_strategies": shared}
+            )
 
         return memories
 
@@ -600,15 +600,12 @@ class NightPhase:
 
         for agent in mafia_agents:
             memory = memories[agent.name]
-            facts = dict(memory.facts)
-            history = list(facts.get("mafia_kill_history", []))
             entry = {"target": intended_kill or "skip", "outcome": outcome}
-            history.append(entry)
-            facts["mafia_kill_history"] = history
-            facts["last_mafia_kill"] = entry
-            memories[agent.name] = PlayerMemory(
-                facts=facts,
-                beliefs=dict(memory.beliefs),
+            memories[agent.name] = memory.update(
+                facts={
+                    "mafia_kill_history": memory.history("mafia_kill_history").append(entry),
+                    "last_mafia_kill": entry,
+                }
             )
 
     def _record_doctor_protection_history(
@@ -627,18 +624,13 @@ class NightPhase:
             return
         for agent in doctor_agents:
             memory = memories[agent.name]
-            facts = dict(memory.facts)
-            history = list(facts.get("doctor_protection_history", []))
             entry = {
                 "target": protected_target,
                 "reasoning": (doctor_output or {}).get("reasoning", ""),
             }
-            history.append(entry)
-            facts["doctor_protection_history"] = history
-            facts["last_doctor_protect"] = entry
-            memories[agent.name] = PlayerMemory(
-                facts=facts,
-                beliefs=dict(memory.beliefs),
+            history = memory.history("doctor_protection_history").append(entry)
+            memories[agent.name] = memory.update(
+                facts={"doctor_protection_history": history, "last_doctor_protect": entry}
             )
 
     def _record_detective_investigation_history(
@@ -652,22 +644,19 @@ class NightPhase:
         memory = memories.get(detective_name)
         if not memory:
             return
-        facts = dict(memory.facts)
         entry = {
             "target": target,
             "result": result,
             "reasoning": output.get("reasoning", ""),
         }
-        results = list(facts.get("investigation_results", []))
-        results.append({"target": target, "result": result})
-        history = list(facts.get("investigation_history", []))
-        history.append(entry)
-        facts["investigation_results"] = results
-        facts["investigation_history"] = history
-        facts["last_investigation"] = entry
-        memories[detective_name] = PlayerMemory(
-            facts=facts,
-            beliefs=dict(memory.beliefs),
+        memories[detective_name] = memory.update(
+            facts={
+                "investigation_results": memory.history("investigation_results").append(
+                    {"target": target, "result": result}
+                ),
+                "investigation_history": memory.history("investigation_history").append(entry),
+                "last_investigation": entry,
+            }
         )
 
     async def _run_mafia_coordination(
@@ -0,0 +1,206 @@
+"""Per-phase profiling for game runs (--profile)."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from types import FrameType
+
+    from src.providers.base import PlayerProvider
+    from src.schemas import ActionType
+
+
+@dataclass
+class PhaseProfile:
+    """
+    Timing for one phase of a game.
+
+    Provider wait and local CPU can overlap: while one agent's request is in
+    flight, another agent may be building its prompt.
+    """
+
+    name: str
+    wall: float = 0.0  # Seconds from phase start to end
+    cpu: float = 0.0  # Engine thread CPU seconds (prompting, validation, logging)
+    provider_wait: float = 0.0  # Seconds with at least one provider call in flight
+    provider_calls: int = 0
+    provider_call_time: float = 0.0  # Sum of individual call durations
+    samples: int = 0
+    stacks: Counter[str] = field(default_factory=Counter)
+    started: float = 0.0  # perf_counter at phase start
+
+    def summary(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.pop("stacks")
+        data.pop("started")
+        return data
+
+
+class _ProfiledProvider:
+    """Provider wrapper that reports call timing to a PhaseProfiler."""
+
+    def __init__(self, provider: PlayerProvider, profiler: PhaseProfiler):
+        self.provider = provider
+        self.profiler = profiler
+
+    @property
+    def model(self) -> Any:
+        return getattr(self.provider, "model", "unknown")
+
+    async def act(self, action_type: ActionType, context: str, **kwargs: Any) -> dict:
+        self.profiler._call_started()
+        started = time.perf_counter()
+        try:
+            return await self.provider.act(action_type, context, **kwargs)
+        finally:
+            self.profiler._call_finished(time.perf_counter() - started)
+
+
+class PhaseProfiler:
+    """
+    Profiles a game phase by phase.
+
+    Wall time, engine-thread CPU and time spent awaiting the provider are
+    measured for each phase. A sampling thread records the engine thread's
+    stack every `interval` seconds, producing folded stacks (one
+    "frame;frame;frame count" line per stack) that flame graph tools such
+    as flamegraph.pl and speedscope read directly.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.phases: list[PhaseProfile] = []
+        self._current: PhaseProfile | None = None
+        self._in_flight = 0
+        self._wait_started = 0.0
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    def wrap(self, provider: PlayerProvider) -> PlayerProvider:
+        """Wrap a provider so its calls are attributed to the current phase."""
+        return _ProfiledProvider(provider, self)  # type: ignore[return-value]
+
+    @asynccontextmanager
+    async def phase(self, name: str) -> AsyncIterator[PhaseProfile]:
+        """Profile everything that runs inside the block as one phase."""
+        profile = PhaseProfile(name=name, started=time.perf_counter())
+        self._thread_id = threading.get_ident()
+        self._current = profile
+        self._start_sampler()
+        cpu_started = time.thread_time()
+        try:
+            yield profile
+        finally:
+            ended = time.perf_counter()
+            profile.wall = ended - profile.started
+            profile.cpu = time.thread_time() - cpu_started
+            if self._in_flight:
+                # Calls still running when the phase ends count up to its end
+                profile.provider_wait += ended - max(self._wait_started, profile.started)
+            self._stop_sampler()
+            self._current = None
+            self.phases.append(profile)
+
+    def _call_started(self) -> None:
+        if self._in_flight == 0:
+            self._wait_started = time.perf_counter()
+        self._in_flight += 1
+
+    def _call_finished(self, duration: float) -> None:
+        self._in_flight -= 1
+        profile = self._current
+        if profile is None:
+            return
+        profile.provider_calls += 1
+        profile.provider_call_time += duration
+        if self._in_flight == 0:
+            # Clamp to the phase start for calls spanning a phase boundary
+            started = max(self._wait_started, profile.started)
+            profile.provider_wait += time.perf_counter() - started
+
+    def _start_sampler(self) -> None:
+        self._stop.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="phase-profiler", daemon=True
+        )
+        self._sampler.start()
+
+    def _stop_sampler(self) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            profile = self._current
+            if frame is None or profile is None:
+                continue
+            profile.stacks[_fold(frame)] += 1
+            profile.samples += 1
+
+    def summary(self) -> list[dict[str, Any]]:
+        return [phase.summary() for phase in self.phases]
+
+    def format_table(self) -> str:
+        """Plain-text summary table."""
+        header = (
+            f"{'phase':<14}{'wall s':>9}{'cpu s':>9}{'wait s':>9}"
+            f"{'calls':>7}{'cpu %':>8}{'wait %':>8}"
+        )
+        lines = [header, "-" * len(header)]
+        for phase in self.phases:
+            wall = phase.wall or 1e-9
+            lines.append(
+                f"{phase.name:<14}{phase.wall:>9.3f}{phase.cpu:>9.3f}"
+                f"{phase.provider_wait:>9.3f}{phase.provider_calls:>7}"
+                f"{phase.cpu / wall:>8.1%}{phase.provider_wait / wall:>8.1%}"
+            )
+        total_wall = sum(p.wall for p in self.phases)
+        lines.append("-" * len(header))
+        lines.append(
+            f"{'total':<14}{total_wall:>9.3f}{sum(p.cpu for p in self.phases):>9.3f}"
+            f"{sum(p.provider_wait for p in self.phases):>9.3f}"
+            f"{sum(p.provider_calls for p in self.phases):>7}"
+        )
+        return "\n".join(lines)
+
+    def write(self, directory: str | Path) -> Path:
+        """
+        Write folded stacks per phase plus summary files.
+
+        Args:
+            directory: Output directory (created if missing)
+
+        Returns:
+            The output directory
+        """
+        out = Path(directory)
+        out.mkdir(parents=True, exist_ok=True)
+        for index, phase in enumerate(self.phases):
+            lines = [f"{stack} {count}" for stack, count in sorted(phase.stacks.items())]
+            (out / f"{index:02d}_{phase.name}.folded").write_text("\n".join(lines) + "\n")
+        (out / "summary.json").write_text(json.dumps(self.summary(), indent=2))
+        (out / "summary.txt").write_text(self.format_table() + "\n")
+        return out
+
+
+def _fold(frame: FrameType | None) -> str:
+    names: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{Path(code.co_filename).stem}:{code.co_qualname}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
@@ -262,3 +262,23 @@ def build_last_words_prompt(last_words_role_note: str) -> str:
         last_words_role_note=last_words_role_note,
         short_field_guide=SHORT_FIELD_GUIDE,
     )
+
+
+ROUND_SUMMARY_PROMPT_TEMPLATE = """[YOUR TASK: SUMMARIZE ROUND]
+You are the neutral narrator of a Mafia game. Summarize Day {round_number} below for
+players who will no longer see its full transcript.
+
+- Keep who claimed a role, who accused whom and why, and who defended whom
+- Keep notable contradictions and vote patterns
+- Do not speculate about hidden roles or add anything that was not said
+- At most {max_words} words, in the 'summary' field
+
+{round_text}"""
+
+
+def build_round_summary_prompt(round_number: int, round_text: str, max_words: int = 120) -> str:
+    return ROUND_SUMMARY_PROMPT_TEMPLATE.format(
+        round_number=round_number,
+        round_text=round_text,
+        max_words=max_words,
+    )
@@ -0,0 +1,147 @@
+"""BM25 retrieval over past speeches."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from collections import defaultdict
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+# Function words that match almost every speech and carry no evidence
+STOPWORDS = frozenset(
+    {
+        "a", "about", "after", "again", "all", "also", "am", "an", "and", "any", "are", "as", "at",
+        "be", "because", "been", "but", "by", "can", "could", "did", "do", "does", "for", "from",
+        "had", "has", "have", "he", "her", "him", "his", "how", "i", "if", "in", "into", "is", "it",
+        "its", "just", "me", "my", "no", "not", "of", "on", "or", "our", "out", "she", "so", "than",
+        "that", "the", "their", "them", "then", "there", "they", "this", "to", "too", "up", "us",
+        "was", "we", "were", "what", "when", "which", "who", "why", "will", "with", "would", "you",
+        "your",
+    }
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords or single characters."""
+    return [
+        token
+        for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+@dataclass(frozen=True)
+class IndexedSpeech:
+    """One past speech as stored in the index."""
+
+    round_number: int
+    speaker: str
+    text: str
+    nomination: str | None = None
+    kind: str = "speech"  # "speech", "defense" or "last_words"
+
+
+class SpeechIndex:
+    """
+    Incremental in-memory BM25 index over past speeches.
+
+    Each speech is indexed once, under its text plus the speaker's and
+    nominee's names, so a query made of player names finds speeches by or
+    about those players. Postings are kept per term and document
+    statistics are updated on every add; IDF is computed at query time, so
+    nothing is rebuilt as the game grows. A search only scores speeches
+    that share a term with the query and keeps the best `k` in a heap.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize empty index.
+
+        Args:
+            k1: Term-frequency saturation
+            b: Document-length normalization (0 = none, 1 = full)
+        """
+        self.k1 = k1
+        self.b = b
+        self.speeches: list[IndexedSpeech] = []
+        self._postings: dict[str, dict[int, int]] = defaultdict(dict)  # term -> doc -> tf
+        self._lengths: list[int] = []
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.speeches)
+
+    def clear(self) -> None:
+        """Remove every speech, keeping this index object (readers hold a reference)."""
+        self.speeches.clear()
+        self._postings.clear()
+        self._lengths.clear()
+        self._total_length = 0
+
+    def add(self, speech: IndexedSpeech) -> int:
+        """
+        Index a speech.
+
+        Args:
+            speech: Speech to add
+
+        Returns:
+            Document id of the speech
+        """
+        doc_id = len(self.speeches)
+        tokens = tokenize(speech.text) + tokenize(speech.speaker)
+        if speech.nomination:
+            tokens += tokenize(speech.nomination)
+        counts: dict[str, int] = defaultdict(int)
+        for token in tokens:
+            counts[token] += 1
+        for token, count in counts.items():
+            self._postings[token][doc_id] = count
+        self.speeches.append(speech)
+        self._lengths.append(len(tokens))
+        self._total_length += len(tokens)
+        return doc_id
+
+    def search(
+        self,
+        query: str | Iterable[str],
+        k: int = 5,
+        exclude_rounds: Collection[int] = (),
+    ) -> list[tuple[float, IndexedSpeech]]:
+        """
+        Find the speeches that best match a query.
+
+        Args:
+            query: Query text, or pre-tokenized terms
+            k: Number of speeches to return
+            exclude_rounds: Rounds to skip (e.g. ones already shown in full)
+
+        Returns:
+            Up to `k` (score, speech) pairs, best first; speeches with no
+            query term are never returned
+        """
+        terms = tokenize(query) if isinstance(query, str) else list(query)
+        if k <= 0 or not self.speeches:
+            return []
+
+        count = len(self.speeches)
+        avg_length = self._total_length / count or 1.0
+        scores: dict[int, float] = defaultdict(float)
+        for term in set(terms):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                if self.speeches[doc_id].round_number in exclude_rounds:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / avg_length)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        # Ties go to the more recent speech
+        best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], item[0]))
+        return [(score, self.speeches[doc_id]) for doc_id, score in best]
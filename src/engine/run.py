@@ -1,20 +1,26 @@
-"""CLI entry point for running Mafia games."""
+"""
+CLI entry point for running Mafia games.
+
+Only argument parsing happens at import time. The game engine, provider SDKs,
+rich, settings and personas are imported when a game actually starts, so
+`--help` and argument errors return quickly (see tests/test_imports.py).
+"""
 
 from __future__ import annotations
 
 import argparse
 import asyncio
 import sys
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.panel import Panel
+from src.engine.context import TranscriptStyle
 
-from src.config import get_settings
-from src.engine.game import GameConfig, GameRunner
-from src.providers.google import GoogleGenAIProvider
-from src.schemas import Event
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+    from src.config import Settings
+    from src.schemas import Event
+    from src.telemetry import TelemetryExporter
 
 
 def _cli_event_reporter(console: Console):
@@ -34,6 +40,10 @@ def _cli_event_reporter(console: Console):
         elif event.type == "elimination":
             eliminated = event.data.get("eliminated", "unknown")
             console.print(f"Eliminated: {eliminated}")
+        elif event.type == "timeout":
+            player = event.data.get("player", "unknown")
+            action = event.data.get("action_type", "action")
+            console.print(f"[yellow]Timeout:[/yellow] {player} ({action}) used default")
         elif event.type == "game_end":
             winner = event.data.get("winner", "unknown")
             console.print(f"[bold]Game end:[/bold] {winner}")
@@ -41,6 +51,31 @@ def _cli_event_reporter(console: Console):
     return _report
 
 
+def _build_telemetry(
+    settings: Settings, telemetry_file: str | None, console: Console
+) -> TelemetryExporter | None:
+    """Create the background telemetry exporter if any sink is configured."""
+    from src.telemetry import JsonlFileSink, LangfuseSink, TelemetryExporter, TelemetrySink
+
+    sinks: list[TelemetrySink] = []
+    if telemetry_file:
+        sinks.append(JsonlFileSink(telemetry_file))
+    if settings.langfuse_public_key and settings.langfuse_secret_key:
+        try:
+            sinks.append(
+                LangfuseSink(
+                    settings.langfuse_public_key,
+                    settings.langfuse_secret_key,
+                    settings.langfuse_host,
+                )
+            )
+        except ImportError:
+            console.print("[yellow]langfuse not installed; skipping Langfuse telemetry[/yellow]")
+    if not sinks:
+        return None
+    return TelemetryExporter(sinks, sample_rate=settings.telemetry_sample_rate)
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -65,11 +100,120 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Model name to use (default: from settings)",
     )
+    parser.add_argument(
+        "--routing",
+        type=str,
+        default=None,
+        help="Routing policy JSON mapping actions to model/thinking/timeout "
+        "(default: from settings)",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Fire a duplicate request when a call runs past the learned latency percentile",
+    )
+    parser.add_argument(
+        "--failover",
+        action="store_true",
+        help="Route around a failing Gemini API to Anthropic (needs ANTHROPIC_API_KEY)",
+    )
+    parser.add_argument(
+        "--max-game-seconds",
+        type=float,
+        default=None,
+        help="Wall-clock budget for the game; later actions fall back to defaults "
+        "(default: from settings, 0 = unlimited)",
+    )
+    parser.add_argument(
+        "--transcript-style",
+        choices=[style.value for style in TranscriptStyle],
+        default=None,
+        help="Transcript rendering in prompts; compact uses seat-number aliases "
+        "(default: from settings)",
+    )
+    parser.add_argument(
+        "--sessions",
+        action="store_true",
+        help="Keep a message history per player and send only what changed since "
+        "their last turn (enables provider prefix caching)",
+    )
+    parser.add_argument(
+        "--summarize-rounds",
+        action="store_true",
+        help="Summarize each finished round with the LLM during the night; older rounds "
+        "use the summary instead of the bare outcome",
+    )
+    parser.add_argument(
+        "--retrieve-speeches",
+        type=int,
+        default=None,
+        metavar="K",
+        help="Send only the current round in full plus the K past speeches most relevant "
+        "to the player, nominees and suspects (default: from settings, 0 = off)",
+    )
+    parser.add_argument(
+        "--monitor-port",
+        type=int,
+        default=None,
+        help="Serve event-loop lag, in-flight calls and stalls as JSON on this port",
+    )
+    parser.add_argument(
+        "--monitor-file",
+        type=str,
+        default=None,
+        help="Periodically write the runtime monitor snapshot to this JSON file",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus-format metrics on this port while the game runs",
+    )
+    parser.add_argument(
+        "--telemetry-file",
+        type=str,
+        default=None,
+        help="Append telemetry events (game summaries, sampled generations) to this JSONL file",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile each phase (provider wait vs local CPU, folded stacks) "
+        "and write the results next to the game log",
+    )
+    parser.add_argument(
+        "--prompt-sizes",
+        action="store_true",
+        help="Measure every prompt by context section and write the breakdown "
+        "next to the game log",
+    )
+    parser.add_argument(
+        "--timeline",
+        action="store_true",
+        help="Compile a seekable replay timeline for the viewer next to the game log",
+    )
     return parser.parse_args()
 
 
 async def run_game_cli(args: argparse.Namespace) -> int:
     """Run a game from CLI arguments."""
+    from rich.console import Console
+    from rich.panel import Panel
+
+    from src.analysis.prompt_sizes import format_report as format_prompt_report
+    from src.config import get_settings
+    from src.engine.game import GameConfig, GameRunner
+    from src.engine.monitor import RuntimeMonitor
+    from src.metrics import start_metrics_server
+    from src.personas.initial import get_personas
+    from src.providers.failover import FailoverProvider
+    from src.providers.hedging import HedgedProvider
+    from src.providers.ratelimit import RateLimiter
+    from src.providers.registry import create_provider
+    from src.providers.routing import RoutingPolicy
+    from src.telemetry import configure_telemetry
+
+    console = Console()
     settings = get_settings()
 
     # Check for API key
@@ -78,13 +222,12 @@ async def run_game_cli(args: argparse.Namespace) -> int:
         console.print("Set it in your environment or .env file")
         return 1
 
-    # Load personas
+    # Load personas from the compiled store
     try:
-        from src.personas.initial import get_personas
         personas = get_personas()
-    except ImportError:
-        console.print("[red]Error: No personas defined[/red]")
-        console.print("Create personas in src/personas/initial.py")
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error: Could not load personas: {e}[/red]")
+        console.print("Rebuild the persona store: python -m src.personas.store build")
         return 1
 
     if len(personas) != 10:
@@ -93,10 +236,66 @@ async def run_game_cli(args: argparse.Namespace) -> int:
 
     # Create provider
     model = args.model or settings.model_name
-    provider = GoogleGenAIProvider(
+    provider = create_provider(
+        "google",
         api_key=settings.gemini_api_key,
         model=model,
+        base_url=settings.gemini_base_url or None,
     )
+    if args.failover or settings.failover:
+        if not settings.anthropic_api_key:
+            console.print("[red]Error: --failover needs ANTHROPIC_API_KEY[/red]")
+            return 1
+        fallback = create_provider(
+            "anthropic",
+            api_key=settings.anthropic_api_key,
+            model=settings.fallback_model_name,
+            base_url=settings.anthropic_base_url or None,
+        )
+        provider = FailoverProvider([provider, fallback])
+    rate_limiter = None
+    if args.hedge or settings.hedge_requests:
+        if settings.rate_limit_rps > 0:
+            rate_limiter = RateLimiter(settings.rate_limit_rps)
+        provider = HedgedProvider(
+            provider,
+            percentile=settings.hedge_percentile,
+            rate_limiter=rate_limiter,
+        )
+
+    routing = None
+    routing_file = args.routing or settings.routing_file
+    if routing_file:
+        try:
+            routing = RoutingPolicy.load(routing_file)
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Error: Invalid routing policy {routing_file}: {e}[/red]")
+            return 1
+
+    max_game_seconds = (
+        args.max_game_seconds
+        if args.max_game_seconds is not None
+        else settings.max_game_seconds
+    )
+    retrieved_speeches = (
+        args.retrieve_speeches
+        if args.retrieve_speeches is not None
+        else settings.retrieved_speeches
+    )
+
+    try:
+        transcript_style = TranscriptStyle(args.transcript_style or settings.transcript_style)
+    except ValueError:
+        console.print(f"[red]Error: Unknown transcript style {settings.transcript_style}[/red]")
+        return 1
+
+    monitor = None
+    monitor_port = args.monitor_port or settings.monitor_port or None
+    monitor_file = args.monitor_file or settings.monitor_file or None
+    if monitor_port or monitor_file:
+        monitor = RuntimeMonitor(stall_threshold=settings.monitor_stall_ms / 1000)
+        if rate_limiter is not None:
+            monitor.add_queue("rate_limiter", lambda: rate_limiter.waiting)
 
     # Create game config
     output_dir = args.output or settings.logs_dir
@@ -106,6 +305,16 @@ async def run_game_cli(args: argparse.Namespace) -> int:
         provider=provider,
         output_dir=output_dir,
         seed=args.seed,
+        routing=routing,
+        max_game_seconds=max_game_seconds or None,
+        profile=args.profile,
+        prompt_sizes=args.prompt_sizes,
+        timeline=args.timeline,
+        transcript_style=transcript_style,
+        sessions=args.sessions or settings.player_sessions,
+        summarize_rounds=args.summarize_rounds or settings.summarize_rounds,
+        retrieved_speeches=retrieved_speeches,
+        monitor=monitor,
     )
 
     # Display game start
@@ -121,11 +330,33 @@ async def run_game_cli(args: argparse.Namespace) -> int:
     runner = GameRunner(config)
     runner.event_log.add_observer(_cli_event_reporter(console))
 
+    if monitor:
+        await monitor.start(port=monitor_port, dump_path=monitor_file)
+        if monitor_port:
+            console.print(f"Monitor: http://127.0.0.1:{monitor.port}")
+    metrics_server = None
+    metrics_port = args.metrics_port or settings.metrics_port
+    if metrics_port:
+        metrics_server = await start_metrics_server(metrics_port)
+        console.print(f"Metrics: http://127.0.0.1:{metrics_port}/metrics")
+    telemetry = _build_telemetry(
+        settings, args.telemetry_file or settings.telemetry_file, console
+    )
+    configure_telemetry(telemetry)
     try:
         result = await runner.run()
     except Exception as e:
         console.print(f"[red]Game failed: {e}[/red]")
         raise
+    finally:
+        if telemetry:
+            configure_telemetry(None)
+            await asyncio.to_thread(telemetry.close)
+        if monitor:
+            await monitor.stop()
+        if metrics_server:
+            metrics_server.close()
+            await metrics_server.wait_closed()
 
     # Display result
     winner_color = "green" if result.winner == "town" else "red"
@@ -137,6 +368,16 @@ async def run_game_cli(args: argparse.Namespace) -> int:
         title="Game Complete",
     ))
 
+    if runner.profiler:
+        console.print(runner.profiler.format_table(), markup=False, highlight=False)
+        console.print(f"Profile: {result.profile_path}")
+    if runner.prompt_sizes:
+        report = format_prompt_report(runner.prompt_sizes.summary())
+        console.print(report, markup=False, highlight=False)
+        console.print(f"Prompt sizes: {result.prompt_sizes_path}")
+    if result.timeline_path:
+        console.print(f"Timeline: {result.timeline_path}")
+
     return 0
 
 
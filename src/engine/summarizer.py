@@ -0,0 +1,105 @@
+"""Background LLM summaries of finished day rounds."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+from src.engine.context import ContextBuilder
+from src.engine.prompts import build_round_summary_prompt
+from src.metrics import ROUND_SUMMARIES
+from src.schemas import ActionType
+
+if TYPE_CHECKING:
+    from src.providers.base import PlayerProvider
+    from src.schemas import DayRoundTranscript
+
+logger = logging.getLogger(__name__)
+
+
+class RoundSummarizer:
+    """
+    Summarizes each finished day round in the background.
+
+    `schedule` starts a summary task as soon as a round is finalized, so
+    the provider call overlaps with the following night. Once the round
+    leaves the full-detail window, TranscriptManager attaches the cached
+    summary to its compressed entry; if the summary is not ready (or
+    failed) the compressed entry keeps only the factual outcome.
+    """
+
+    def __init__(
+        self,
+        provider: PlayerProvider,
+        timeout: float = 120.0,
+        max_words: int = 120,
+    ):
+        """
+        Initialize summarizer.
+
+        Args:
+            provider: Provider used for SUMMARIZE calls
+            timeout: Seconds allowed per summary
+            max_words: Length limit given to the model
+        """
+        self.provider = provider
+        self.timeout = timeout
+        self.max_words = max_words
+        self.summaries: dict[int, str] = {}
+        self._tasks: dict[int, asyncio.Task[None]] = {}
+        self._missed: set[int] = set()
+        self._renderer = ContextBuilder()
+
+    def schedule(self, round_transcript: DayRoundTranscript) -> None:
+        """Start summarizing a finalized round (no-op if already scheduled)."""
+        round_number = round_transcript.round_number
+        if round_number in self._tasks or round_number in self.summaries:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop (synchronous callers): fall back to facts only
+            logger.debug("No event loop; round %d will not be summarized", round_number)
+            return
+        self._tasks[round_number] = loop.create_task(
+            self._summarize(round_transcript), name=f"summarize-day-{round_number}"
+        )
+
+    def get(self, round_number: int) -> str | None:
+        """Cached summary of a round, or None if it is not ready."""
+        summary = self.summaries.get(round_number)
+        if summary is None and round_number not in self._missed:
+            self._missed.add(round_number)
+            ROUND_SUMMARIES.inc(outcome="missed")
+        return summary
+
+    async def wait(self) -> None:
+        """Wait for every scheduled summary to finish."""
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel summaries still in flight (end of game)."""
+        for task in self._tasks.values():
+            task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def _summarize(self, round_transcript: DayRoundTranscript) -> None:
+        round_number = round_transcript.round_number
+        round_text = self._renderer.render_transcript([round_transcript])
+        prompt = build_round_summary_prompt(round_number, round_text, self.max_words)
+        try:
+            async with asyncio.timeout(self.timeout):
+                output = await self.provider.act(ActionType.SUMMARIZE, prompt)
+            summary = str(output.get("summary") or "").strip()
+        except Exception:
+            logger.warning("Summary of day %d failed", round_number, exc_info=True)
+            ROUND_SUMMARIES.inc(outcome="failed")
+            return
+        if not summary:
+            ROUND_SUMMARIES.inc(outcome="failed")
+            return
+        self.summaries[round_number] = summary
+        ROUND_SUMMARIES.inc(outcome="ready")
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from src.engine.retrieval import IndexedSpeech, SpeechIndex
 from src.schemas import (
     CompressedRoundSummary,
     DayRoundTranscript,
@@ -10,17 +13,33 @@ from src.schemas import (
     Transcript,
 )
 
+if TYPE_CHECKING:
+    from src.engine.summarizer import RoundSummarizer
+
 
 class TranscriptManager:
     """
     Manages game transcript with 2-round window.
 
-    - Current and previous round: full detail
+    - Current and previous round: full detail (`full_rounds`)
     - Older rounds: compressed summaries
+
+    Finalized speeches are also added to `speech_index` for relevance
+    retrieval.
     """
 
-    def __init__(self):
-        """Initialize empty transcript manager."""
+    def __init__(self, summarizer: RoundSummarizer | None = None, full_rounds: int = 2):
+        """
+        Initialize empty transcript manager.
+
+        Args:
+            summarizer: Summarizes finalized rounds in the background; its
+                summaries are added to compressed rounds when ready
+            full_rounds: Rounds kept in full detail, current round included
+        """
+        self.summarizer = summarizer
+        self.full_rounds = full_rounds
+        self.speech_index = SpeechIndex()
         self.rounds: list[DayRoundTranscript] = []
         self.current_speeches: list[Speech] = []
         self.current_round_number: int | None = None
@@ -82,8 +101,8 @@ class TranscriptManager:
             result.extend(self.rounds)
         else:
             for round_transcript in self.rounds:
-                if round_transcript.round_number >= current_round - 1:
-                    # Full detail for current and previous round
+                if round_transcript.round_number > current_round - self.full_rounds:
+                    # Full detail for the current round and the ones before it
                     result.append(round_transcript)
                 else:
                     # Compress older rounds
@@ -126,6 +145,10 @@ class TranscriptManager:
         if round_t.revote or round_t.defense_speeches:
             defense_note = "Defense: yes (tie -> revote)"
 
+        summary = None
+        if self.summarizer is not None:
+            summary = self.summarizer.get(round_t.round_number)
+
         return CompressedRoundSummary(
             round_number=round_t.round_number,
             night_death=round_t.night_kill,
@@ -133,6 +156,7 @@ class TranscriptManager:
             vote_result=round_t.revote_outcome or round_t.vote_outcome,
             vote_line=vote_line,
             defense_note=defense_note,
+            summary=summary,
         )
 
     def _has_current_round(self) -> bool:
@@ -154,6 +178,7 @@ class TranscriptManager:
     def clear(self) -> None:
         """Clear all transcript data."""
         self.rounds = []
+        self.speech_index.clear()
         self.current_speeches = []
         self.current_round_number = None
         self.current_night_kill = None
@@ -202,8 +227,29 @@ class TranscriptManager:
             revote_outcome=revote_outcome,
         )
         self.rounds.append(transcript)
+        self._index_round(transcript)
+        if self.summarizer is not None:
+            self.summarizer.schedule(transcript)
         self.current_speeches = []
         self.current_round_number = None
         self.current_night_kill = None
         self.current_last_words = None
         return transcript
+
+    def _index_round(self, round_t: DayRoundTranscript) -> None:
+        """Add a finalized round's speeches, defenses and last words to the index."""
+        number = round_t.round_number
+        for speech in round_t.speeches:
+            self.speech_index.add(
+                IndexedSpeech(number, speech.speaker, speech.text, speech.nomination)
+            )
+        for defense in round_t.defense_speeches or []:
+            self.speech_index.add(
+                IndexedSpeech(number, defense.speaker, defense.text, kind="defense")
+            )
+        outcome = round_t.revote_outcome or round_t.vote_outcome
+        if round_t.last_words and outcome.startswith("eliminated:"):
+            speaker = outcome.split(":", 1)[1]
+            self.speech_index.add(
+                IndexedSpeech(number, speaker, round_t.last_words, kind="last_words")
+            )
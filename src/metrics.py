@@ -0,0 +1,373 @@
+"""
+In-process metrics: counters, gauges and latency histograms.
+
+Metrics are recorded into the process-wide REGISTRY, which can be served in
+Prometheus text format (`start_metrics_server`, or `--metrics-port` on the
+CLI). While a game is running, updates made from its tasks are mirrored into
+that game's own registry (installed with `set_game_metrics`, the same way the
+per-game retry budget is), so each game log gets a snapshot of its own
+numbers rather than the process totals.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import math
+import threading
+from contextvars import ContextVar, Token
+from typing import Any, ClassVar
+
+# Seconds; covers fast fakes through slow thinking-model calls
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+PHASE_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+_game_metrics: ContextVar[MetricsRegistry | None] = ContextVar("game_metrics", default=None)
+
+
+class Metric:
+    """Base class for a named metric family with fixed label names."""
+
+    kind: ClassVar[str] = "untyped"
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        description: str,
+        labels: tuple[str, ...] = (),
+    ):
+        self.registry = registry
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self._values: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, object]) -> tuple[str, ...]:
+        if len(labels) != len(self.labels) or any(name not in labels for name in self.labels):
+            raise ValueError(
+                f"Metric {self.name} takes labels {list(self.labels)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def _game_copy(self) -> Metric | None:
+        game = _game_metrics.get()
+        if game is None or game is self.registry:
+            return None
+        return game.mirror(self)
+
+    def _copy_args(self) -> dict[str, Any]:
+        return {}
+
+    def samples(self) -> list[tuple[dict[str, str], Any]]:
+        """(labels, value) pairs recorded so far."""
+        with self._lock:
+            items = list(self._values.items())
+        return [(dict(zip(self.labels, key, strict=True)), value) for key, value in items]
+
+
+class Counter(Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if amount < 0:
+            raise ValueError(f"Counter {self.name} cannot decrease")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+        game = self._game_copy()
+        if game is not None:
+            game.inc(amount, **labels)  # type: ignore[attr-defined]
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+        game = self._game_copy()
+        if game is not None:
+            game.set(value, **labels)  # type: ignore[attr-defined]
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+        game = self._game_copy()
+        if game is not None:
+            game.inc(amount, **labels)  # type: ignore[attr-defined]
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Histogram(Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        description: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(registry, name, description, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def _copy_args(self) -> dict[str, Any]:
+        return {"buckets": self.buckets}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket counts (last one is +Inf), sum, count
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][bisect.bisect_left(self.buckets, value)] += 1
+            state[1] += value
+            state[2] += 1
+        game = self._game_copy()
+        if game is not None:
+            game.observe(value, **labels)  # type: ignore[attr-defined]
+
+    def count(self, **labels: object) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+
+class MetricsRegistry:
+    """A set of metric families, exportable as Prometheus text or a dict."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(
+        self,
+        cls: type[Metric],
+        name: str,
+        description: str,
+        labels: tuple[str, ...],
+        **kwargs: Any,
+    ) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(self, name, description, labels, **kwargs)
+        if type(metric) is not cls or metric.labels != labels:
+            raise ValueError(f"Metric {name} already registered with a different type or labels")
+        return metric
+
+    def counter(self, name: str, description: str, labels: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, description, labels)
+
+    def gauge(self, name: str, description: str, labels: tuple[str, ...] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, description, labels)
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, description, labels, buckets=buckets)
+
+    def mirror(self, metric: Metric) -> Metric:
+        """This registry's metric with the same definition as `metric`."""
+        return self._get_or_create(
+            type(metric), metric.name, metric.description, metric.labels, **metric._copy_args()
+        )
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines: list[str] = []
+        for metric in sorted(self._metrics.values(), key=lambda m: m.name):
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.description)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for labels, value in sorted(metric.samples(), key=lambda s: sorted(s[0].items())):
+                if isinstance(metric, Histogram):
+                    counts, total, count = value
+                    cumulative = 0
+                    for bound, bucket_count in zip(
+                        (*metric.buckets, math.inf), counts, strict=True
+                    ):
+                        cumulative += bucket_count
+                        le = "+Inf" if bound == math.inf else _format_value(bound)
+                        lines.append(
+                            f"{metric.name}_bucket{_format_labels({**labels, 'le': le})} "
+                            f"{cumulative}"
+                        )
+                    suffix = _format_labels(labels)
+                    lines.append(f"{metric.name}_sum{suffix} {_format_value(total)}")
+                    lines.append(f"{metric.name}_count{suffix} {count}")
+                else:
+                    lines.append(f"{metric.name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-serializable copy of every recorded value (for game logs)."""
+        data: dict[str, Any] = {}
+        for metric in sorted(self._metrics.values(), key=lambda m: m.name):
+            samples = []
+            for labels, value in metric.samples():
+                if isinstance(metric, Histogram):
+                    counts, total, count = value
+                    samples.append({
+                        "labels": labels,
+                        "count": count,
+                        "sum": total,
+                        "buckets": dict(
+                            zip([*map(str, metric.buckets), "+Inf"], counts, strict=True)
+                        ),
+                    })
+                else:
+                    samples.append({"labels": labels, "value": value})
+            if samples:
+                data[metric.name] = {"type": metric.kind, "samples": samples}
+        return data
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def set_game_metrics(registry: MetricsRegistry | None) -> Token[MetricsRegistry | None]:
+    """Mirror metric updates from the current task context into `registry`."""
+    return _game_metrics.set(registry)
+
+
+def reset_game_metrics(token: Token[MetricsRegistry | None]) -> None:
+    """Stop mirroring into the current game's registry."""
+    _game_metrics.reset(token)
+
+
+async def start_metrics_server(
+    port: int, host: str = "127.0.0.1", registry: MetricsRegistry | None = None
+) -> asyncio.Server:
+    """
+    Serve `registry` (default REGISTRY) in Prometheus text format on every path.
+
+    Args:
+        port: Port to listen on (0 = any free port)
+        host: Interface to bind
+
+    Returns:
+        The running server; close() it to stop serving
+    """
+    registry = registry or REGISTRY
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            body = registry.render().encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\ncontent-type: text/plain; version=0.0.4\r\n"
+                + f"content-length: {len(body)}\r\nconnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+REGISTRY = MetricsRegistry()
+
+# PlayerAgent
+AGENT_ACTIONS = REGISTRY.counter(
+    "mafia_agent_actions_total", "Player actions requested", ("action",)
+)
+AGENT_PROVIDER_CALLS = REGISTRY.counter(
+    "mafia_agent_provider_calls_total", "Provider calls made by agents", ("action",)
+)
+AGENT_RETRIES = REGISTRY.counter(
+    "mafia_agent_retries_total", "Re-asks after an invalid answer", ("action",)
+)
+AGENT_VALIDATION_FAILURES = REGISTRY.counter(
+    "mafia_agent_validation_failures_total",
+    "Answers rejected by schema or game-rule validation",
+    ("action", "reason"),
+)
+AGENT_DEFAULTS = REGISTRY.counter(
+    "mafia_agent_defaults_total",
+    "Actions that fell back to the default action",
+    ("action", "reason"),
+)
+
+# Providers
+PROVIDER_LATENCY = REGISTRY.histogram(
+    "mafia_provider_request_seconds",
+    "Latency of individual provider requests",
+    ("provider", "model", "action"),
+)
+PROVIDER_TOKENS = REGISTRY.counter(
+    "mafia_provider_tokens_total", "Tokens reported by the provider", ("provider", "model", "kind")
+)
+PROVIDER_ERRORS = REGISTRY.counter(
+    "mafia_provider_errors_total", "Failed provider requests", ("provider", "error_class")
+)
+PROVIDER_RETRIES = REGISTRY.counter(
+    "mafia_provider_retries_total", "Transport retries", ("provider", "error_class")
+)
+PROVIDER_HEDGES = REGISTRY.counter(
+    "mafia_provider_hedges_total",
+    "Hedged requests (fired = extra request sent, won = extra request answered first, "
+    "cancelled = losing request cancelled)",
+    ("action", "outcome"),
+)
+
+# GameRunner
+GAMES_STARTED = REGISTRY.counter("mafia_games_started_total", "Games started")
+GAMES_FINISHED = REGISTRY.counter("mafia_games_finished_total", "Games finished", ("winner",))
+GAMES_IN_PROGRESS = REGISTRY.gauge("mafia_games_in_progress", "Games currently running")
+PHASE_DURATION = REGISTRY.histogram(
+    "mafia_phase_seconds", "Wall-clock duration of game phases", ("phase",), PHASE_BUCKETS
+)
+ROUND_SUMMARIES = REGISTRY.counter(
+    "mafia_round_summaries_total",
+    "Background round summaries (ready, failed, missed = not ready when needed)",
+    ("outcome",),
+)
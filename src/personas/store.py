@@ -0,0 +1,233 @@
+"""
+Persona store: JSON persona files compiled into one validated cache file.
+
+Each persona is a JSON file in `src/personas/data/` holding an `id`, a list
+of `tags` and the Persona fields (identity, play_style, tactics). `build`
+validates every file once (schema, unique ids and names) and writes
+`personas.compiled.json`. At runtime the store reads only that file and
+builds a Persona the first time its id is looked up, so a game with a
+ten-player roster pays for ten personas however large the store is.
+
+    python -m src.personas.store build     # after adding or editing a persona
+    python -m src.personas.store check     # fails if the compiled file is stale
+    python -m src.personas.store list --tag initial
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from src.schemas import Persona
+
+PERSONA_DIR = Path(__file__).resolve().parent / "data"
+COMPILED_PATH = Path(__file__).resolve().parent / "personas.compiled.json"
+STORE_VERSION = 1
+
+
+def source_digest(source_dir: Path = PERSONA_DIR) -> str:
+    """SHA-256 over every persona source file (names and contents)."""
+    digest = hashlib.sha256()
+    for path in sorted(source_dir.glob("*.json")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def build_store(source_dir: Path = PERSONA_DIR, out: Path = COMPILED_PATH) -> Path:
+    """
+    Validate persona source files and write the compiled store.
+
+    Args:
+        source_dir: Directory of persona JSON files
+        out: Compiled file to write
+
+    Returns:
+        The output path
+
+    Raises:
+        ValueError: If a file is invalid, or ids or player names repeat
+    """
+    entries: list[dict[str, Any]] = []
+    ids: set[str] = set()
+    names: set[str] = set()
+    for path in sorted(source_dir.glob("*.json")):
+        try:
+            data = json.loads(path.read_text())
+            persona_id = data.pop("id", path.stem)
+            tags = data.pop("tags", [])
+            persona = Persona.model_validate(data)
+        except (json.JSONDecodeError, ValidationError) as e:
+            raise ValueError(f"Invalid persona {path.name}: {e}") from e
+        if persona_id in ids:
+            raise ValueError(f"Duplicate persona id {persona_id!r} in {path.name}")
+        if persona.identity.name in names:
+            raise ValueError(f"Duplicate persona name {persona.identity.name!r} in {path.name}")
+        ids.add(persona_id)
+        names.add(persona.identity.name)
+        entries.append(
+            {
+                "id": persona_id,
+                "name": persona.identity.name,
+                "tags": sorted(set(tags)),
+                "persona": persona.model_dump(),
+            }
+        )
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "version": STORE_VERSION,
+        "source_digest": source_digest(source_dir),
+        "personas": entries,
+    }
+    out.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n")
+    return out
+
+
+class PersonaStore:
+    """Lookup of compiled personas by id, name or tag."""
+
+    def __init__(self, entries: list[dict[str, Any]], source_digest: str = ""):
+        """
+        Initialize store.
+
+        Args:
+            entries: Compiled entries (id, name, tags, persona data)
+            source_digest: Digest of the sources the entries were built from
+        """
+        self.source_digest = source_digest
+        self._entries = {entry["id"]: entry for entry in entries}
+        self._ids_by_name = {entry["name"]: entry["id"] for entry in entries}
+        self._personas: dict[str, Persona] = {}
+
+    @classmethod
+    def load(cls, path: Path = COMPILED_PATH) -> PersonaStore:
+        """
+        Read a compiled store.
+
+        Raises:
+            ValueError: If the file was written by another store version
+        """
+        data = json.loads(Path(path).read_text())
+        if data.get("version") != STORE_VERSION:
+            raise ValueError(
+                f"{path} has store version {data.get('version')}, expected {STORE_VERSION}; "
+                "rebuild it with `python -m src.personas.store build`"
+            )
+        return cls(data["personas"], data.get("source_digest", ""))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, persona_id: object) -> bool:
+        return persona_id in self._entries
+
+    def ids(self, tag: str | None = None) -> list[str]:
+        """Persona ids, optionally only those with a tag."""
+        return [
+            persona_id
+            for persona_id, entry in self._entries.items()
+            if tag is None or tag in entry["tags"]
+        ]
+
+    def tags(self) -> set[str]:
+        return {tag for entry in self._entries.values() for tag in entry["tags"]}
+
+    def entry(self, persona_id: str) -> dict[str, Any]:
+        """Compiled entry (id, name, tags and persona data) without constructing it."""
+        return self._entries[persona_id]
+
+    def get(self, persona_id: str) -> Persona:
+        """
+        Persona by id, built on first lookup.
+
+        Raises:
+            KeyError: If no persona has the id
+        """
+        persona = self._personas.get(persona_id)
+        if persona is None:
+            # Data was validated at build time. model_validate (compiled) is
+            # still faster than a nested model_construct for these models.
+            persona = Persona.model_validate(self._entries[persona_id]["persona"])
+            self._personas[persona_id] = persona
+        return persona
+
+    def by_name(self, name: str) -> Persona:
+        """Persona by player name."""
+        return self.get(self._ids_by_name[name])
+
+    def roster(
+        self, tag: str | None = None, count: int | None = None, seed: int | None = None
+    ) -> dict[str, Persona]:
+        """
+        Select players for a game.
+
+        Args:
+            tag: Only personas with this tag (None = all)
+            count: Number of players to draw at random (None = every match)
+            seed: Seed for the draw
+
+        Returns:
+            Dict mapping player name to Persona, in store order
+
+        Raises:
+            ValueError: If fewer than `count` personas match
+        """
+        ids = self.ids(tag)
+        if count is not None:
+            if count > len(ids):
+                raise ValueError(f"Need {count} personas tagged {tag!r}, store has {len(ids)}")
+            chosen = set(random.Random(seed).sample(ids, count))
+            ids = [persona_id for persona_id in ids if persona_id in chosen]
+        return {self._entries[persona_id]["name"]: self.get(persona_id) for persona_id in ids}
+
+
+@lru_cache
+def default_store() -> PersonaStore:
+    """The compiled store shipped with the package."""
+    return PersonaStore.load(COMPILED_PATH)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Build and inspect the persona store", prog="python -m src.personas.store"
+    )
+    parser.add_argument("command", choices=["build", "check", "list"])
+    parser.add_argument("--source", type=Path, default=PERSONA_DIR, help="Persona JSON files")
+    parser.add_argument("--out", type=Path, default=COMPILED_PATH, help="Compiled store file")
+    parser.add_argument("--tag", default=None, help="Only list personas with this tag")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        try:
+            path = build_store(args.source, args.out)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(f"Wrote {len(PersonaStore.load(path))} personas to {path}")
+        return 0
+
+    store = PersonaStore.load(args.out)
+    if args.command == "check":
+        if store.source_digest != source_digest(args.source):
+            print(f"{args.out} is stale; run `python -m src.personas.store build`", file=sys.stderr)
+            return 1
+        print(f"{args.out} is up to date ({len(store)} personas)")
+        return 0
+
+    for persona_id in store.ids(args.tag):
+        entry = store.entry(persona_id)
+        print(f"{persona_id:<24}{entry['name']:<28}{', '.join(entry['tags'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,7 +10,16 @@ from src.schemas import ActionType, GameState
 class ActionValidationError(Exception):
     """Output validation failed."""
 
-    pass
+    def __init__(self, message: str, reason: str = "invalid"):
+        """
+        Initialize validation error.
+
+        Args:
+            message: Error shown to the model when it is re-asked
+            reason: Short machine-readable cause, used as a metrics label
+        """
+        super().__init__(message)
+        self.reason = reason
 
 
 class ActionHandler:
@@ -69,7 +78,7 @@ class ActionHandler:
         """
         speech = output.get("speech", "")
         if not speech or len(speech.strip()) < 10:
-            raise ActionValidationError("Speech is too short or empty")
+            raise ActionValidationError("Speech is too short or empty", reason="empty_speech")
 
         # Only validate nomination during day phases, not Night Zero
         if not night_zero:
@@ -87,7 +96,7 @@ class ActionHandler:
                     return output
                 else:
                     raise ActionValidationError(
-                        "Nomination 'skip' is only allowed on Day 1."
+                        "Nomination 'skip' is only allowed on Day 1.", reason="skip_not_allowed"
                     )
 
             # Check against living players (case-insensitive)
@@ -103,7 +112,8 @@ class ActionHandler:
                 valid_options.append("skip")
             raise ActionValidationError(
                 f"Invalid nomination '{output.get('nomination', '')}'. "
-                f"Must be one of: {valid_options}"
+                f"Must be one of: {valid_options}",
+                reason="invalid_nomination",
             )
 
         return output
@@ -115,7 +125,7 @@ class ActionHandler:
 
         if vote not in valid_votes:
             raise ActionValidationError(
-                f"Invalid vote '{vote}'. Must be one of: {valid_votes}"
+                f"Invalid vote '{vote}'. Must be one of: {valid_votes}", reason="invalid_vote"
             )
         return output
 
@@ -128,11 +138,13 @@ class ActionHandler:
             return output
         if target not in state.living_players:
             raise ActionValidationError(
-                f"Invalid target '{target}'. Must be a living player or 'skip'."
+                f"Invalid target '{target}'. Must be a living player or 'skip'.",
+                reason="invalid_target",
             )
         if mafia_names and target in mafia_names:
             raise ActionValidationError(
-                f"Invalid target '{target}'. Cannot target Mafia members."
+                f"Invalid target '{target}'. Cannot target Mafia members.",
+                reason="mafia_target",
             )
         return output
 
@@ -143,10 +155,10 @@ class ActionHandler:
         target = output.get("target", "")
         if target not in state.living_players:
             raise ActionValidationError(
-                f"Invalid target '{target}'. Must be a living player."
+                f"Invalid target '{target}'. Must be a living player.", reason="invalid_target"
             )
         if player_name and target == player_name:
-            raise ActionValidationError("Cannot investigate yourself.")
+            raise ActionValidationError("Cannot investigate yourself.", reason="self_target")
         return output
 
     def _validate_doctor_protect(self, output: dict, state: GameState) -> dict:
@@ -154,7 +166,7 @@ class ActionHandler:
         target = output.get("target", "")
         if target not in state.living_players:
             raise ActionValidationError(
-                f"Invalid target '{target}'. Must be a living player."
+                f"Invalid target '{target}'. Must be a living player.", reason="invalid_target"
             )
         return output
 
@@ -2,32 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
 from typing import TYPE_CHECKING
 
-from src.engine.context import ContextBuilder
+from src.engine.context import ContextBuilder, compile_prompt
+from src.metrics import (
+    AGENT_ACTIONS,
+    AGENT_DEFAULTS,
+    AGENT_PROVIDER_CALLS,
+    AGENT_RETRIES,
+    AGENT_VALIDATION_FAILURES,
+)
 from src.players.actions import ActionHandler, ActionValidationError
+from src.players.session import PlayerSession
 from src.providers.base import InvalidResponseError, ProviderError, RetryExhausted
+from src.providers.retry import try_spend_retry
 from src.schemas import ActionType, GameState, PlayerMemory, PlayerResponse, Transcript
 
 if TYPE_CHECKING:
+    from src.engine.events import EventLog
     from src.providers.base import PlayerProvider
+    from src.providers.routing import ActionRouter
     from src.schemas import Persona
 
-# Try to import langfuse, but make it optional
-try:
-    from langfuse.decorators import observe
-
-    LANGFUSE_AVAILABLE = True
-except ImportError:
-    LANGFUSE_AVAILABLE = False
-
-    def observe(name: str | None = None):  # noqa: ARG001
-        """No-op decorator when langfuse is not available."""
-
-        def decorator(func):
-            return func
-
-        return decorator
+# Wall-clock seconds per action, covering every attempt and retry
+DEFAULT_ACTION_DEADLINES: dict[ActionType, float] = {
+    ActionType.SPEAK: 180.0,
+    ActionType.VOTE: 120.0,
+    ActionType.DEFENSE: 120.0,
+    ActionType.LAST_WORDS: 120.0,
+    ActionType.NIGHT_KILL: 120.0,
+    ActionType.INVESTIGATION: 120.0,
+    ActionType.DOCTOR_PROTECT: 120.0,
+}
 
 
 class PlayerAgent:
@@ -46,6 +55,11 @@ class PlayerAgent:
         seat: int,
         provider: PlayerProvider,
         partners: list[str] | None = None,
+        router: ActionRouter | None = None,
+        deadlines: dict[ActionType, float] | None = None,
+        event_log: EventLog | None = None,
+        context_builder: ContextBuilder | None = None,
+        sessions: bool = False,
     ):
         """
         Initialize player agent.
@@ -57,6 +71,13 @@ class PlayerAgent:
             seat: Player's seat number (0-9)
             provider: LLM provider for making calls
             partners: Mafia partner names (if role is mafia)
+            router: Per-game action router (model/thinking/timeout per action)
+            deadlines: Seconds allowed per action type, retries included
+                (defaults to DEFAULT_ACTION_DEADLINES; missing types are unbounded)
+            event_log: Log that receives timeout events
+            context_builder: Prompt builder shared by the game (default: full transcripts)
+            sessions: Keep a provider-side message history and send only what
+                changed since the last turn, instead of rebuilding the context
         """
         self.name = name
         self.persona = persona
@@ -64,12 +85,20 @@ class PlayerAgent:
         self.seat = seat
         self.provider = provider
         self.partners = partners or []
+        self.router = router
+        self.deadlines = DEFAULT_ACTION_DEADLINES if deadlines is None else deadlines
+        self.event_log = event_log
+        # Absolute time.monotonic() deadline for the whole game, set by GameRunner
+        self.game_deadline: float | None = None
 
         # Internal helpers
-        self.context_builder = ContextBuilder()
+        self.context_builder = context_builder or ContextBuilder()
+        # Identity, tactics, playbook and rules, rendered once (shared across games)
+        self.prompt = compile_prompt(name, role, persona)
+        self.sessions = sessions
+        self.session: PlayerSession | None = None
         self.action_handler = ActionHandler()
 
-    @observe(name="player_act")
     async def act(
         self,
         game_state: GameState,
@@ -91,33 +120,106 @@ class PlayerAgent:
         Returns:
             PlayerResponse with output and updated memory
         """
+        AGENT_ACTIONS.inc(action=action_type.value)
+
         # Build role-specific extra context
         extra = self._get_role_extra(memory)
         if action_context:
             extra = {**extra, **action_context}
 
-        # Build context string
-        context = self.context_builder.build_context(
-            player_name=self.name,
-            role=self.role,
-            persona=self.persona,
-            game_state=game_state,
-            transcript=transcript,
-            memory=memory,
-            action_type=action_type,
-            extra=extra or None,
-        )
+        # Build context string (or, in session mode, this turn's message)
+        seen: dict[int, list[str]] = {}
+        if self.sessions:
+            session = self._get_session(extra)
+            context, seen = self.context_builder.build_turn(
+                player_name=self.name,
+                role=self.role,
+                game_state=game_state,
+                transcript=transcript,
+                memory=memory,
+                action_type=action_type,
+                extra=extra or None,
+                seen=session.seen,
+            )
+        else:
+            context = self.context_builder.build_context(
+                player_name=self.name,
+                role=self.role,
+                persona=self.persona,
+                game_state=game_state,
+                transcript=transcript,
+                memory=memory,
+                action_type=action_type,
+                extra=extra or None,
+                compiled=self.prompt,
+            )
+
+        # Get valid output with retries and fallback, bounded by the deadline
+        timeout, reason = self._get_deadline(action_type)
+        answered = False
+        try:
+            if timeout is not None and timeout <= 0:
+                raise TimeoutError
+            async with asyncio.timeout(timeout):
+                output, answered = await self._get_valid_output(
+                    game_state, action_type, context, action_context=action_context
+                )
+        except TimeoutError:
+            output = self._get_timeout_default(game_state, action_type, timeout, reason)
 
-        # Get valid output with retries and fallback
-        output = await self._get_valid_output(
-            game_state, action_type, context, action_context=action_context
-        )
+        # Defaults are not the player's words; their turn is resent next time
+        if self.session is not None and answered:
+            self.session.record(context, json.dumps(output), seen)
 
         # Update memory from SGR output
         updated_memory = self._update_memory(memory, output, action_type)
 
         return PlayerResponse(output=output, updated_memory=updated_memory)
 
+    def _get_session(self, extra: dict) -> PlayerSession:
+        """This player's session, compacted when it has grown too large."""
+        if self.session is None:
+            system = self.context_builder.build_system_prompt(
+                self.name, self.role, self.persona, extra or None, compiled=self.prompt
+            )
+            self.session = PlayerSession(system=system)
+        elif self.session.needs_compaction():
+            self.session.compact()
+        return self.session
+
+    def _get_deadline(self, action_type: ActionType) -> tuple[float | None, str]:
+        """Return (seconds left for this action, which limit applies)."""
+        timeout = self.deadlines.get(action_type)
+        reason = "action_deadline"
+        if self.game_deadline is not None:
+            remaining = self.game_deadline - time.monotonic()
+            if timeout is None or remaining < timeout:
+                timeout = remaining
+                reason = "game_deadline"
+        return timeout, reason
+
+    def _get_timeout_default(
+        self,
+        game_state: GameState,
+        action_type: ActionType,
+        timeout: float | None,
+        reason: str,
+    ) -> dict:
+        """Degrade to the default action and log a timeout event."""
+        AGENT_DEFAULTS.inc(action=action_type.value, reason="timeout")
+        if self.event_log is not None:
+            self.event_log.add_timeout(
+                self.name,
+                action_type.value,
+                reason,
+                max(timeout or 0.0, 0.0),
+                phase=game_state.phase,
+                round_number=game_state.round_number,
+            )
+        return self.action_handler.get_default(
+            action_type, game_state, self.name, mafia_names=self._get_mafia_names()
+        )
+
     def _get_role_extra(self, memory: PlayerMemory) -> dict:
         """Get role-specific extra context from engine-owned memory."""
         if self.role == "mafia" and self.partners:
@@ -136,7 +238,7 @@ class PlayerAgent:
         context: str,
         max_retries: int = 3,
         action_context: dict | None = None,
-    ) -> dict:
+    ) -> tuple[dict, bool]:
         """
         Get valid output with retries and fallback to default.
 
@@ -148,7 +250,7 @@ class PlayerAgent:
             action_context: Action-specific context (for validation flags like night_zero)
 
         Returns:
-            Valid output dict
+            (valid output dict, False if it is the default action)
         """
         # Build mafia_names for validation (Mafia players only)
         mafia_names = self._get_mafia_names()
@@ -156,7 +258,13 @@ class PlayerAgent:
         # Extract night_zero flag for validation
         night_zero = (action_context or {}).get("night_zero", False)
 
+        # Route is picked once per action so retries stay on the same tier
+        route = None
+        if self.router:
+            route = self.router.select(action_type, game_state.phase, self.role)
+
         last_error: str | None = None
+        default_reason = "invalid"
 
         for attempt in range(max_retries):
             try:
@@ -169,7 +277,18 @@ class PlayerAgent:
                     )
 
                 # Get LLM response
-                raw_output = await self.provider.act(action_type, current_context)
+                AGENT_PROVIDER_CALLS.inc(action=action_type.value)
+                kwargs = {"session": self.session} if self.session is not None else {}
+                if route is None:
+                    raw_output = await self.provider.act(action_type, current_context, **kwargs)
+                else:
+                    started = time.monotonic()
+                    try:
+                        raw_output = await self.provider.act(
+                            action_type, current_context, route=route, **kwargs
+                        )
+                    finally:
+                        self.router.record(route, time.monotonic() - started)
 
                 # Validate output with player context
                 validated = self.action_handler.validate(
@@ -180,20 +299,28 @@ class PlayerAgent:
                     mafia_names=mafia_names,
                     night_zero=night_zero,
                 )
-                return validated
+                return validated, True
 
             except (InvalidResponseError, ActionValidationError) as e:
                 last_error = str(e)
-                if attempt < max_retries - 1:
+                reason = getattr(e, "reason", "invalid_response")
+                AGENT_VALIDATION_FAILURES.inc(action=action_type.value, reason=reason)
+                # Re-asks share the game's retry budget with transport retries
+                if attempt < max_retries - 1 and try_spend_retry(include_global=False):
+                    AGENT_RETRIES.inc(action=action_type.value)
                     continue
+                break
             except (ProviderError, RetryExhausted):
                 # Provider-level failure after retries exhausted, fall back to default
+                default_reason = "provider_error"
                 break
 
         # All retries failed or provider error, return default
-        return self.action_handler.get_default(
+        AGENT_DEFAULTS.inc(action=action_type.value, reason=default_reason)
+        default = self.action_handler.get_default(
             action_type, game_state, self.name, mafia_names=mafia_names
         )
+        return default, False
 
     def _get_mafia_names(self) -> list[str] | None:
         """Get list of all Mafia player names (for validation)."""
@@ -215,14 +342,6 @@ class PlayerAgent:
         Returns:
             Updated PlayerMemory
         """
-        new_facts = dict(memory.facts)
-        new_beliefs = dict(memory.beliefs)
-
         # Extract SGR analysis fields
-        if "suspicions" in output:
-            new_beliefs["suspicions"] = output["suspicions"]
-
-        if "strategy" in output:
-            new_beliefs["strategy"] = output["strategy"]
-
-        return PlayerMemory(facts=new_facts, beliefs=new_beliefs)
+        beliefs = {key: output[key] for key in ("suspicions", "strategy") if key in output}
+        return memory.update(beliefs=beliefs)
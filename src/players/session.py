@@ -0,0 +1,60 @@
+"""Per-player conversation sessions (provider-side message history)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class PlayerSession:
+    """
+    Message history one player keeps with the provider across a game.
+
+    The static part of the prompt (identity, playbook, rules) is sent once as
+    the system prompt; each action appends only what changed since the
+    player's previous turn plus the player's answer. Providers send the
+    history as-is, so its prefix stays byte-identical between calls and
+    prefix caching applies. When the history grows past `max_turns`
+    exchanges or `max_chars` characters it is compacted: dropped, so the
+    next turn restates the current transcript window in full.
+    """
+
+    system: str
+    max_turns: int = 20
+    max_chars: int = 32_000
+    # {"role": "user" | "assistant", "content": str}, alternating, user first
+    messages: list[dict[str, str]] = field(default_factory=list)
+    # Transcript lines already sent, per round number
+    seen: dict[int, list[str]] = field(default_factory=dict)
+    compactions: int = 0
+
+    @property
+    def turns(self) -> int:
+        """Completed user/assistant exchanges in the history."""
+        return len(self.messages) // 2
+
+    @property
+    def chars(self) -> int:
+        return len(self.system) + sum(len(message["content"]) for message in self.messages)
+
+    def needs_compaction(self) -> bool:
+        return self.turns >= self.max_turns or self.chars > self.max_chars
+
+    def compact(self) -> None:
+        """Drop the history; the next turn restates the transcript window."""
+        self.messages.clear()
+        self.seen.clear()
+        self.compactions += 1
+
+    def record(self, turn: str, answer: str, seen: dict[int, list[str]]) -> None:
+        """
+        Append a completed exchange.
+
+        Args:
+            turn: User message sent for this action
+            answer: The player's validated output (serialized)
+            seen: Transcript lines sent so far, including this turn's
+        """
+        self.messages.append({"role": "user", "content": turn})
+        self.messages.append({"role": "assistant", "content": answer})
+        self.seen = seen
@@ -1,23 +1,101 @@
-"""LLM provider implementations."""
-
-from src.providers.anthropic import AnthropicProvider
-from src.providers.base import (
-    InvalidResponseError,
-    PlayerProvider,
-    ProviderError,
-    RetryExhausted,
-    RetryExhaustedError,
-    retry_with_backoff,
-)
-from src.providers.google import GoogleGenAIProvider
+"""
+LLM provider implementations.
+
+Names are imported lazily on first attribute access, so importing a
+submodule (or this package) does not load the anthropic and google.genai
+SDKs. See src.providers.registry for creating providers by name.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.providers.anthropic import AnthropicProvider
+    from src.providers.base import (
+        InvalidResponseError,
+        NonRetryableError,
+        PlayerProvider,
+        ProviderError,
+        RetryExhausted,
+        RetryExhaustedError,
+        retry_with_backoff,
+    )
+    from src.providers.failover import CircuitBreaker, CircuitState, FailoverProvider
+    from src.providers.fake import FakeProvider
+    from src.providers.google import GoogleGenAIProvider
+    from src.providers.hedging import HedgedCall, HedgedProvider
+    from src.providers.ratelimit import RateLimiter
+    from src.providers.registry import create_provider, get_provider_class
+    from src.providers.retry import ErrorClass, RetryBudget, RetryPolicy, classify_error
+    from src.providers.routing import ActionRoute, ActionRouter, RouteRule, RoutingPolicy
+
+# Exported name -> defining module
+_EXPORTS: dict[str, str] = {
+    "AnthropicProvider": "src.providers.anthropic",
+    "InvalidResponseError": "src.providers.base",
+    "NonRetryableError": "src.providers.base",
+    "PlayerProvider": "src.providers.base",
+    "ProviderError": "src.providers.base",
+    "RetryExhausted": "src.providers.base",
+    "RetryExhaustedError": "src.providers.base",
+    "retry_with_backoff": "src.providers.base",
+    "CircuitBreaker": "src.providers.failover",
+    "CircuitState": "src.providers.failover",
+    "FailoverProvider": "src.providers.failover",
+    "FakeProvider": "src.providers.fake",
+    "GoogleGenAIProvider": "src.providers.google",
+    "HedgedCall": "src.providers.hedging",
+    "HedgedProvider": "src.providers.hedging",
+    "RateLimiter": "src.providers.ratelimit",
+    "create_provider": "src.providers.registry",
+    "get_provider_class": "src.providers.registry",
+    "ErrorClass": "src.providers.retry",
+    "RetryBudget": "src.providers.retry",
+    "RetryPolicy": "src.providers.retry",
+    "classify_error": "src.providers.retry",
+    "ActionRoute": "src.providers.routing",
+    "ActionRouter": "src.providers.routing",
+    "RouteRule": "src.providers.routing",
+    "RoutingPolicy": "src.providers.routing",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
 
 __all__ = [
+    "ActionRoute",
+    "ActionRouter",
     "AnthropicProvider",
+    "CircuitBreaker",
+    "CircuitState",
+    "ErrorClass",
+    "FailoverProvider",
+    "FakeProvider",
     "GoogleGenAIProvider",
+    "HedgedCall",
+    "HedgedProvider",
     "InvalidResponseError",
+    "NonRetryableError",
     "PlayerProvider",
     "ProviderError",
+    "RateLimiter",
+    "RetryBudget",
     "RetryExhausted",
     "RetryExhaustedError",
+    "RetryPolicy",
+    "RouteRule",
+    "RoutingPolicy",
+    "classify_error",
+    "create_provider",
+    "get_provider_class",
     "retry_with_backoff",
 ]
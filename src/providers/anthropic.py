@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 import anthropic
 from anthropic import APIConnectionError, APIError, AsyncAnthropic
 from pydantic import ValidationError
 
+from src.metrics import PROVIDER_LATENCY, PROVIDER_TOKENS
 from src.providers.base import InvalidResponseError, ProviderError, retry_with_backoff
+from src.providers.routing import ActionRoute
 from src.schemas import (
     ActionType,
     DefenseOutput,
@@ -16,27 +19,14 @@ from src.schemas import (
     InvestigationOutput,
     LastWordsOutput,
     NightKillOutput,
+    RoundSummaryOutput,
     SpeakingOutput,
     VotingOutput,
 )
+from src.telemetry import emit, is_tracing
 
-# Try to import langfuse, but make it optional
-try:
-    from langfuse import Langfuse, observe
-
-    LANGFUSE_AVAILABLE = True
-except ImportError:
-    Langfuse = None  # type: ignore[assignment]
-    LANGFUSE_AVAILABLE = False
-
-    def observe(name: str | None = None, **kwargs: Any) -> Any:  # noqa: ARG001
-        """No-op decorator when langfuse is not available."""
-
-        def decorator(func: Any) -> Any:
-            return func
-
-        return decorator
-
+if TYPE_CHECKING:
+    from src.players.session import PlayerSession
 
 # Map ActionType to output schema class
 ACTION_SCHEMA_MAP: dict[ActionType, type] = {
@@ -47,6 +37,7 @@ ACTION_SCHEMA_MAP: dict[ActionType, type] = {
     ActionType.DOCTOR_PROTECT: DoctorProtectOutput,
     ActionType.LAST_WORDS: LastWordsOutput,
     ActionType.DEFENSE: DefenseOutput,
+    ActionType.SUMMARIZE: RoundSummaryOutput,
 }
 
 _MODEL_PRICING_PER_MILLION: dict[str, dict[str, float]] = {
@@ -61,11 +52,14 @@ class AnthropicProvider:
     Uses function calling (tool_use) to get reliable structured responses.
     """
 
+    provider_name = "anthropic"
+
     def __init__(
         self,
         api_key: str,
         model: str = "claude-haiku-4-5-20251001",
         max_tokens: int = 2048,
+        base_url: str | None = None,
     ):
         """
         Initialize Anthropic provider.
@@ -74,8 +68,10 @@ class AnthropicProvider:
             api_key: Anthropic API key
             model: Model name to use
             max_tokens: Maximum tokens in response
+            base_url: API endpoint override (e.g. a local fake server)
         """
-        self.client = AsyncAnthropic(api_key=api_key)
+        # Retries are handled by retry_with_backoff so they share one budget
+        self.client = AsyncAnthropic(api_key=api_key, base_url=base_url, max_retries=0)
         self.model = model
         self.max_tokens = max_tokens
 
@@ -101,7 +97,6 @@ class AnthropicProvider:
             "input_schema": json_schema,
         }
 
-    @observe(name="llm_call", as_type="generation")
     @retry_with_backoff(
         max_attempts=3,
         base_delay=1.0,
@@ -111,6 +106,8 @@ class AnthropicProvider:
         self,
         action_type: ActionType,
         context: str,
+        route: ActionRoute | None = None,
+        session: PlayerSession | None = None,
     ) -> dict:
         """
         Execute a player action via Claude.
@@ -118,23 +115,60 @@ class AnthropicProvider:
         Args:
             action_type: Type of action (determines output schema)
             context: Full assembled context/prompt string from ContextBuilder
+            route: Optional per-call model and timeout overrides. The thinking
+                level is ignored: extended thinking cannot be combined with a
+                forced tool_choice.
+            session: Player's message history. Its system prompt and the end
+                of the history are marked as cache breakpoints, so each call
+                reuses the prefix cached by the player's previous call.
 
         Returns:
             Raw structured output dict from Claude
         """
         tool = self._build_tool_for_action(action_type)
-
+        route = route or ActionRoute()
+        model = route.model or self.model
+        request_options: dict[str, Any] = {}
+        if route.timeout is not None:
+            request_options["timeout"] = route.timeout
+
+        system: Any = context
+        messages: list[dict[str, Any]] = [
+            {"role": "user", "content": "Execute your action using the tool."}
+        ]
+        if session is not None:
+            system = [
+                {"type": "text", "text": session.system, "cache_control": {"type": "ephemeral"}}
+            ]
+            messages = [*session.messages, {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": context, "cache_control": {"type": "ephemeral"}}
+                ],
+            }]
+
+        started_at = time.time()
+        started = time.perf_counter()
         try:
             response = await self.client.messages.create(
-                model=self.model,
+                model=model,
                 max_tokens=self.max_tokens,
-                system=context,
-                messages=[{"role": "user", "content": "Execute your action using the tool."}],
+                system=system,
+                messages=messages,
                 tools=[tool],
                 tool_choice={"type": "tool", "name": tool["name"]},
+                **request_options,
             )
         except anthropic.BadRequestError as e:
             raise ProviderError(f"Bad request to Anthropic API: {e}") from e
+        finally:
+            latency = time.perf_counter() - started
+            PROVIDER_LATENCY.observe(
+                latency,
+                provider=self.provider_name,
+                model=model,
+                action=action_type.value,
+            )
 
         # Extract tool use result
         tool_use_block = None
@@ -152,13 +186,20 @@ class AnthropicProvider:
         except ValidationError as e:
             raise InvalidResponseError(f"Invalid response schema: {e}") from e
 
-        self._record_usage(response)
-        return parsed.model_dump()
-
-    def _record_usage(self, response: Any) -> None:
-        if not LANGFUSE_AVAILABLE:
-            return
+        output = parsed.model_dump()
+        timing = {"start_time": started_at, "end_time": started_at + latency, "latency": latency}
+        self._record_usage(response, model, action_type, context, output, timing)
+        return output
 
+    def _record_usage(
+        self,
+        response: Any,
+        model: str | None = None,
+        action_type: ActionType | None = None,
+        context: str | None = None,
+        output: dict | None = None,
+        timing: dict[str, float] | None = None,
+    ) -> None:
         usage = getattr(response, "usage", None)
         if not usage:
             return
@@ -172,24 +213,33 @@ class AnthropicProvider:
         output_tokens = int(output_tokens or 0)
         total_tokens = input_tokens + output_tokens
 
-        usage_details = {
-            "input": input_tokens,
-            "output": output_tokens,
-            "total": total_tokens,
-        }
-
-        cost_details = self._estimate_cost(input_tokens, output_tokens)
+        model = model or self.model
+        PROVIDER_TOKENS.inc(input_tokens, provider=self.provider_name, model=model, kind="input")
+        PROVIDER_TOKENS.inc(output_tokens, provider=self.provider_name, model=model, kind="output")
+        for kind in ("cache_read", "cache_creation"):
+            cached = getattr(usage, f"{kind}_input_tokens", None)
+            if isinstance(cached, int) and cached:
+                PROVIDER_TOKENS.inc(cached, provider=self.provider_name, model=model, kind=kind)
+        if not is_tracing():
+            return
 
-        Langfuse().update_current_generation(
-            model=self.model,
-            usage_details=usage_details,
-            cost_details=cost_details,
-        )
+        # Handed to the background exporter; never blocks the call
+        emit({
+            "type": "generation",
+            "provider": self.provider_name,
+            "model": model,
+            "action": action_type.value if action_type else None,
+            "input": context,
+            "output": output,
+            "usage": {"input": input_tokens, "output": output_tokens, "total": total_tokens},
+            "cost": self._estimate_cost(input_tokens, output_tokens, model),
+            **(timing or {}),
+        })
 
     def _estimate_cost(
-        self, input_tokens: int, output_tokens: int
+        self, input_tokens: int, output_tokens: int, model: str | None = None
     ) -> dict[str, float] | None:
-        pricing = _MODEL_PRICING_PER_MILLION.get(self.model)
+        pricing = _MODEL_PRICING_PER_MILLION.get(model or self.model)
         if not pricing:
             return None
 
@@ -7,7 +7,19 @@ from collections.abc import Callable
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Protocol
 
+from src.metrics import PROVIDER_ERRORS, PROVIDER_RETRIES
+from src.providers.retry import (
+    ErrorClass,
+    RetryPolicy,
+    classify_error,
+    get_retry_after,
+    record_request,
+    try_spend_retry,
+)
+
 if TYPE_CHECKING:
+    from src.players.session import PlayerSession
+    from src.providers.routing import ActionRoute
     from src.schemas import ActionType
 
 
@@ -35,34 +47,63 @@ class InvalidResponseError(ProviderError):
     pass
 
 
+class NonRetryableError(ProviderError):
+    """Request was rejected in a way retrying cannot fix (e.g. a 4xx schema error)."""
+
+    pass
+
+
 def retry_with_backoff(
     max_attempts: int = 3,
     base_delay: float = 1.0,
     exceptions: tuple[type[Exception], ...] = (Exception,),
+    max_delay: float = 30.0,
 ) -> Callable:
     """
-    Decorator for exponential backoff retry.
+    Decorator for retrying with full-jitter exponential backoff.
+
+    Caught errors are classified first: fatal ones (4xx other than 408, 409
+    and 429) raise NonRetryableError immediately, rate limits honour the
+    server's Retry-After hint, and every retry must be paid for from the
+    global and current game retry budgets.
 
     Args:
         max_attempts: Maximum number of retry attempts
-        base_delay: Base delay in seconds (doubles each attempt)
+        base_delay: Base delay in seconds (the jitter cap doubles each attempt)
         exceptions: Tuple of exception types to catch and retry
+        max_delay: Upper bound on the jitter cap
     """
+    policy = RetryPolicy(max_attempts=max_attempts, base_delay=base_delay, max_delay=max_delay)
 
     def decorator(func: Callable) -> Callable:
+        # Metrics label for plain functions; methods use their provider's
+        # `provider_name` so errors and retries line up with latency and tokens
+        default_label = func.__qualname__.split(".")[0]
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            provider = getattr(args[0], "provider_name", default_label) if args else default_label
             last_error: Exception | None = None
-            for attempt in range(max_attempts):
+            record_request()
+            for attempt in range(policy.max_attempts):
                 try:
                     return await func(*args, **kwargs)
                 except exceptions as e:
                     last_error = e
-                    if attempt < max_attempts - 1:
-                        delay = base_delay * (2**attempt)
-                        await asyncio.sleep(delay)
+                    error_class = classify_error(e)
+                    PROVIDER_ERRORS.inc(provider=provider, error_class=error_class.value)
+                    if error_class == ErrorClass.FATAL:
+                        raise NonRetryableError(f"Request rejected: {e}") from e
+                    if attempt == policy.max_attempts - 1:
+                        break
+                    if not try_spend_retry():
+                        raise RetryExhausted(
+                            f"Retry budget exhausted after {attempt + 1} attempts: {e}"
+                        ) from e
+                    PROVIDER_RETRIES.inc(provider=provider, error_class=error_class.value)
+                    await asyncio.sleep(policy.delay(attempt, error_class, get_retry_after(e)))
             raise RetryExhausted(
-                f"Failed after {max_attempts} attempts: {last_error}"
+                f"Failed after {policy.max_attempts} attempts: {last_error}"
             ) from last_error
 
         return wrapper
@@ -82,13 +123,21 @@ class PlayerProvider(Protocol):
         self,
         action_type: ActionType,
         context: str,
+        route: ActionRoute | None = None,
+        session: PlayerSession | None = None,
     ) -> dict:
         """
         Execute a player action via LLM.
 
         Args:
             action_type: Type of action (determines output schema)
-            context: Full assembled context/prompt string from ContextBuilder
+            context: Full assembled context/prompt string from ContextBuilder,
+                or only this turn's message when a session is given
+            route: Optional per-call overrides (model, thinking level, timeout).
+                Callers only pass it when routing is configured.
+            session: Player's message history (session mode): its system
+                prompt and messages are sent before `context`. Callers only
+                pass it in session mode.
 
         Returns:
             Validated structured output dict from LLM
@@ -0,0 +1,265 @@
+"""Circuit-breaking failover across several providers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import replace
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from src.providers.base import InvalidResponseError, ProviderError
+
+if TYPE_CHECKING:
+    from src.players.session import PlayerSession
+    from src.providers.base import PlayerProvider
+    from src.providers.routing import ActionRoute
+    from src.schemas import ActionType
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Healthy, requests flow
+    OPEN = "open"  # Failing, requests are skipped until the cooldown ends
+    HALF_OPEN = "half_open"  # Cooldown over, one probe request allowed
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker with a rolling outcome window.
+
+    The circuit opens after `failure_threshold` consecutive failures, or when
+    the error rate over the last `window` calls reaches `error_rate` (once at
+    least `min_calls` outcomes are known). After `cooldown` seconds a single
+    probe is let through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        error_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < error_rate <= 1:
+            raise ValueError(f"Error rate must be in (0, 1], got {error_rate}")
+        self.failure_threshold = failure_threshold
+        self.error_rate = error_rate
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window)  # True = success
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self.opened_count = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at >= self.cooldown:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    @property
+    def current_error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def allow(self) -> bool:
+        """True if a request may be sent now; claims the probe when half open."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def release(self) -> None:
+        """Give back a claimed probe whose request never completed."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        self._outcomes.append(True)
+        self._consecutive_failures = 0
+        if self._opened_at is not None:
+            # Probe succeeded: start over with a clean window
+            self._opened_at = None
+            self._probing = False
+            self._outcomes.clear()
+
+    def record_failure(self) -> None:
+        self._outcomes.append(False)
+        self._consecutive_failures += 1
+        if self._opened_at is not None:
+            # Probe failed: wait a full cooldown again
+            self._opened_at = self._clock()
+            self._probing = False
+            return
+        too_many = self._consecutive_failures >= self.failure_threshold
+        too_often = (
+            len(self._outcomes) >= self.min_calls
+            and self.current_error_rate >= self.error_rate
+        )
+        if too_many or too_often:
+            self._opened_at = self._clock()
+            self.opened_count += 1
+
+
+class ProviderHealth:
+    """Breaker plus latency and error counters for one provider."""
+
+    def __init__(self, name: str, breaker: CircuitBreaker, latency_alpha: float = 0.2):
+        self.name = name
+        self.breaker = breaker
+        self.latency_alpha = latency_alpha
+        self.latency: float | None = None  # EWMA of successful call latency
+        self.calls = 0
+        self.failures = 0
+
+    def record_success(self, latency: float) -> None:
+        self.calls += 1
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.latency_alpha * (latency - self.latency)
+        self.breaker.record_success()
+
+    def record_failure(self) -> None:
+        self.calls += 1
+        self.failures += 1
+        self.breaker.record_failure()
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "state": self.breaker.state.value,
+            "calls": self.calls,
+            "failures": self.failures,
+            "error_rate": round(self.breaker.current_error_rate, 3),
+            "latency": round(self.latency, 3) if self.latency is not None else None,
+            "opened": self.breaker.opened_count,
+        }
+
+
+class FailoverProvider:
+    """
+    PlayerProvider over an ordered list of providers.
+
+    Each call goes to the first provider whose circuit allows it; provider
+    failures are recorded and the next provider is tried. Invalid answers
+    (schema problems) are passed straight back so the agent can re-ask.
+    Route model overrides only apply to the primary provider, since model
+    names are provider-specific.
+    """
+
+    def __init__(
+        self,
+        providers: list[PlayerProvider],
+        *,
+        breaker_factory: Callable[[], CircuitBreaker] = CircuitBreaker,
+    ):
+        """
+        Initialize failover router.
+
+        Args:
+            providers: Providers in order of preference
+            breaker_factory: Builds one circuit breaker per provider
+        """
+        if not providers:
+            raise ValueError("FailoverProvider needs at least one provider")
+        self.providers = providers
+        self.health = [
+            ProviderHealth(self._name(index, provider), breaker_factory())
+            for index, provider in enumerate(providers)
+        ]
+        self.failovers = 0
+        self._observers: list[Callable[[str, str, BaseException], None]] = []
+
+    @staticmethod
+    def _name(index: int, provider: PlayerProvider) -> str:
+        model = getattr(provider, "model", None)
+        return f"{index}:{model}" if isinstance(model, str) else str(index)
+
+    @property
+    def model(self) -> Any:
+        """Expose the primary provider's model for game logs."""
+        return getattr(self.providers[0], "model", "unknown")
+
+    def add_observer(self, observer: Callable[[str, str, BaseException], None]) -> None:
+        """Register an observer called as (failed, next_in_line, error) on failures."""
+        self._observers.append(observer)
+
+    async def act(
+        self,
+        action_type: ActionType,
+        context: str,
+        route: ActionRoute | None = None,
+        session: PlayerSession | None = None,
+    ) -> dict:
+        """Execute a player action on the healthiest available provider."""
+        last_error: BaseException | None = None
+        tried = 0
+        for index, (provider, health) in enumerate(
+            zip(self.providers, self.health, strict=True)
+        ):
+            if not health.breaker.allow():
+                continue
+            tried += 1
+            kwargs: dict[str, Any] = {}
+            if route is not None:
+                kwargs["route"] = route if index == 0 else replace(route, model=None)
+            if session is not None:
+                kwargs["session"] = session
+            started = time.monotonic()
+            try:
+                result = await provider.act(action_type, context, **kwargs)
+            except asyncio.CancelledError:
+                health.breaker.release()
+                raise
+            except InvalidResponseError:
+                # The provider answered; the answer was bad
+                health.record_success(time.monotonic() - started)
+                raise
+            except Exception as e:  # noqa: BLE001
+                health.record_failure()
+                last_error = e
+                self._report(health.name, index, e)
+                continue
+            health.record_success(time.monotonic() - started)
+            if index > 0:
+                self.failovers += 1
+            return result
+
+        if last_error is None:
+            raise ProviderError(f"All {len(self.providers)} provider circuits are open")
+        raise ProviderError(
+            f"All {tried} available providers failed: {last_error}"
+        ) from last_error
+
+    def _report(self, failed: str, index: int, error: BaseException) -> None:
+        if not self._observers:
+            return
+        following = self.health[index + 1].name if index + 1 < len(self.health) else ""
+        logger = logging.getLogger(__name__)
+        for observer in list(self._observers):
+            try:
+                observer(failed, following, error)
+            except Exception:
+                logger.exception("Failover observer failed")
+
+    def summary(self) -> dict[str, Any]:
+        """Per-provider health and failover count."""
+        return {
+            "failovers": self.failovers,
+            "providers": {health.name: health.summary() for health in self.health},
+        }
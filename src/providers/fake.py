@@ -0,0 +1,150 @@
+"""Offline provider stand-in with fault injection, for tests and load runs."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+from typing import TYPE_CHECKING
+
+from src.providers.base import ProviderError
+from src.schemas import (
+    ActionType,
+    DefenseOutput,
+    DoctorProtectOutput,
+    InvestigationOutput,
+    LastWordsOutput,
+    NightKillOutput,
+    RoundSummaryOutput,
+    SpeakingOutput,
+    VotingOutput,
+)
+
+if TYPE_CHECKING:
+    from src.players.session import PlayerSession
+    from src.providers.routing import ActionRoute
+
+ACTION_SCHEMA_MAP: dict[ActionType, type] = {
+    ActionType.SPEAK: SpeakingOutput,
+    ActionType.VOTE: VotingOutput,
+    ActionType.NIGHT_KILL: NightKillOutput,
+    ActionType.INVESTIGATION: InvestigationOutput,
+    ActionType.DOCTOR_PROTECT: DoctorProtectOutput,
+    ActionType.LAST_WORDS: LastWordsOutput,
+    ActionType.DEFENSE: DefenseOutput,
+    ActionType.SUMMARIZE: RoundSummaryOutput,
+}
+
+# Output field holding the chosen player for each targeted action
+TARGET_FIELDS: dict[ActionType, str] = {
+    ActionType.SPEAK: "nomination",
+    ActionType.VOTE: "vote",
+    ActionType.NIGHT_KILL: "target",
+    ActionType.INVESTIGATION: "target",
+    ActionType.DOCTOR_PROTECT: "target",
+}
+
+# Matches "Valid targets: ...", "Valid vote options: ...", "Valid nomination targets: ..."
+_OPTIONS_RE = re.compile(r"^Valid [a-z ]+: (.+)$", re.MULTILINE)
+
+
+def parse_valid_options(context: str) -> list[str]:
+    """
+    Extract the legal targets listed in an action prompt.
+
+    Args:
+        context: Full prompt built by ContextBuilder
+
+    Returns:
+        Option names in prompt order (empty if the prompt lists none)
+    """
+    matches = _OPTIONS_RE.findall(context)
+    if not matches:
+        return []
+    return [option.strip() for option in matches[-1].split(",") if option.strip()]
+
+
+def build_fake_output(
+    action_type: ActionType, context: str, rng: random.Random | None = None
+) -> dict:
+    """
+    Build a schema-valid output for an action, choosing a legal target.
+
+    Args:
+        action_type: Type of action (determines output schema)
+        context: Prompt to read valid targets from
+        rng: Random source for target choice
+
+    Returns:
+        Output dict that validates against the action's schema
+    """
+    rng = rng or random.Random()
+    schema_class = ACTION_SCHEMA_MAP[action_type]
+    target_field = TARGET_FIELDS.get(action_type)
+    output: dict[str, str] = {}
+    for name in schema_class.model_fields:
+        if name == target_field:
+            options = parse_valid_options(context)
+            # Prefer a real player so fake games make progress
+            players = [o for o in options if o.lower() != "skip"]
+            output[name] = rng.choice(players or options or ["skip"])
+        else:
+            output[name] = f"Fake {name.replace('_', ' ')}."
+    return schema_class.model_validate(output).model_dump()
+
+
+class FakeProvider:
+    """
+    PlayerProvider that answers locally, with injectable latency and errors.
+
+    Answers are schema-valid and pick targets from the prompt's "Valid ..."
+    line, so games run end to end without network access.
+    """
+
+    def __init__(
+        self,
+        *,
+        model: str = "fake",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error: type[Exception] = ProviderError,
+        seed: int | None = None,
+    ):
+        """
+        Initialize fake provider.
+
+        Args:
+            model: Name reported in game logs
+            latency: Base seconds per call
+            jitter: Extra uniform random seconds per call
+            error_rate: Probability (0-1) that a call raises `error`
+            error: Exception type raised for injected failures
+            seed: Seed for latency, error and target choices
+        """
+        self.model = model
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error = error
+        self.down = False  # While True every call fails
+        self.calls = 0
+        self.failures = 0
+        self._rng = random.Random(seed)
+
+    async def act(
+        self,
+        action_type: ActionType,
+        context: str,
+        route: ActionRoute | None = None,
+        session: PlayerSession | None = None,
+    ) -> dict:
+        """Return a fake structured output after the configured latency."""
+        self.calls += 1
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.down or (self.error_rate and self._rng.random() < self.error_rate):
+            self.failures += 1
+            raise self.error(f"Injected failure from {self.model}")
+        return build_fake_output(action_type, context, self._rng)
@@ -0,0 +1,372 @@
+"""
+Local wire-compatible fake of the Anthropic and Gemini HTTP APIs.
+
+Speaks enough of `POST /v1/messages` (forced tool_use) and
+`POST /v1beta/models/{model}:generateContent` (JSON schema output) for the
+real SDK clients to run against it, with configurable latency, server
+errors and 429 rate limiting. Used for offline load tests:
+
+    python -m src.providers.fake_server --port 8765 --latency 0.8 --error-rate 0.02
+
+then point the providers at it with ANTHROPIC_BASE_URL / GEMINI_BASE_URL.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from src.providers.fake import ACTION_SCHEMA_MAP, build_fake_output
+from src.schemas import ActionType
+
+# Gemini requests carry only the JSON schema, so the action is recovered from its fields
+_ACTION_BY_FIELDS: dict[frozenset[str], ActionType] = {
+    frozenset(schema.model_fields): action for action, schema in ACTION_SCHEMA_MAP.items()
+}
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+@dataclass
+class FakeServerConfig:
+    """Behaviour of the fake server."""
+
+    latency: float = 0.0  # Median response latency in seconds
+    latency_sigma: float = 0.0  # Log-normal spread (0 = fixed latency)
+    error_rate: float = 0.0  # Probability of a 500/503 response
+    rate_limit_rps: float = 0.0  # Server-side token bucket; 0 disables 429s
+    rate_limit_burst: int | None = None
+    retry_after: float = 1.0  # Retry-After seconds sent with 429s
+    seed: int | None = None
+
+
+class FakeLLMServer:
+    """
+    Asyncio HTTP/1.1 server answering Anthropic and Gemini requests.
+
+    Connections are kept alive so client-side pooling behaves as it would
+    against the real APIs; `connections` counts accepted sockets.
+    """
+
+    def __init__(
+        self,
+        config: FakeServerConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.config = config or FakeServerConfig()
+        self.host = host
+        self.port = port
+        self._rng = random.Random(self.config.seed)
+        self._server: asyncio.Server | None = None
+        self._handlers: set[asyncio.Task] = set()
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.statuses: Counter[int] = Counter()
+
+    @property
+    def _burst(self) -> int:
+        if self.config.rate_limit_burst is not None:
+            return self.config.rate_limit_burst
+        return max(1, int(self.config.rate_limit_rps))
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # Idle keep-alive connections would otherwise outlive the server
+            for handler in list(self._handlers):
+                handler.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> FakeLLMServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "connections": self.connections,
+            "requests": sum(self.statuses.values()),
+            "max_in_flight": self.max_in_flight,
+            "statuses": dict(self.statuses),
+        }
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        handler = asyncio.current_task()
+        if handler is not None:
+            self._handlers.add(handler)
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, body = request
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                try:
+                    status, payload, headers = await self._dispatch(method, path, body)
+                finally:
+                    self.in_flight -= 1
+                self.statuses[status] += 1
+                writer.write(_encode_response(status, payload, headers))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._handlers.discard(handler)
+            writer.close()
+
+    async def _dispatch(
+        self, method: str, path: str, body: bytes
+    ) -> tuple[int, dict, dict[str, str]]:
+        path = path.split("?", 1)[0]
+        if method != "POST":
+            return 404, _error_body("", 404, "Not found"), {}
+        if path == "/v1/messages":
+            api = "anthropic"
+        elif path.endswith(":generateContent") and "/models/" in path:
+            api = "gemini"
+        else:
+            return 404, _error_body("", 404, "Not found"), {}
+
+        if not self._take_token():
+            retry_after = f"{self.config.retry_after:g}"
+            return 429, _error_body(api, 429, "Rate limited"), {"retry-after": retry_after}
+
+        await asyncio.sleep(self._sample_latency())
+
+        if self.config.error_rate and self._rng.random() < self.config.error_rate:
+            status = self._rng.choice((500, 503))
+            return status, _error_body(api, status, "Injected server error"), {}
+
+        try:
+            request = json.loads(body or b"{}")
+            if api == "anthropic":
+                return 200, self._anthropic_response(request), {}
+            model = path.rsplit("/models/", 1)[1].split(":", 1)[0]
+            return 200, self._gemini_response(model, request), {}
+        except (ValueError, KeyError, TypeError) as e:
+            return 400, _error_body(api, 400, f"Invalid request: {e}"), {}
+
+    def _take_token(self) -> bool:
+        rate = self.config.rate_limit_rps
+        if rate <= 0:
+            return True
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _sample_latency(self) -> float:
+        if self.config.latency <= 0:
+            return 0.0
+        if self.config.latency_sigma <= 0:
+            return self.config.latency
+        return self._rng.lognormvariate(math.log(self.config.latency), self.config.latency_sigma)
+
+    def _anthropic_response(self, request: dict) -> dict:
+        tool_name = request["tool_choice"]["name"]
+        action_type = ActionType(tool_name)
+        system = request.get("system") or ""
+        if isinstance(system, list):
+            system = "\n".join(block.get("text", "") for block in system)
+        # Session requests carry the action prompt in the last user message
+        messages = request.get("messages") or []
+        last = messages[-1].get("content", "") if messages else ""
+        if isinstance(last, list):
+            last = "\n".join(block.get("text", "") for block in last)
+        system = f"{system}\n{last}"
+        output = build_fake_output(action_type, system, self._rng)
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": request.get("model", "fake"),
+            "content": [
+                {
+                    "type": "tool_use",
+                    "id": f"toolu_{uuid.uuid4().hex[:24]}",
+                    "name": tool_name,
+                    "input": output,
+                }
+            ],
+            "stop_reason": "tool_use",
+            "stop_sequence": None,
+            "usage": {
+                "input_tokens": _count_tokens(system),
+                "output_tokens": _count_tokens(json.dumps(output)),
+            },
+        }
+
+    def _gemini_response(self, model: str, request: dict) -> dict:
+        generation_config = request.get("generationConfig") or {}
+        schema = (
+            generation_config.get("responseJsonSchema")
+            or generation_config.get("responseSchema")
+            or {}
+        )
+        action_type = _ACTION_BY_FIELDS[frozenset(schema.get("properties", {}))]
+        prompt = "\n".join(
+            part.get("text", "")
+            for content in request.get("contents", [])
+            for part in content.get("parts", [])
+        )
+        text = json.dumps(build_fake_output(action_type, prompt, self._rng))
+        prompt_tokens = _count_tokens(prompt)
+        output_tokens = _count_tokens(text)
+        return {
+            "candidates": [
+                {
+                    "content": {"role": "model", "parts": [{"text": text}]},
+                    "finishReason": "STOP",
+                    "index": 0,
+                }
+            ],
+            "usageMetadata": {
+                "promptTokenCount": prompt_tokens,
+                "candidatesTokenCount": output_tokens,
+                "totalTokenCount": prompt_tokens + output_tokens,
+            },
+            "modelVersion": model,
+        }
+
+
+def _count_tokens(text: str) -> int:
+    # Rough 4-characters-per-token estimate, enough for usage accounting
+    return max(1, len(text) // 4)
+
+
+_ANTHROPIC_ERROR_TYPES = {
+    400: "invalid_request_error",
+    404: "not_found_error",
+    429: "rate_limit_error",
+}
+_GEMINI_ERROR_STATUSES = {
+    400: "INVALID_ARGUMENT",
+    404: "NOT_FOUND",
+    429: "RESOURCE_EXHAUSTED",
+    500: "INTERNAL",
+    503: "UNAVAILABLE",
+}
+
+
+def _error_body(api: str, status: int, message: str) -> dict:
+    if api == "anthropic":
+        error_type = _ANTHROPIC_ERROR_TYPES.get(status, "api_error")
+        return {"type": "error", "error": {"type": error_type, "message": message}}
+    return {
+        "error": {"code": status, "message": message, "status": _GEMINI_ERROR_STATUSES[status]}
+    }
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes] | None:
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    lines = head.decode("latin-1").split("\r\n")
+    method, path, _ = lines[0].split(" ", 2)
+    length = 0
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value.strip())
+    body = await reader.readexactly(length) if length else b""
+    return method, path, body
+
+
+def _encode_response(status: int, payload: dict, headers: dict[str, str]) -> bytes:
+    body = json.dumps(payload).encode()
+    lines = [
+        f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}",
+        "content-type: application/json",
+        f"content-length: {len(body)}",
+        "connection: keep-alive",
+        *(f"{name}: {value}" for name, value in headers.items()),
+    ]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run a local fake of the Anthropic and Gemini APIs",
+        prog="python -m src.providers.fake_server",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Median latency (s)")
+    parser.add_argument(
+        "--latency-sigma", type=float, default=0.0, help="Log-normal latency spread"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Probability of a 500/503"
+    )
+    parser.add_argument(
+        "--rate-limit-rps", type=float, default=0.0, help="Requests/s before 429s (0 = off)"
+    )
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    config = FakeServerConfig(
+        latency=args.latency,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        rate_limit_rps=args.rate_limit_rps,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    server = FakeLLMServer(config, host=args.host, port=args.port)
+    print(f"Fake LLM server on {server.base_url}")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(server.serve_forever())
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 from google import genai
 from google.genai import types
 from pydantic import ValidationError
 
+from src.metrics import PROVIDER_LATENCY, PROVIDER_TOKENS
 from src.providers.base import InvalidResponseError, ProviderError, retry_with_backoff
+from src.providers.routing import ActionRoute
 from src.schemas import (
     ActionType,
     DefenseOutput,
@@ -17,26 +20,14 @@ from src.schemas import (
     InvestigationOutput,
     LastWordsOutput,
     NightKillOutput,
+    RoundSummaryOutput,
     SpeakingOutput,
     VotingOutput,
 )
+from src.telemetry import emit, is_tracing
 
-# Try to import langfuse, but make it optional
-try:
-    from langfuse import Langfuse, observe
-
-    LANGFUSE_AVAILABLE = True
-except ImportError:
-    Langfuse = None  # type: ignore[assignment]
-    LANGFUSE_AVAILABLE = False
-
-    def observe(name: str | None = None, **kwargs: Any) -> Any:  # noqa: ARG001
-        """No-op decorator when langfuse is not available."""
-
-        def decorator(func: Any) -> Any:
-            return func
-
-        return decorator
+if TYPE_CHECKING:
+    from src.players.session import PlayerSession
 
 # Gemini pricing per million tokens (as of Jan 2025)
 _MODEL_PRICING_PER_MILLION: dict[str, dict[str, float]] = {
@@ -51,47 +42,67 @@ ACTION_SCHEMA_MAP: dict[ActionType, type] = {
     ActionType.DOCTOR_PROTECT: DoctorProtectOutput,
     ActionType.LAST_WORDS: LastWordsOutput,
     ActionType.DEFENSE: DefenseOutput,
+    ActionType.SUMMARIZE: RoundSummaryOutput,
 }
 
 
 class GoogleGenAIProvider:
     """Google GenAI provider using response_json_schema for structured output."""
 
+    provider_name = "gemini"
+
     def __init__(
         self,
         api_key: str,
         model: str = "gemini-3-flash-preview",
+        thinking_level: str = "HIGH",
+        base_url: str | None = None,
     ) -> None:
-        self.client = genai.Client(api_key=api_key)
+        http_options = types.HttpOptions(base_url=base_url) if base_url else None
+        self.client = genai.Client(api_key=api_key, http_options=http_options)
         self.model = model
+        self.thinking_level = thinking_level
 
-    async def _generate_content(self, *, contents: str, config: dict[str, Any]) -> Any:
+    async def _generate_content(
+        self, *, model: str, contents: Any, config: dict[str, Any]
+    ) -> Any:
         async_client = getattr(self.client, "aio", None)
         if async_client and hasattr(async_client.models, "generate_content"):
             return await async_client.models.generate_content(
-                model=self.model,
+                model=model,
                 contents=contents,
                 config=config,
             )
         return await asyncio.to_thread(
             self.client.models.generate_content,
-            model=self.model,
+            model=model,
             contents=contents,
             config=config,
         )
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0, exceptions=(ProviderError,))
-    async def _request(self, *, contents: str, config: dict[str, Any]) -> Any:
+    async def _request(
+        self, *, model: str, contents: Any, config: dict[str, Any], action: str = "unknown"
+    ) -> Any:
+        started = time.perf_counter()
         try:
-            return await self._generate_content(contents=contents, config=config)
+            return await self._generate_content(model=model, contents=contents, config=config)
         except Exception as e:  # noqa: BLE001
             raise ProviderError(f"GenAI request failed: {e}") from e
+        finally:
+            PROVIDER_LATENCY.observe(
+                time.perf_counter() - started,
+                provider=self.provider_name,
+                model=model,
+                action=action,
+            )
 
-    @observe(name="llm_call", as_type="generation")
     async def act(
         self,
         action_type: ActionType,
         context: str,
+        route: ActionRoute | None = None,
+        session: PlayerSession | None = None,
     ) -> dict:
         """
         Execute a player action via Gemini.
@@ -99,20 +110,46 @@ class GoogleGenAIProvider:
         Args:
             action_type: Type of action (determines output schema)
             context: Full assembled context/prompt string from ContextBuilder
+            route: Optional per-call model, thinking level and timeout overrides
+            session: Player's message history, sent as the system instruction
+                and prior turns (an unchanged prefix enables implicit caching)
 
         Returns:
             Raw structured output dict from Gemini
         """
         schema_class = ACTION_SCHEMA_MAP[action_type]
         json_schema = schema_class.model_json_schema()
+        route = route or ActionRoute()
+        model = route.model or self.model
+        thinking_level = route.thinking_level or self.thinking_level
 
-        config = {
+        config: dict[str, Any] = {
             "response_mime_type": "application/json",
             "response_json_schema": json_schema,
-            "thinking_config": types.ThinkingConfig(thinking_level="HIGH"),
+            "thinking_config": types.ThinkingConfig(thinking_level=thinking_level),
         }
-
-        response = await self._request(contents=context, config=config)
+        if route.timeout is not None:
+            # HttpOptions.timeout is in milliseconds
+            config["http_options"] = {"timeout": int(route.timeout * 1000)}
+
+        contents: Any = context
+        if session is not None:
+            config["system_instruction"] = session.system
+            contents = [
+                {
+                    "role": "model" if message["role"] == "assistant" else "user",
+                    "parts": [{"text": message["content"]}],
+                }
+                for message in session.messages
+            ]
+            contents.append({"role": "user", "parts": [{"text": context}]})
+
+        started_at = time.time()
+        started = time.perf_counter()
+        response = await self._request(
+            model=model, contents=contents, config=config, action=action_type.value
+        )
+        latency = time.perf_counter() - started
 
         response_text = getattr(response, "text", None)
         if not response_text:
@@ -123,13 +160,20 @@ class GoogleGenAIProvider:
         except ValidationError as e:
             raise InvalidResponseError(f"Invalid response schema: {e}") from e
 
-        self._record_usage(response)
-        return parsed.model_dump()
-
-    def _record_usage(self, response: Any) -> None:
-        if not LANGFUSE_AVAILABLE:
-            return
+        output = parsed.model_dump()
+        timing = {"start_time": started_at, "end_time": started_at + latency, "latency": latency}
+        self._record_usage(response, model, action_type, context, output, timing)
+        return output
 
+    def _record_usage(
+        self,
+        response: Any,
+        model: str | None = None,
+        action_type: ActionType | None = None,
+        context: str | None = None,
+        output: dict | None = None,
+        timing: dict[str, float] | None = None,
+    ) -> None:
         usage = getattr(response, "usage_metadata", None) or getattr(response, "usage", None)
         if not usage:
             return
@@ -152,24 +196,32 @@ class GoogleGenAIProvider:
         output_tokens = int(output_tokens or 0)
         total_tokens = input_tokens + output_tokens
 
-        usage_details = {
-            "input": input_tokens,
-            "output": output_tokens,
-            "total": total_tokens,
-        }
-
-        cost_details = self._estimate_cost(input_tokens, output_tokens)
+        model = model or self.model
+        PROVIDER_TOKENS.inc(input_tokens, provider=self.provider_name, model=model, kind="input")
+        PROVIDER_TOKENS.inc(output_tokens, provider=self.provider_name, model=model, kind="output")
+        cached = getattr(usage, "cached_content_token_count", None)
+        if isinstance(cached, int) and cached:
+            PROVIDER_TOKENS.inc(cached, provider=self.provider_name, model=model, kind="cache_read")
+        if not is_tracing():
+            return
 
-        Langfuse().update_current_generation(
-            model=self.model,
-            usage_details=usage_details,
-            cost_details=cost_details,
-        )
+        # Handed to the background exporter; never blocks the call
+        emit({
+            "type": "generation",
+            "provider": self.provider_name,
+            "model": model,
+            "action": action_type.value if action_type else None,
+            "input": context,
+            "output": output,
+            "usage": {"input": input_tokens, "output": output_tokens, "total": total_tokens},
+            "cost": self._estimate_cost(input_tokens, output_tokens, model),
+            **(timing or {}),
+        })
 
     def _estimate_cost(
-        self, input_tokens: int, output_tokens: int
+        self, input_tokens: int, output_tokens: int, model: str | None = None
     ) -> dict[str, float] | None:
-        pricing = _MODEL_PRICING_PER_MILLION.get(self.model)
+        pricing = _MODEL_PRICING_PER_MILLION.get(model or self.model)
         if not pricing:
             return None
 
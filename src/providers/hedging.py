@@ -0,0 +1,215 @@
+"""Hedged provider requests to cut tail latency."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from src.metrics import PROVIDER_HEDGES
+
+if TYPE_CHECKING:
+    from src.providers.base import PlayerProvider
+    from src.providers.ratelimit import RateLimiter
+    from src.schemas import ActionType
+
+
+@dataclass
+class HedgedCall:
+    """Per-call record reported by HedgedProvider."""
+
+    action_type: str
+    latency: float  # Seconds from first request to accepted answer (or failure)
+    hedge_delay: float  # Delay the hedge was scheduled at
+    requests: int  # Requests issued, including the first one
+    winner: int | None  # Index of the request whose answer was used (0 = primary)
+    error: str | None = None
+
+    @property
+    def hedged(self) -> bool:
+        return self.requests > 1
+
+
+class HedgedProvider:
+    """
+    Opt-in hedging wrapper for any PlayerProvider.
+
+    If a call has not returned after the learned latency percentile for its
+    action type, a duplicate request is fired. The first successful answer
+    wins and the other request is cancelled. Until enough samples exist, the
+    hedge fires after initial_delay.
+
+    Each successful call adds one latency sample, measured from the call's
+    start to the accepted answer. When a hedge wins, that is also a lower
+    bound on the cancelled primary's latency; timing only the requests that
+    completed, from their own start, would skew the percentile low and fire
+    ever more hedges. Fired, won and cancelled hedges are counted in
+    `mafia_provider_hedges_total`.
+    """
+
+    def __init__(
+        self,
+        provider: PlayerProvider,
+        *,
+        percentile: float = 0.95,
+        initial_delay: float = 10.0,
+        min_delay: float = 0.05,
+        max_hedges: int = 1,
+        window: int = 200,
+        min_samples: int = 20,
+        rate_limiter: RateLimiter | None = None,
+        history: int = 1000,
+    ):
+        """
+        Initialize hedging wrapper.
+
+        Args:
+            provider: Provider to duplicate requests against
+            percentile: Latency percentile (0-1) after which a hedge fires
+            initial_delay: Hedge delay before min_samples latencies are known
+            min_delay: Lower bound on the hedge delay
+            max_hedges: Maximum extra requests per call
+            window: Latency samples kept per action type
+            min_samples: Samples needed before the learned delay is used
+            rate_limiter: Shared limiter; every request (hedges included) takes a token
+            history: Per-call records kept in memory
+        """
+        if not 0 < percentile < 1:
+            raise ValueError(f"Percentile must be between 0 and 1, got {percentile}")
+        self.provider = provider
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_hedges = max_hedges
+        self.window = window
+        self.min_samples = min_samples
+        self.rate_limiter = rate_limiter
+
+        self._latencies: dict[str, deque[float]] = {}
+        self.calls: deque[HedgedCall] = deque(maxlen=history)
+        self.total_calls = 0
+        self.hedged_calls = 0
+        self.hedge_wins = 0
+        self._observers: list[Callable[[HedgedCall], None]] = []
+
+    @property
+    def model(self) -> Any:
+        """Expose the wrapped provider's model for game logs."""
+        return getattr(self.provider, "model", "unknown")
+
+    def add_observer(self, observer: Callable[[HedgedCall], None]) -> None:
+        """Register an observer for per-call records."""
+        self._observers.append(observer)
+
+    def hedge_delay(self, action_type: ActionType) -> float:
+        """Current hedge delay for an action type."""
+        samples = self._latencies.get(action_type.value)
+        if not samples or len(samples) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(samples)
+        index = max(0, math.ceil(self.percentile * len(ordered)) - 1)
+        return max(self.min_delay, ordered[index])
+
+    def _record_latency(self, action_type: ActionType, latency: float) -> None:
+        samples = self._latencies.get(action_type.value)
+        if samples is None:
+            samples = deque(maxlen=self.window)
+            self._latencies[action_type.value] = samples
+        samples.append(latency)
+
+    async def _request(
+        self, action_type: ActionType, context: str, kwargs: dict[str, Any]
+    ) -> dict:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        return await self.provider.act(action_type, context, **kwargs)
+
+    async def act(self, action_type: ActionType, context: str, **kwargs: Any) -> dict:
+        """Execute a player action, hedging slow requests."""
+        delay = self.hedge_delay(action_type)
+        started = time.monotonic()
+        tasks: list[asyncio.Task[dict]] = [
+            asyncio.create_task(self._request(action_type, context, kwargs))
+        ]
+        pending: set[asyncio.Task[dict]] = set(tasks)
+        winner: asyncio.Task[dict] | None = None
+        first_error: BaseException | None = None
+
+        try:
+            while pending and winner is None:
+                can_hedge = len(tasks) <= self.max_hedges
+                timeout = None
+                if can_hedge:
+                    timeout = max(0.0, started + delay * len(tasks) - time.monotonic())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedge = asyncio.create_task(self._request(action_type, context, kwargs))
+                    tasks.append(hedge)
+                    pending.add(hedge)
+                    PROVIDER_HEDGES.inc(action=action_type.value, outcome="fired")
+                    continue
+                for task in sorted(done, key=tasks.index):
+                    error = task.exception()
+                    if error is None:
+                        winner = task
+                        break
+                    if first_error is None:
+                        first_error = error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending and len(tasks) > 1:
+                PROVIDER_HEDGES.inc(
+                    len(pending), action=action_type.value, outcome="cancelled"
+                )
+
+        elapsed = time.monotonic() - started
+        if winner is not None:
+            self._record_latency(action_type, elapsed)
+            if winner is not tasks[0]:
+                PROVIDER_HEDGES.inc(action=action_type.value, outcome="won")
+        record = HedgedCall(
+            action_type=action_type.value,
+            latency=elapsed,
+            hedge_delay=delay,
+            requests=len(tasks),
+            winner=tasks.index(winner) if winner is not None else None,
+            error=None if winner is not None else repr(first_error),
+        )
+        self._report(record)
+
+        if winner is None:
+            assert first_error is not None
+            raise first_error
+        return winner.result()
+
+    def _report(self, record: HedgedCall) -> None:
+        self.calls.append(record)
+        self.total_calls += 1
+        if record.hedged:
+            self.hedged_calls += 1
+        if record.winner:
+            self.hedge_wins += 1
+        if self._observers:
+            logger = logging.getLogger(__name__)
+            for observer in list(self._observers):
+                try:
+                    observer(record)
+                except Exception:
+                    logger.exception("Hedge observer failed")
+
+    def summary(self) -> dict[str, float | int]:
+        """Aggregate hedging stats."""
+        return {
+            "calls": self.total_calls,
+            "hedged_calls": self.hedged_calls,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": self.hedged_calls / self.total_calls if self.total_calls else 0.0,
+        }
@@ -0,0 +1,58 @@
+"""Shared request rate limiting for provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Async token bucket shared by every wrapper that issues provider requests.
+
+    One limiter is meant to be shared across all concurrent games talking to
+    the same API key, so duplicate (hedged) requests are paid for out of the
+    same budget as first attempts.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        """
+        Initialize limiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket size (defaults to one second of requests, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers currently queued for a token."""
+        return self._waiting
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request token is available and take it."""
+        self._waiting += 1
+        try:
+            # The lock keeps waiters in FIFO order
+            async with self._lock:
+                while True:
+                    self._refill()
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+        finally:
+            self._waiting -= 1
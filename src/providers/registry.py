@@ -0,0 +1,45 @@
+"""Provider registry: provider classes are imported on first use."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.providers.base import PlayerProvider
+
+# Provider name -> "module:Class". SDK-backed modules (anthropic, google.genai)
+# are slow to import, so nothing here is loaded until a provider is created.
+PROVIDERS: dict[str, str] = {
+    "anthropic": "src.providers.anthropic:AnthropicProvider",
+    "google": "src.providers.google:GoogleGenAIProvider",
+    "fake": "src.providers.fake:FakeProvider",
+}
+
+
+def get_provider_class(name: str) -> type:
+    """
+    Import and return a provider class by name.
+
+    Args:
+        name: Registry key ("anthropic", "google", "fake")
+
+    Returns:
+        The provider class
+
+    Raises:
+        ValueError: If the name is not registered
+    """
+    try:
+        target = PROVIDERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown provider {name!r} (expected one of: {', '.join(sorted(PROVIDERS))})"
+        ) from None
+    module_name, class_name = target.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def create_provider(name: str, **kwargs: Any) -> PlayerProvider:
+    """Create a registered provider, importing its module on first use."""
+    return get_provider_class(name)(**kwargs)
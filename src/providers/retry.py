@@ -0,0 +1,226 @@
+"""Retry policy: error classification, full-jitter backoff and retry budgets."""
+
+from __future__ import annotations
+
+import random
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from typing import Any
+
+
+class ErrorClass(StrEnum):
+    """How a failed request should be treated."""
+
+    TRANSIENT = "transient"  # Connection errors, timeouts, 5xx
+    RATE_LIMITED = "rate_limited"  # 429 / overloaded; honour Retry-After
+    FATAL = "fatal"  # 4xx request or schema problems; retrying cannot help
+
+
+# 4xx codes that are worth retrying (timeouts, conflicts, rate limits)
+_RETRYABLE_CLIENT_CODES = {408, 409}
+_RATE_LIMIT_CODES = {429, 529}
+
+
+def get_status_code(error: BaseException) -> int | None:
+    """Find an HTTP status code on an error or anything in its cause chain."""
+    current: BaseException | None = error
+    while current is not None:
+        for attr in ("status_code", "code"):
+            value = getattr(current, attr, None)
+            if isinstance(value, int) and 100 <= value < 600:
+                return value
+        current = current.__cause__
+    return None
+
+
+def classify_error(error: BaseException) -> ErrorClass:
+    """
+    Classify an error for retry purposes.
+
+    Errors without an HTTP status (connection resets, timeouts, unknown
+    exceptions) are treated as transient.
+    """
+    status = get_status_code(error)
+    if status is None:
+        return ErrorClass.TRANSIENT
+    if status in _RATE_LIMIT_CODES:
+        return ErrorClass.RATE_LIMITED
+    if 400 <= status < 500 and status not in _RETRYABLE_CLIENT_CODES:
+        return ErrorClass.FATAL
+    return ErrorClass.TRANSIENT
+
+
+def get_retry_after(error: BaseException) -> float | None:
+    """Read a Retry-After hint (seconds) from the error's HTTP response, if any."""
+    current: BaseException | None = error
+    while current is not None:
+        headers = getattr(getattr(current, "response", None), "headers", None)
+        if headers is not None:
+            retry_after_ms = _header(headers, "retry-after-ms")
+            if retry_after_ms is not None:
+                try:
+                    return max(0.0, float(retry_after_ms) / 1000)
+                except ValueError:
+                    pass
+            retry_after = _header(headers, "retry-after")
+            if retry_after is not None:
+                return _parse_retry_after(retry_after)
+        current = current.__cause__
+    return None
+
+
+def _header(headers: Any, name: str) -> str | None:
+    try:
+        value = headers.get(name)
+    except Exception:  # noqa: BLE001
+        return None
+    return value if isinstance(value, str) else None
+
+
+def _parse_retry_after(value: str) -> float | None:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Backoff shape for one retry loop."""
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    max_retry_after: float = 60.0  # Cap on server-provided Retry-After hints
+
+    def delay(
+        self,
+        attempt: int,
+        error_class: ErrorClass = ErrorClass.TRANSIENT,
+        retry_after: float | None = None,
+        rng: random.Random | None = None,
+    ) -> float:
+        """
+        Seconds to wait before retrying after the given (0-based) attempt.
+
+        Uses full jitter: a uniform draw between 0 and the exponential cap, so
+        concurrent games that fail together do not retry together. A server
+        Retry-After hint replaces the jittered delay when rate limited.
+        """
+        if retry_after is not None and error_class == ErrorClass.RATE_LIMITED:
+            return min(retry_after, self.max_retry_after)
+        cap = min(self.max_delay, self.base_delay * (2**attempt))
+        return (rng or random).uniform(0, cap)
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries relative to first attempts.
+
+    Every first attempt deposits `ratio` tokens and every retry withdraws one,
+    so in steady state retries add at most `ratio` extra load. The bucket
+    starts with `initial` tokens so isolated failures can still be retried.
+    """
+
+    def __init__(self, ratio: float = 0.2, initial: float = 10.0, cap: float | None = None):
+        self.ratio = ratio
+        self.cap = cap if cap is not None else max(initial, 10.0)
+        self._tokens = float(initial)
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_request(self) -> None:
+        """Deposit for a first attempt."""
+        self.requests += 1
+        self._tokens = min(self.cap, self._tokens + self.ratio)
+
+    def can_retry(self) -> bool:
+        """True if a retry could be paid for right now."""
+        return self._tokens >= 1
+
+    def spend(self) -> None:
+        """Withdraw one retry (callers check can_retry first)."""
+        self.retries += 1
+        self._tokens -= 1
+
+    def deny(self) -> None:
+        """Count a retry that was refused."""
+        self.denied += 1
+
+    def summary(self) -> dict[str, float | int]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "denied": self.denied,
+            "tokens": round(self._tokens, 3),
+        }
+
+
+# Shared by every game in the process to stop retry storms across games
+GLOBAL_RETRY_BUDGET = RetryBudget(ratio=0.1, initial=50.0, cap=100.0)
+
+_game_retry_budget: ContextVar[RetryBudget | None] = ContextVar(
+    "game_retry_budget", default=None
+)
+
+
+def set_game_retry_budget(budget: RetryBudget | None) -> Token[RetryBudget | None]:
+    """Install the retry budget for the current game's task context."""
+    return _game_retry_budget.set(budget)
+
+
+def reset_game_retry_budget(token: Token[RetryBudget | None]) -> None:
+    """Restore the previous game retry budget."""
+    _game_retry_budget.reset(token)
+
+
+def get_game_retry_budget() -> RetryBudget | None:
+    """Retry budget of the game running in the current task, if any."""
+    return _game_retry_budget.get()
+
+
+def record_request() -> None:
+    """Record a first attempt against the global and current game budgets."""
+    GLOBAL_RETRY_BUDGET.record_request()
+    game_budget = _game_retry_budget.get()
+    if game_budget is not None:
+        game_budget.record_request()
+
+
+def try_spend_retry(include_global: bool = True) -> bool:
+    """
+    Take one retry from the retry budgets, if all of them allow it.
+
+    Args:
+        include_global: Also charge the process-wide budget. Transport retries
+            do; re-asks after an invalid answer only charge the game budget.
+
+    Returns:
+        True if the retry may go ahead
+    """
+    budgets = [GLOBAL_RETRY_BUDGET] if include_global else []
+    game_budget = _game_retry_budget.get()
+    if game_budget is not None:
+        budgets.append(game_budget)
+    if not all(b.can_retry() for b in budgets):
+        for budget in budgets:
+            budget.deny()
+        return False
+    for budget in budgets:
+        budget.spend()
+    return True
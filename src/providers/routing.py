@@ -0,0 +1,217 @@
+"""Action-tiered model routing with a per-game cost/latency budget."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+
+from src.schemas import ActionType
+
+# Actions that can be served by a cheaper route when the game budget runs short.
+DEFAULT_LOW_STAKES: frozenset[ActionType] = frozenset(
+    {ActionType.VOTE, ActionType.LAST_WORDS}
+)
+
+
+@dataclass(frozen=True)
+class ActionRoute:
+    """
+    Per-call overrides passed to providers.
+
+    Fields left as None fall back to the provider's own defaults.
+    """
+
+    model: str | None = None
+    thinking_level: str | None = None  # "MINIMAL", "LOW", "MEDIUM", "HIGH"
+    timeout: float | None = None  # Seconds for a single request
+    cost: float | None = None  # Estimated USD per call, charged against the game budget
+
+    def merged(self, override: ActionRoute) -> ActionRoute:
+        """Return a copy with every non-None field of override applied."""
+        changes = {
+            f.name: getattr(override, f.name)
+            for f in fields(override)
+            if getattr(override, f.name) is not None
+        }
+        return replace(self, **changes)
+
+
+@dataclass(frozen=True)
+class RouteRule:
+    """
+    Route applied when an action matches all of the given selectors.
+
+    Selectors left as None match anything. The phase selector matches a whole
+    phase or its "_"-separated prefix, so "day" matches every day while
+    "day_1" matches only the first one (not day_10).
+    """
+
+    route: ActionRoute
+    action_type: ActionType | None = None
+    phase: str | None = None
+    role: str | None = None
+
+    def matches(self, action_type: ActionType, phase: str, role: str) -> bool:
+        """Check whether this rule applies to the given call."""
+        if self.action_type is not None and self.action_type != action_type:
+            return False
+        if self.phase is not None and not (
+            phase == self.phase or phase.startswith(self.phase + "_")
+        ):
+            return False
+        return self.role is None or self.role == role
+
+
+@dataclass
+class RoutingPolicy:
+    """
+    Declarative routing table shared by all games.
+
+    Rules are checked in order and the first match wins. When a game's budget
+    runs short, low-stakes actions are served with the downgrade route applied
+    on top of whatever route they resolved to.
+    """
+
+    rules: list[RouteRule] = field(default_factory=list)
+    default: ActionRoute = field(default_factory=ActionRoute)
+    downgrade: ActionRoute | None = None
+    low_stakes: frozenset[ActionType] = DEFAULT_LOW_STAKES
+    cost_budget: float | None = None  # USD per game
+    latency_budget: float | None = None  # Seconds of provider time per game
+    reserve: float = 0.2  # Downgrade once less than this fraction is left
+
+    def resolve(self, action_type: ActionType, phase: str, role: str) -> ActionRoute:
+        """Resolve the configured route, ignoring the budget."""
+        for rule in self.rules:
+            if rule.matches(action_type, phase, role):
+                return self.default.merged(rule.route)
+        return self.default
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RoutingPolicy:
+        """
+        Build a policy from its JSON form.
+
+        Example:
+            {
+                "default": {"model": "gemini-3-flash-preview", "thinking_level": "HIGH"},
+                "rules": [
+                    {"action_type": "vote", "thinking_level": "LOW"},
+                    {"action_type": "speak", "phase": "day_1", "timeout": 60}
+                ],
+                "downgrade": {"thinking_level": "MINIMAL"},
+                "low_stakes": ["vote", "last_words"],
+                "budget": {"cost": 1.5, "latency": 900, "reserve": 0.2}
+            }
+
+        Raises:
+            ValueError: If an action type or field name is unknown
+        """
+        rules = []
+        for raw in data.get("rules", []):
+            raw = dict(raw)
+            action_type = raw.pop("action_type", None)
+            phase = raw.pop("phase", None)
+            role = raw.pop("role", None)
+            rules.append(
+                RouteRule(
+                    route=_parse_route(raw),
+                    action_type=_parse_action_type(action_type) if action_type else None,
+                    phase=phase,
+                    role=role,
+                )
+            )
+
+        downgrade = data.get("downgrade")
+        low_stakes = data.get("low_stakes")
+        budget = data.get("budget") or {}
+
+        return cls(
+            rules=rules,
+            default=_parse_route(data.get("default") or {}),
+            downgrade=_parse_route(downgrade) if downgrade else None,
+            low_stakes=(
+                frozenset(_parse_action_type(a) for a in low_stakes)
+                if low_stakes is not None
+                else DEFAULT_LOW_STAKES
+            ),
+            cost_budget=budget.get("cost"),
+            latency_budget=budget.get("latency"),
+            reserve=budget.get("reserve", 0.2),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> RoutingPolicy:
+        """Load a policy from a JSON file."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+class ActionRouter:
+    """
+    Per-game routing state.
+
+    Resolves routes from the shared policy and tracks how much of the game's
+    cost and latency budget has been spent.
+    """
+
+    def __init__(self, policy: RoutingPolicy):
+        self.policy = policy
+        self.spent_cost = 0.0
+        self.spent_latency = 0.0
+        self.calls = 0
+        self.downgraded_calls = 0
+
+    def select(self, action_type: ActionType, phase: str, role: str) -> ActionRoute:
+        """Pick the route for a call, downgrading low-stakes actions when short."""
+        route = self.policy.resolve(action_type, phase, role)
+        if (
+            self.policy.downgrade is not None
+            and action_type in self.policy.low_stakes
+            and self.is_budget_short()
+        ):
+            self.downgraded_calls += 1
+            return route.merged(self.policy.downgrade)
+        return route
+
+    def record(self, route: ActionRoute, latency: float) -> None:
+        """Charge one provider call against the budget."""
+        self.calls += 1
+        self.spent_cost += route.cost or 0.0
+        self.spent_latency += latency
+
+    def is_budget_short(self) -> bool:
+        """True once either budget has less than the reserve fraction left."""
+        reserve = self.policy.reserve
+        cost_budget = self.policy.cost_budget
+        if cost_budget is not None and self.spent_cost >= cost_budget * (1 - reserve):
+            return True
+        latency_budget = self.policy.latency_budget
+        return latency_budget is not None and self.spent_latency >= latency_budget * (
+            1 - reserve
+        )
+
+    def summary(self) -> dict[str, float | int]:
+        """Spend summary for game logs."""
+        return {
+            "calls": self.calls,
+            "downgraded_calls": self.downgraded_calls,
+            "spent_cost": round(self.spent_cost, 6),
+            "spent_latency": round(self.spent_latency, 3),
+        }
+
+
+def _parse_action_type(value: str) -> ActionType:
+    try:
+        return ActionType(value)
+    except ValueError as e:
+        raise ValueError(f"Unknown action type in routing config: {value!r}") from e
+
+
+def _parse_route(data: dict) -> ActionRoute:
+    allowed = {f.name for f in fields(ActionRoute)}
+    unknown = set(data) - allowed
+    if unknown:
+        raise ValueError(f"Unknown route fields in routing config: {sorted(unknown)}")
+    return ActionRoute(**data)
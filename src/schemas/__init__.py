@@ -7,11 +7,13 @@ from src.schemas.actions import (
     InvestigationOutput,
     LastWordsOutput,
     NightKillOutput,
+    RoundSummaryOutput,
     SpeakingOutput,
     VotingOutput,
 )
 from src.schemas.core import (
     ActionType,
+    AppendLog,
     Event,
     GameState,
     PlayerMemory,
@@ -29,6 +31,7 @@ from src.schemas.transcript import (
 __all__ = [
     # Core
     "ActionType",
+    "AppendLog",
     "Event",
     "GameState",
     "PlayerMemory",
@@ -40,6 +43,7 @@ __all__ = [
     "InvestigationOutput",
     "LastWordsOutput",
     "NightKillOutput",
+    "RoundSummaryOutput",
     "SpeakingOutput",
     "VotingOutput",
     # Transcript
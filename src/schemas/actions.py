@@ -74,6 +74,14 @@ class LastWordsOutput(BaseModel):
     text: str = Field(description="Final public message.")
 
 
+class RoundSummaryOutput(BaseModel):
+    """Narrator summary of a finished day round (not a player action)."""
+
+    summary: str = Field(
+        description="Neutral summary of the round: who claimed, accused or defended what."
+    )
+
+
 class DefenseOutput(BaseModel):
     """Revote: defense speech."""
 
@@ -1,10 +1,23 @@
-"""Core types: ActionType, GameState, PlayerMemory, PlayerResponse, Event."""
+"""
+Core types: ActionType, GameState, PlayerMemory, PlayerResponse, Event.
+
+These are engine-internal values, built many times per action from data
+the engine already owns, so they are slotted dataclasses rather than
+pydantic models and are not validated on construction. Validation
+happens at the trust boundaries instead: LLM output is checked against
+the action schemas in `src.schemas.actions`, and personas when the
+persona store is built.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
+from typing import Any, TypeVar, overload
 
-from pydantic import BaseModel, Field
+T = TypeVar("T")
 
 
 class ActionType(str, Enum):
@@ -17,9 +30,11 @@ class ActionType(str, Enum):
     NIGHT_KILL = "night_kill"
     INVESTIGATION = "investigation"
     DOCTOR_PROTECT = "doctor_protect"
+    SUMMARIZE = "summarize"  # Engine-side round summary, not a player action
 
 
-class GameState(BaseModel):
+@dataclass(slots=True)
+class GameState:
     """Current game state passed to players."""
 
     phase: str  # "night_zero", "day_1", "night_1", "day_2", etc.
@@ -29,27 +44,130 @@ class GameState(BaseModel):
     nominated_players: list[str]  # For voting phase, empty otherwise
 
 
-class PlayerMemory(BaseModel):
+class AppendLog(Sequence[T]):
+    """
+    Persistent append-only sequence.
+
+    `append` returns a new log and leaves the old one unchanged. Logs share
+    one backing list: appending to the newest log extends it in place
+    (O(1)), and only appending to an older log - a branch - copies its
+    prefix. Holding a log is therefore a free snapshot of its history.
+    """
+
+    __slots__ = ("_items", "_length")
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: list[T] = list(items)
+        self._length = len(self._items)
+
+    @classmethod
+    def _view(cls, items: list[T], length: int) -> AppendLog[T]:
+        log = cls.__new__(cls)
+        log._items = items
+        log._length = length
+        return log
+
+    def append(self, item: T) -> AppendLog[T]:
+        """Return a log with `item` added at the end."""
+        items = self._items
+        if len(items) != self._length:
+            # A newer log already extended the backing list: branch off a copy
+            items = items[: self._length]
+        items.append(item)
+        return self._view(items, self._length + 1)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return self._items[: self._length][index]
+        return self._items[range(self._length)[index]]
+
+    def __iter__(self) -> Iterator[T]:
+        return islice(self._items, self._length)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AppendLog | list | tuple):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"AppendLog({list(self)!r})"
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerMemory:
     """
     Player's stored memory between calls.
     Structure is intentionally loose - implementation decides format.
+
+    Memory is persistent: the engine never mutates `facts`, `beliefs` or
+    their histories in place, it derives a new PlayerMemory with `update`.
+    Unchanged dicts are shared rather than copied and histories are
+    AppendLogs, so each update costs the keys it touches, not the size of
+    the memory, and any PlayerMemory can be kept as a snapshot.
     """
 
     facts: dict  # Observed events, claims, votes, deaths
     beliefs: dict  # Suspicions, relationships, patterns
 
-
-class PlayerResponse(BaseModel):
+    def update(self, facts: dict | None = None, beliefs: dict | None = None) -> PlayerMemory:
+        """
+        Derive a memory with some fact and belief keys replaced.
+
+        Args:
+            facts: Fact keys to set
+            beliefs: Belief keys to set
+
+        Returns:
+            New PlayerMemory; a dict without changes is shared with this one
+        """
+        if not facts and not beliefs:
+            return self
+        return PlayerMemory(
+            facts={**self.facts, **facts} if facts else self.facts,
+            beliefs={**self.beliefs, **beliefs} if beliefs else self.beliefs,
+        )
+
+    def history(self, key: str) -> AppendLog:
+        """The append-only history stored under a fact key (empty if unset)."""
+        value = self.facts.get(key)
+        if isinstance(value, AppendLog):
+            return value
+        return AppendLog(value or ())
+
+
+@dataclass(slots=True)
+class PlayerResponse:
     """What a player returns after acting."""
 
-    output: dict  # Must match the action-specific schema (SpeakingOutput, VotingOutput, etc.)
+    output: dict  # Already validated against the action-specific schema
     updated_memory: PlayerMemory
 
 
-class Event(BaseModel):
+@dataclass(slots=True)
+class Event:
     """Single game event in the log."""
 
     type: str  # phase_start, speech, vote_round, defense, elimination, night_kill, investigation, last_words, game_end
     timestamp: str  # ISO8601
     data: dict  # Type-specific fields
-    private_fields: list[str] = Field(default_factory=list)  # Fields to filter for public view
+    private_fields: list[str] = field(default_factory=list)  # Fields to filter for public view
+
+    def to_dict(self) -> dict[str, Any]:
+        """Event as a JSON-ready dict (shares `data`, does not copy it)."""
+        return {
+            "type": self.type,
+            "timestamp": self.timestamp,
+            "data": self.data,
+            "private_fields": self.private_fields,
+        }
@@ -53,6 +53,7 @@ class CompressedRoundSummary(BaseModel):
     vote_result: str
     vote_line: str | None = None
     defense_note: str | None = None
+    summary: str | None = None  # Background LLM summary of the speeches, if ready
 
 
 # Type alias for transcript (mix of full and compressed rounds)
@@ -10,6 +10,16 @@ from pathlib import Path
 from src.schemas import Event
 
 
+def sidecar_path(log_path: Path, kind: str) -> Path:
+    """
+    Path of a file derived from a game log (prompt sizes, timeline, ...).
+
+    Sidecars keep the log's file name inside a `<kind>/` directory next to
+    it, so `game_*.json` globs over a log directory only match game logs.
+    """
+    return log_path.parent / kind / log_path.name
+
+
 @dataclass
 class PlayerEntry:
     """Player information for game log."""
@@ -80,15 +90,18 @@ class GameLogWriter:
                 }
                 for p in players
             ],
-            "events": [e.model_dump() for e in events],
+            "events": [e.to_dict() for e in events],
         }
 
         filepath = self.log_dir / f"game_{game_id}.json"
+        self._dump(filepath, log_data)
+        return filepath
+
+    def _dump(self, filepath: Path, log_data: dict) -> None:
+        """Serialize a log to disk (blocking)."""
         with open(filepath, "w") as f:
             json.dump(log_data, f, indent=2)
 
-        return filepath
-
     def read(self, game_id: str) -> dict | None:
         """
         Read a game log by ID.
@@ -126,9 +139,5 @@ class GameLogWriter:
         game_id = log_data.get("game_id", "unknown")
         filepath = self.log_dir / f"game_{game_id}.json"
 
-        def _write() -> None:
-            with open(filepath, "w") as f:
-                json.dump(log_data, f, indent=2)
-
-        await asyncio.to_thread(_write)
+        await asyncio.to_thread(self._dump, filepath, log_data)
         return str(filepath)
@@ -0,0 +1,322 @@
+"""
+Replay timeline compiler for the viewer.
+
+A game log is compiled once into a seekable timeline: for each viewer mode
+(public and omniscient) the events as the viewer shows them, plus keyframes
+holding the scene state (phase, scene kind, living/dead players,
+nominations, vote tally) every `keyframe_interval` events. The state at any
+index is its keyframe plus at most `keyframe_interval - 1` steps of
+`step_scene`, so scrubbing costs the same anywhere in a game. The viewer
+(`viewer/src/utils/timeline.js`) loads the compiled file as-is and mirrors
+`step_scene` for the short replay after a keyframe.
+
+    python -m src.storage.timeline logs/game_<id>.json     # -> logs/timelines/game_<id>.json
+    python -m src.storage.timeline logs/game_<id>.json --interval 8
+    python -m src.engine.run --timeline                     # compile after the game
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.storage.json_logs import sidecar_path
+
+TIMELINE_VERSION = 1
+DEFAULT_KEYFRAME_INTERVAL = 16
+MODES = ("public", "omniscient")
+
+# Omniscient-only event types (their private fields are not always marked)
+_SECRET_TYPES = {"night_kill", "investigation"}
+
+
+def _is_day(phase: object) -> bool:
+    return isinstance(phase, str) and phase.startswith("day_")
+
+
+def _day_announcement(
+    source: dict[str, Any], killed: list[str], state_public: dict[str, Any]
+) -> dict[str, Any]:
+    """Narrator event announcing the night's deaths at the start of a day."""
+    data = source.get("data") or {}
+    verb = "were" if len(killed) > 1 else "was"
+    return {
+        "type": "day_announcement",
+        "timestamp": source.get("timestamp", ""),
+        "data": {
+            "speaker": "Narrator",
+            "text": f"{', '.join(killed)} {verb} killed during the night.",
+            "eliminated": killed[0] if len(killed) == 1 else killed,
+            "phase": data.get("phase", "unknown"),
+            "round_number": data.get("round_number"),
+            "stage": "announcement",
+            "state_public": state_public,
+        },
+        "private_fields": [],
+    }
+
+
+def _view_event(event: dict[str, Any], index: int, mode: str) -> dict[str, Any] | None:
+    """Event as shown in a mode, or None when the mode hides it."""
+    event_type = event.get("type") or "unknown"
+    if mode == "public" and event_type in _SECRET_TYPES:
+        return None
+    data = event.get("data") or {}
+    private = set(event.get("private_fields") or ())
+    if mode == "public":
+        data = {key: value for key, value in data.items() if key not in private}
+        if not data or event_type == "night_zero_strategy":
+            return None
+    return {
+        "index": index,
+        "type": event_type,
+        "timestamp": event.get("timestamp", ""),
+        "phase": data.get("phase") or "unknown",
+        "roundNumber": data.get("round_number"),
+        "stage": data.get("stage") or event_type,
+        "data": data,
+    }
+
+
+def view_events(log: dict[str, Any], mode: str) -> list[dict[str, Any]]:
+    """
+    Events of a game log as the viewer shows them in a mode.
+
+    Matches the viewer's log parser: public mode drops private fields and
+    fully private events, and a narrator announcement is inserted at the
+    start of each day on which players died overnight (the day's first
+    event keeps showing the previous state so the deaths land on the
+    announcement).
+
+    Args:
+        log: Parsed game log
+        mode: "public" or "omniscient"
+
+    Returns:
+        Viewer events, indexed from 0
+    """
+    events: list[dict[str, Any]] = []
+    last_state: dict[str, Any] | None = None
+    for event in log.get("events") or []:
+        data = event.get("data") or {}
+        state_public = data.get("state_public")
+        shown, announcement = event, None
+        day_start = event.get("type") == "phase_start" and _is_day(data.get("phase"))
+        if day_start and state_public and last_state:
+            living = set(state_public.get("living") or ())
+            killed = [name for name in last_state.get("living") or () if name not in living]
+            if killed:
+                shown = {**event, "data": {**data, "state_public": last_state}}
+                announcement = _day_announcement(event, killed, state_public)
+        for candidate in (shown, announcement):
+            if candidate is not None:
+                viewed = _view_event(candidate, len(events), mode)
+                if viewed is not None:
+                    events.append(viewed)
+        if state_public:
+            last_state = state_public
+    return events
+
+
+def scene_kind(event: dict[str, Any], mode: str) -> str:
+    """Scene shown for an event: "day", "night", "mafia" or "detective"."""
+    night = event["phase"].startswith("night")
+    if mode != "omniscient":
+        return "night" if night else "day"
+    if event["type"] in ("night_zero_strategy", "night_kill"):
+        return "mafia"
+    if event["type"] == "investigation":
+        return "detective"
+    return "night" if night else "day"
+
+
+INITIAL_SCENE: dict[str, Any] = {
+    "index": -1,
+    "phase": None,
+    "round_number": None,
+    "scene": "day",
+    "living": [],
+    "dead": [],
+    "nominated": [],
+    "votes": {},
+}
+
+
+def step_scene(scene: dict[str, Any], event: dict[str, Any], mode: str) -> dict[str, Any]:
+    """
+    Scene state after one viewer event.
+
+    Players come from the event's state snapshot: the state before a night
+    kill (omniscient), after a vote or elimination, and before last words,
+    whose speaker is always shown alive. The vote tally is the latest vote
+    round of the phase and resets at each phase start.
+
+    Args:
+        scene: State before the event
+        event: Viewer event (from `view_events`)
+        mode: Mode the event was viewed in
+
+    Returns:
+        New state; `scene` is not modified
+    """
+    data = event["data"]
+    event_type = event["type"]
+    snapshot = data.get("state_public")
+    if event_type == "night_kill" and mode == "omniscient":
+        snapshot = data.get("state_before") or snapshot
+    elif event_type in ("vote_round", "elimination"):
+        snapshot = data.get("state_after") or snapshot
+    elif event_type == "last_words":
+        snapshot = data.get("state_before") or snapshot
+
+    new = dict(scene)
+    new["index"] = event["index"]
+    new["scene"] = scene_kind(event, mode)
+    if event["phase"] != "unknown":
+        new["phase"] = event["phase"]
+    if event["roundNumber"] is not None:
+        new["round_number"] = event["roundNumber"]
+    if snapshot:
+        new["living"] = list(snapshot.get("living") or ())
+        new["dead"] = list(snapshot.get("dead") or ())
+        new["nominated"] = list(snapshot.get("nominated") or ())
+    speaker = data.get("speaker")
+    if event_type == "last_words" and speaker and speaker not in new["living"]:
+        new["living"] = [*new["living"], speaker]
+    if event_type == "phase_start":
+        new["votes"] = {}
+    elif event_type == "vote_round":
+        new["votes"] = dict(Counter((data.get("votes") or {}).values()))
+    return new
+
+
+@dataclass
+class ModeTimeline:
+    """Viewer events for one mode with keyframes every `interval` events."""
+
+    mode: str
+    events: list[dict[str, Any]]
+    keyframes: list[dict[str, Any]]
+    interval: int
+
+    @classmethod
+    def compile(
+        cls, log: dict[str, Any], mode: str, interval: int = DEFAULT_KEYFRAME_INTERVAL
+    ) -> ModeTimeline:
+        """
+        Compile one mode of a game log.
+
+        Raises:
+            ValueError: If the mode is unknown or the interval is not positive
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}; expected one of {', '.join(MODES)}")
+        if interval < 1:
+            raise ValueError(f"Keyframe interval must be positive, got {interval}")
+        events = view_events(log, mode)
+        keyframes = []
+        scene = INITIAL_SCENE
+        for index, event in enumerate(events):
+            scene = step_scene(scene, event, mode)
+            if index % interval == 0:
+                keyframes.append(scene)
+        return cls(mode, events, keyframes, interval)
+
+    def state_at(self, index: int) -> dict[str, Any]:
+        """Scene state at an event index: nearest keyframe plus a short replay."""
+        if not self.events:
+            return dict(INITIAL_SCENE)
+        index = max(0, min(index, len(self.events) - 1))
+        start = index // self.interval
+        scene = self.keyframes[start]
+        for event in self.events[start * self.interval + 1 : index + 1]:
+            scene = step_scene(scene, event, self.mode)
+        return scene
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"events": self.events, "keyframes": self.keyframes}
+
+
+def compile_timeline(
+    log: dict[str, Any], interval: int = DEFAULT_KEYFRAME_INTERVAL
+) -> dict[str, Any]:
+    """
+    Compile a game log into the viewer's timeline format.
+
+    Args:
+        log: Parsed game log
+        interval: Events between keyframes
+
+    Returns:
+        JSON-ready timeline with game info and one timeline per mode
+    """
+    return {
+        "timeline_version": TIMELINE_VERSION,
+        "game_id": log.get("game_id"),
+        "winner": log.get("winner"),
+        "players": log.get("players") or [],
+        "keyframe_interval": interval,
+        "modes": {mode: ModeTimeline.compile(log, mode, interval).to_dict() for mode in MODES},
+    }
+
+
+def timeline_path_for(log_path: Path) -> Path:
+    """Default timeline path: the log's name in a `timelines/` directory next to it."""
+    return sidecar_path(log_path, "timelines")
+
+
+def write_timeline(
+    log_path: Path, out: Path | None = None, interval: int = DEFAULT_KEYFRAME_INTERVAL
+) -> Path:
+    """
+    Compile a game log file and write its timeline.
+
+    Args:
+        log_path: Game log JSON
+        out: Timeline file (default: `timelines/<log name>` next to the log)
+        interval: Events between keyframes
+
+    Returns:
+        The written path
+    """
+    log = json.loads(Path(log_path).read_text())
+    out = out or timeline_path_for(Path(log_path))
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(compile_timeline(log, interval), separators=(",", ":")))
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compile game logs into seekable viewer timelines",
+        prog="python -m src.storage.timeline",
+    )
+    parser.add_argument("logs", type=Path, nargs="+", help="Game log JSON files")
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=DEFAULT_KEYFRAME_INTERVAL,
+        help="Events between keyframes",
+    )
+    parser.add_argument("--out", type=Path, default=None, help="Output file (one log only)")
+    args = parser.parse_args(argv)
+    if args.out and len(args.logs) > 1:
+        parser.error("--out needs exactly one log")
+
+    for log_path in args.logs:
+        try:
+            path = write_timeline(log_path, args.out, args.interval)
+        except (OSError, ValueError) as e:
+            print(f"{log_path}: {e}", file=sys.stderr)
+            return 1
+        print(f"Wrote {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""
+Non-blocking telemetry export.
+
+Providers and the game runner hand events to `emit`, which only appends to a
+bounded in-memory queue; a single background thread batches the queue and
+writes it to the configured sinks (a local JSONL file, Langfuse). When the
+queue is full events are dropped and counted, and sink failures are logged
+and counted, so telemetry never adds latency to, or fails, a game call.
+
+Games are sampled: a `sample_rate` share of games (chosen by a hash of the
+game id) is traced fully, with prompts and outputs for every generation.
+Every game still emits a single summary event at the end.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import logging
+import queue
+import threading
+import time
+import zlib
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+from src.metrics import REGISTRY
+
+# langfuse is optional and slow to import; LangfuseSink imports it on creation
+LANGFUSE_AVAILABLE = importlib.util.find_spec("langfuse") is not None
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_EVENTS = REGISTRY.counter(
+    "mafia_telemetry_events_total",
+    "Telemetry events by outcome (queued, dropped, sampled_out, exported, failed)",
+    ("outcome",),
+)
+
+
+@dataclass(frozen=True)
+class GameTrace:
+    """Telemetry sampling decision for one game."""
+
+    game_id: str
+    sampled: bool
+
+
+_game_trace: ContextVar[GameTrace | None] = ContextVar("game_trace", default=None)
+
+
+class TelemetrySink(Protocol):
+    """Destination for batches of telemetry events (called from the exporter thread)."""
+
+    def export(self, batch: list[dict[str, Any]]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class JsonlFileSink:
+    """Appends events to a local JSON Lines file, for offline runs."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a")  # noqa: SIM115
+
+    def export(self, batch: list[dict[str, Any]]) -> None:
+        self._file.write("".join(json.dumps(event, default=str) + "\n" for event in batch))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _nanoseconds(timestamp: float) -> int:
+    """Unix time in seconds -> nanoseconds (OpenTelemetry timestamps)."""
+    return int(timestamp * 1_000_000_000)
+
+
+class LangfuseSink:
+    """
+    Sends generation events to Langfuse through one shared client.
+
+    Generations of the same game are grouped under a trace whose id is
+    derived from the game id. Export runs after the call, so each
+    generation is stamped with the call's own start and end times.
+    """
+
+    def __init__(self, public_key: str, secret_key: str, host: str | None = None):
+        if not LANGFUSE_AVAILABLE:
+            raise ImportError("langfuse is not installed")
+        from langfuse import Langfuse
+
+        self.client = Langfuse(public_key=public_key, secret_key=secret_key, host=host)
+
+    def export(self, batch: list[dict[str, Any]]) -> None:
+        for event in batch:
+            if event.get("type") != "generation":
+                continue
+            trace_id = self.client.create_trace_id(seed=event.get("game_id") or None)
+            generation = self.client.start_observation(
+                trace_context={"trace_id": trace_id},
+                name=f"llm_call.{event.get('action', 'unknown')}",
+                as_type="generation",
+                model=event.get("model"),
+                input=event.get("input"),
+                output=event.get("output"),
+                usage_details=event.get("usage"),
+                cost_details=event.get("cost"),
+                metadata={"provider": event.get("provider"), "latency": event.get("latency")},
+            )
+            start_time, end_time = event.get("start_time"), event.get("end_time")
+            if start_time is not None:
+                # start_observation takes no start time; backdate the OTel span
+                generation._otel_span._start_time = _nanoseconds(start_time)
+            generation.end(end_time=_nanoseconds(end_time) if end_time is not None else None)
+
+    def close(self) -> None:
+        self.client.flush()
+
+
+class TelemetryExporter:
+    """
+    Background exporter with a bounded queue, batching and per-game sampling.
+
+    `emit` never blocks: it either enqueues the event or drops it.
+    """
+
+    def __init__(
+        self,
+        sinks: list[TelemetrySink],
+        *,
+        sample_rate: float = 0.05,
+        max_queue: int = 10_000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ):
+        """
+        Initialize exporter and start its worker thread.
+
+        Args:
+            sinks: Destinations for every batch
+            sample_rate: Share of games (0-1) traced fully
+            max_queue: Events buffered before new ones are dropped
+            batch_size: Maximum events handed to sinks at once
+            flush_interval: Seconds a partial batch may wait
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"Sample rate must be between 0 and 1, got {sample_rate}")
+        self.sinks = sinks
+        self.sample_rate = sample_rate
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queued = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.exported = 0
+        self.failed = 0
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(maxsize=max_queue)
+        self._worker = threading.Thread(target=self._run, name="telemetry-exporter", daemon=True)
+        self._closed = False
+        self._worker.start()
+
+    def is_sampled(self, game_id: str) -> bool:
+        """Deterministic per-game sampling decision."""
+        return zlib.crc32(game_id.encode()) / 2**32 < self.sample_rate
+
+    def emit(self, event: dict[str, Any], always: bool = False) -> None:
+        """
+        Queue an event for export without blocking.
+
+        Args:
+            event: JSON-serializable event; game_id is added inside a game
+            always: Export even if the current game is not sampled
+        """
+        trace = _game_trace.get()
+        if trace is not None:
+            if not (always or trace.sampled):
+                self.sampled_out += 1
+                TELEMETRY_EVENTS.inc(outcome="sampled_out")
+                return
+            event.setdefault("game_id", trace.game_id)
+        event.setdefault("timestamp", time.time())
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+            TELEMETRY_EVENTS.inc(outcome="dropped")
+            return
+        self.queued += 1
+        TELEMETRY_EVENTS.inc(outcome="queued")
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Export everything queued, then close the sinks (blocking)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join(timeout)
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception:
+                logger.exception("Telemetry sink %s failed to close", type(sink).__name__)
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "queued": self.queued,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "exported": self.exported,
+            "failed": self.failed,
+        }
+
+    def _run(self) -> None:
+        done = False
+        while not done:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch: list[dict[str, Any]] = []
+            if first is None:
+                done = True
+            else:
+                batch.append(first)
+            # Drain whatever else is waiting, up to a batch
+            while len(batch) < self.batch_size:
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event is None:
+                    done = True
+                    break
+                batch.append(event)
+            if batch:
+                self._export(batch)
+
+    def _export(self, batch: list[dict[str, Any]]) -> None:
+        ok = True
+        for sink in self.sinks:
+            try:
+                sink.export(batch)
+            except Exception:
+                ok = False
+                logger.exception("Telemetry sink %s failed", type(sink).__name__)
+        if ok:
+            self.exported += len(batch)
+            TELEMETRY_EVENTS.inc(len(batch), outcome="exported")
+        else:
+            self.failed += len(batch)
+            TELEMETRY_EVENTS.inc(len(batch), outcome="failed")
+
+
+_exporter: TelemetryExporter | None = None
+
+
+def configure_telemetry(exporter: TelemetryExporter | None) -> TelemetryExporter | None:
+    """Install the process-wide exporter; returns the previous one."""
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    return previous
+
+
+def get_telemetry() -> TelemetryExporter | None:
+    return _exporter
+
+
+def start_game_trace(game_id: str) -> Token[GameTrace | None]:
+    """Make the sampling decision for a game and install it for its tasks."""
+    sampled = _exporter.is_sampled(game_id) if _exporter is not None else False
+    return _game_trace.set(GameTrace(game_id=game_id, sampled=sampled))
+
+
+def reset_game_trace(token: Token[GameTrace | None]) -> None:
+    _game_trace.reset(token)
+
+
+def is_tracing() -> bool:
+    """True if events emitted now would be kept (lets callers skip building them)."""
+    if _exporter is None:
+        return False
+    trace = _game_trace.get()
+    return trace is None or trace.sampled
+
+
+def emit(event: dict[str, Any], always: bool = False) -> None:
+    """Hand an event to the configured exporter, if any."""
+    if _exporter is not None:
+        _exporter.emit(event, always=always)
@@ -0,0 +1,91 @@
+"""Smoke tests for the benchmark harness."""
+
+from benchmarks.context_assembly import build_game, profile
+from benchmarks.context_assembly import run as run_context_assembly
+from benchmarks.harness import ComponentTimer, compare
+from benchmarks.throughput import run_scenario
+from src.engine.context import ContextBuilder
+
+
+class TestThroughputBenchmark:
+    async def test_single_game_scenario_reports_metrics(self):
+        """One instant game produces every headline metric."""
+        result = await run_scenario(1, "instant")
+
+        assert result["games"] == 1
+        assert result["calls_per_game"] > 0
+        assert set(result["cpu_ms_per_call"]) == {
+            "context_builder",
+            "transcript",
+            "event_log",
+            "log_writing",
+            "total",
+        }
+        assert result["cpu_ms_per_call"]["context_builder"] > 0
+        assert result["peak_rss_mb"] > 0
+        assert "p99_ms" in result["loop_lag"]
+
+    def test_compare_flags_regressions_by_direction(self):
+        """Throughput drops and cost increases beyond tolerance are regressions."""
+        baseline = {"instant/1": {"games_per_sec": 10.0, "cpu_ms_per_call": {"total": 1.0}}}
+        current = {"instant/1": {"games_per_sec": 8.0, "cpu_ms_per_call": {"total": 0.5}}}
+
+        rows = compare(
+            current, baseline, ["games_per_sec", "cpu_ms_per_call.total"], tolerance=0.1
+        )
+
+        flags = {row["metric"]: row["regression"] for row in rows}
+        assert flags == {"games_per_sec": True, "cpu_ms_per_call.total": False}
+
+    def test_nested_components_count_once_in_total(self):
+        """A component called from another is charged to both but totalled once."""
+
+        class Outer:
+            def run(self):
+                Inner().work()
+
+        class Inner:
+            def work(self):
+                sum(range(200_000))
+
+        timer = ComponentTimer()
+        with timer.patch("outer", Outer), timer.patch("inner", Inner):
+            Outer().run()
+
+        assert timer.stats["inner"].seconds > 0
+        assert timer.top_level_seconds == timer.stats["outer"].seconds
+
+    def test_timer_restores_patched_methods(self):
+        """Instrumentation is removed when the block exits."""
+        original = ContextBuilder.build_context
+        timer = ComponentTimer()
+        with timer.patch("context_builder", ContextBuilder, ["build_context"]):
+            assert ContextBuilder.build_context is not original
+        assert ContextBuilder.build_context is original
+
+
+class TestContextAssemblyBenchmark:
+    def test_synthetic_game_has_revotes_and_live_round(self):
+        """Synthetic games include revotes and an in-progress round."""
+        manager, memory, state, names = build_game(rounds=4, revote_every=2)
+
+        assert len(manager.rounds) == 4
+        assert manager.rounds[1].revote is not None
+        assert manager.current_round_number == state.round_number == 5
+        assert len(memory.facts["investigation_results"]) == 4
+
+    def test_times_every_section(self):
+        """Each section builder gets its own timing."""
+        scenarios = run_context_assembly([2], repeat=1, min_time=0.0)
+
+        cases = scenarios["rounds=2"]
+        assert cases["transcript_section"]["best_us"] > 0
+        assert cases["summarize_facts"]["loops"] >= 1
+        assert cases["context_chars"] > 0
+
+    def test_profile_reports_categories(self):
+        """Profiling output breaks time down by category."""
+        report = profile(rounds=2, loops=2, top=5, output=None)
+
+        assert "pydantic" in report
+        assert "string building" in report
@@ -2,10 +2,14 @@
 
 import pytest
 
-from src.engine.context import ContextBuilder
+from src.engine.context import ContextBuilder, TranscriptStyle, compile_prompt, split_sections
+from src.engine.summarizer import RoundSummarizer
 from src.engine.transcript import TranscriptManager
+from src.metrics import ROUND_SUMMARIES
+from src.providers.fake import FakeProvider
 from src.schemas import (
     ActionType,
+    DayRoundTranscript,
     DefenseSpeech,
     GameState,
     PlayerMemory,
@@ -151,6 +155,65 @@ class TestTranscriptCompression:
         assert compressed.vote_death == "Bob"
 
 
+class TestRoundSummaries:
+    @staticmethod
+    def _play_rounds(manager, count):
+        for i in range(1, count + 1):
+            manager.add_speech("Alice", "I suspect Bob", "Bob")
+            manager.finalize_round(i, None, {"Alice": "Bob"}, "eliminated:Bob")
+
+    async def test_summary_replaces_round_once_ready(self):
+        """A finished round's summary is attached once it leaves the window."""
+        summarizer = RoundSummarizer(FakeProvider(seed=0))
+        manager = TranscriptManager(summarizer=summarizer)
+        self._play_rounds(manager, 3)
+        await summarizer.wait()
+
+        transcript = manager.get_transcript_for_player(current_round=3)
+
+        assert transcript[0].summary == "Fake summary."
+        assert set(summarizer.summaries) == {1, 2, 3}
+
+    async def test_falls_back_to_facts_when_not_ready(self):
+        """A summary still in flight leaves the factual compression."""
+        summarizer = RoundSummarizer(FakeProvider(latency=10.0))
+        manager = TranscriptManager(summarizer=summarizer)
+        missed = ROUND_SUMMARIES.value(outcome="missed")
+        self._play_rounds(manager, 3)
+
+        transcript = manager.get_transcript_for_player(current_round=3)
+        manager.get_transcript_for_player(current_round=3)
+        await summarizer.close()
+
+        assert transcript[0].summary is None
+        assert transcript[0].vote_death == "Bob"
+        assert ROUND_SUMMARIES.value(outcome="missed") == missed + 1  # Counted once
+
+    async def test_failed_summary_is_not_cached(self):
+        """Provider errors are counted and the round keeps its facts only."""
+        summarizer = RoundSummarizer(FakeProvider(error_rate=1.0))
+        manager = TranscriptManager(summarizer=summarizer)
+        failed = ROUND_SUMMARIES.value(outcome="failed")
+        self._play_rounds(manager, 3)
+        await summarizer.wait()
+
+        transcript = manager.get_transcript_for_player(current_round=3)
+
+        assert transcript[0].summary is None
+        assert summarizer.summaries == {}
+        assert ROUND_SUMMARIES.value(outcome="failed") == failed + 3
+
+    def test_without_event_loop_nothing_is_scheduled(self):
+        """Synchronous callers finalize rounds without a summary task."""
+        summarizer = RoundSummarizer(FakeProvider())
+        manager = TranscriptManager(summarizer=summarizer)
+        self._play_rounds(manager, 3)
+
+        transcript = manager.get_transcript_for_player(current_round=3)
+
+        assert transcript[0].summary is None
+
+
 class TestContextBuilder:
     @pytest.fixture
     def builder(self):
@@ -349,6 +412,95 @@ class TestContextBuilder:
         assert 'Bob: "I\'m innocent"' in context
         assert "Nominated: Bob" in context
 
+    def test_compact_transcript_uses_seat_aliases(self, sample_persona, memory):
+        """Compact transcripts name players once and group nominations and votes."""
+        from src.schemas import CompressedRoundSummary, DayRoundTranscript
+
+        builder = ContextBuilder(
+            transcript_style=TranscriptStyle.COMPACT,
+            seats={"Alice": 0, "Bob": 1, "Charlie": 2, "Diana": 3},
+        )
+        transcript = [
+            CompressedRoundSummary(
+                round_number=1,
+                night_death=None,
+                vote_death="Diana",
+                vote_result="eliminated:Diana",
+                vote_line="Alice->Diana, Bob->Diana",
+            ),
+            DayRoundTranscript(
+                round_number=2,
+                night_kill="Charlie",
+                last_words=None,
+                speeches=[
+                    Speech(speaker="Alice", text="Hello everyone", nomination="Bob"),
+                    Speech(speaker="Bob", text="I'm innocent", nomination="skip"),
+                ],
+                votes={"Alice": "Bob", "Bob": "Bob"},
+                vote_outcome="eliminated:Bob",
+            ),
+        ]
+        game_state = GameState(
+            phase="day_2",
+            round_number=2,
+            living_players=["Alice", "Bob"],
+            dead_players=["Charlie", "Diana"],
+            nominated_players=[],
+        )
+
+        context = builder.build_context(
+            player_name="Alice",
+            role="town",
+            persona=sample_persona,
+            game_state=game_state,
+            transcript=transcript,
+            memory=memory,
+            action_type=ActionType.VOTE,
+        )
+        transcript_section = split_sections(context)["transcript"]
+
+        assert "Seats: #0 Alice, #1 Bob, #2 Charlie, #3 Diana" in transcript_section
+        assert "Votes: #0->#3, #1->#3" in transcript_section
+        assert "Night kill: #2" in transcript_section
+        assert '#0: "Hello everyone"' in transcript_section
+        assert "Nominations: #1 <- #0 (1) | skip <- #1 (1)" in transcript_section
+        assert "Votes: #1 <- #0 #1 (2)" in transcript_section
+        assert "Outcome: eliminated #1" in transcript_section
+        assert "Nominated:" not in transcript_section
+        # Names appear only in the seat legend
+        assert transcript_section.count("Alice") == 1
+
+    def test_compact_transcript_defaults_to_alphabetical_seats(
+        self, sample_persona, game_state, memory
+    ):
+        """Without a seat map, aliases follow alphabetical order of all players."""
+        from src.schemas import DayRoundTranscript
+
+        builder = ContextBuilder(transcript_style="compact")
+        transcript = [
+            DayRoundTranscript(
+                round_number=1,
+                night_kill=None,
+                last_words=None,
+                speeches=[Speech(speaker="Bob", text="Hi", nomination="Alice")],
+                votes={},
+                vote_outcome="pending",
+            )
+        ]
+
+        context = builder.build_context(
+            player_name="Alice",
+            role="town",
+            persona=sample_persona,
+            game_state=game_state,
+            transcript=transcript,
+            memory=memory,
+            action_type=ActionType.SPEAK,
+        )
+
+        assert "Seats: #0 Alice, #1 Bob, #2 Charlie" in context
+        assert "Nominations: #0 <- #1 (1)" in context
+
     def test_transcript_renders_compressed_rounds(self, builder, sample_persona, memory):
         """Compressed rounds show summaries."""
         from src.schemas import CompressedRoundSummary
@@ -386,6 +538,51 @@ class TestContextBuilder:
         assert "Vote elimination: Bob" in context
         assert "Votes: Alice->Bob, Charlie->Bob" in context
         assert "Defense: yes (tie -> revote)" in context
+        assert "Summary:" not in context
+
+    def test_transcript_renders_round_summary(self, sample_persona, memory):
+        """LLM summaries follow the outcome line; compact style aliases names."""
+        from src.schemas import CompressedRoundSummary
+
+        transcript = [
+            CompressedRoundSummary(
+                round_number=1,
+                night_death=None,
+                vote_death="Bob",
+                vote_result="eliminated:Bob",
+                vote_line="Alice->Bob, Charlie->Bob",
+                summary="Alice pushed Bob; Charlie followed late.",
+            )
+        ]
+        game_state = GameState(
+            phase="day_3",
+            round_number=3,
+            living_players=["Alice", "Charlie"],
+            dead_players=["Bob"],
+            nominated_players=[],
+        )
+
+        def render(builder):
+            return builder.build_context(
+                player_name="Alice",
+                role="town",
+                persona=sample_persona,
+                game_state=game_state,
+                transcript=transcript,
+                memory=memory,
+                action_type=ActionType.SPEAK,
+            )
+
+        full = render(ContextBuilder())
+        compact = render(
+            ContextBuilder(
+                transcript_style=TranscriptStyle.COMPACT,
+                seats={"Alice": 0, "Bob": 1, "Charlie": 2},
+            )
+        )
+
+        assert "Summary: Alice pushed Bob; Charlie followed late." in full
+        assert "Summary: #0 pushed #1; #2 followed late." in compact
 
     def test_memory_renders_to_json(self, builder, sample_persona, game_state):
         """Memory section shows facts and beliefs as JSON."""
@@ -498,6 +695,75 @@ class TestContextBuilder:
         assert "eliminated from the game" in context
         assert "final statement" in context
 
+    def test_split_sections_recovers_every_section(
+        self, builder, sample_persona, game_state, memory
+    ):
+        """An assembled context splits back into its named sections."""
+        context = builder.build_context(
+            player_name="Alice",
+            role="mafia",
+            persona=sample_persona,
+            game_state=game_state,
+            transcript=[],
+            memory=memory,
+            action_type=ActionType.DEFENSE,
+            extra={
+                "partners": ["Bob"],
+                "speaking_order": {"position": 1, "total": 2, "spoken": [], "remaining": ["Bob"]},
+                "defense_context": {"tied_players": ["Alice", "Bob"]},
+            },
+        )
+
+        sections = split_sections(context)
+
+        assert list(sections) == [
+            "identity",
+            "playbook",
+            "rules",
+            "role_info",
+            "state",
+            "speaking_order",
+            "defense",
+            "transcript",
+            "memory",
+            "action",
+        ]
+        assert "\n\n".join(sections.values()) == context
+        assert sections["action"].startswith("[YOUR TASK: DEFENSE]")
+
+    def test_compiled_prompt_matches_rendered_prefix(
+        self, builder, sample_persona, game_state, memory
+    ):
+        """A compiled prompt yields byte-identical contexts, starting with its prefix."""
+        compiled = compile_prompt("Alice", "mafia", sample_persona)
+        args = ("Alice", "mafia", sample_persona, game_state, [], memory, ActionType.SPEAK)
+        extra = {"partners": ["Bob"]}
+
+        context = builder.build_context(*args, extra=extra, compiled=compiled)
+        system = builder.build_system_prompt(
+            "Alice", "mafia", sample_persona, extra, compiled=compiled
+        )
+
+        assert context == builder.build_context(*args, extra=extra)
+        assert context.startswith(compiled.prefix + "\n\n[MAFIA INFO]")
+        assert system.startswith(compiled.prefix)
+        assert compiled.playbook in compiled.prefix
+        assert compiled.rules in compiled.prefix
+
+    def test_compiled_prompts_are_shared(self, sample_persona):
+        """Equal (name, role, persona) reuse one compiled prompt, across agents too."""
+        from src.players.agent import PlayerAgent
+
+        compiled = compile_prompt("Alice", "town", sample_persona)
+        agents = [
+            PlayerAgent("Alice", sample_persona.model_copy(deep=True), "town", 0, provider=None)
+            for _ in range(2)
+        ]
+
+        assert compile_prompt("Alice", "town", sample_persona.model_copy()) is compiled
+        assert all(agent.prompt is compiled for agent in agents)
+        assert compile_prompt("Alice", "doctor", sample_persona) is not compiled
+
 
 class TestNightZeroPrompt:
     """Tests for Night Zero coordination prompt."""
@@ -642,3 +908,84 @@ class TestTranscriptFullMode:
         # All rounds should be DayRoundTranscript (not compressed)
         for item in transcript:
             assert hasattr(item, "speeches"), "Expected full transcript, got compressed"
+
+
+class TestTranscriptDelta:
+    """Session turns send only the transcript lines not sent before."""
+
+    @pytest.fixture
+    def game_state(self):
+        return GameState(
+            phase="day_1",
+            round_number=1,
+            living_players=["Alice", "Bob", "Charlie", "Diana"],
+            dead_players=[],
+            nominated_players=["Bob"],
+        )
+
+    @staticmethod
+    def _turn(builder, game_state, transcript, seen=None):
+        return builder.build_turn(
+            player_name="Diana",
+            role="town",
+            game_state=game_state,
+            transcript=transcript,
+            memory=PlayerMemory(facts={}, beliefs={}),
+            action_type=ActionType.SPEAK,
+            seen=seen,
+        )
+
+    def test_repeated_nomination_is_sent(self, game_state):
+        """A second identical nomination line still reaches the session."""
+        builder = ContextBuilder()
+        day = DayRoundTranscript(
+            round_number=1,
+            night_kill=None,
+            last_words=None,
+            speeches=[Speech(speaker="Alice", text="Bob is odd", nomination="Bob")],
+            votes={},
+            vote_outcome="pending",
+        )
+        _, seen = self._turn(builder, game_state, [day])
+        day.speeches.append(Speech(speaker="Charlie", text="Bob too", nomination="Bob"))
+
+        turn, _ = self._turn(builder, game_state, [day], seen)
+
+        assert '--- Day 1 (new) ---\n\nCharlie: "Bob too"\n  Nominated: Bob' in turn
+        assert "Bob is odd" not in turn
+
+    def test_summary_sent_once_after_compression(self, game_state):
+        """A round's LLM summary is sent when it is compressed, then not again."""
+        from src.schemas import CompressedRoundSummary
+
+        builder = ContextBuilder()
+        day = DayRoundTranscript(
+            round_number=1,
+            night_kill=None,
+            last_words=None,
+            speeches=[Speech(speaker="Alice", text="Bob is odd", nomination="Bob")],
+            votes={"Alice": "Bob"},
+            vote_outcome="eliminated:Bob",
+        )
+        compressed = CompressedRoundSummary(
+            round_number=1,
+            night_death=None,
+            vote_death="Bob",
+            vote_result="eliminated:Bob",
+            summary="Alice led the case against Bob.",
+        )
+        _, seen = self._turn(builder, game_state, [day])
+
+        turn, seen = self._turn(builder, game_state, [compressed], seen)
+        again, _ = self._turn(builder, game_state, [compressed], seen)
+
+        assert "--- Day 1 (summary) ---\nSummary: Alice led the case against Bob." in turn
+        assert "Vote result" not in turn
+        assert "Summary:" not in again
+
+    def test_rewritten_lines_are_counted(self):
+        """Without a sent prefix, lines are diffed as a multiset."""
+        new = ContextBuilder._new_round_lines(1, ["a", "b"], ["c", "a", "b", "a"])
+
+        assert new == ["\n--- Day 1 (new) ---", "c", "a"]
+
@@ -1,12 +1,18 @@
 """Integration tests for game loop."""
 
+import asyncio
+import json
+import time
+from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
 
 from src.engine.game import GameConfig, GameRunner
+from src.engine.monitor import RuntimeMonitor
 from src.engine.voting import VoteResolver
 from src.personas.initial import get_personas
+from src.providers.fake import FakeProvider
 from src.schemas import PlayerMemory
 from tests.sgr_helpers import (
     make_defense_response,
@@ -506,6 +512,81 @@ class TestGameIntegration:
         assert result.winner == "mafia"
 
 
+    async def test_profile_writes_phase_profiles(self, personas, tmp_path):
+        """--profile records every phase and writes folded stacks and a summary."""
+        config = GameConfig(
+            player_names=list(personas.keys()),
+            personas=personas,
+            provider=FakeProvider(latency=0.001, seed=3),
+            output_dir=str(tmp_path),
+            seed=3,
+            profile=True,
+        )
+
+        result = await GameRunner(config).run()
+
+        profile_dir = Path(result.profile_path)
+        assert profile_dir.parent == tmp_path
+        phases = json.loads((profile_dir / "summary.json").read_text())
+        names = [phase["name"] for phase in phases]
+        assert names[0] == "night_zero"
+        assert "day_1" in names
+        assert names[-1] == "finalize"
+        assert sum(phase["provider_calls"] for phase in phases) > 0
+        assert all(phase["provider_wait"] <= phase["wall"] + 1e-6 for phase in phases)
+        assert (profile_dir / "summary.txt").exists()
+        assert len(list(profile_dir.glob("*.folded"))) == len(phases)
+
+    async def test_prompt_sizes_written_next_to_log(self, personas, tmp_path):
+        """--prompt-sizes measures every provider call by context section."""
+        provider = FakeProvider(seed=4)
+        config = GameConfig(
+            player_names=list(personas.keys()),
+            personas=personas,
+            provider=provider,
+            output_dir=str(tmp_path),
+            seed=4,
+            prompt_sizes=True,
+        )
+
+        result = await GameRunner(config).run()
+
+        data = json.loads(Path(result.prompt_sizes_path).read_text())
+        assert Path(result.prompt_sizes_path).parent.name == "prompts"
+        assert len(data["calls"]) == provider.calls
+        assert data["summary"]["calls"] == provider.calls
+        assert "other" not in data["summary"]["heaviest"]
+        assert {"identity", "rules", "transcript", "memory", "action"} <= set(
+            data["summary"]["heaviest"]
+        )
+
+    async def test_summarize_rounds_reaches_older_rounds(self, personas, tmp_path):
+        """Background summaries replace rounds that left the full-detail window."""
+        prompts: list[str] = []
+
+        class RecordingProvider(FakeProvider):
+            async def act(self, action_type, context, **kwargs):
+                prompts.append(context)
+                return await super().act(action_type, context, **kwargs)
+
+        config = GameConfig(
+            player_names=list(personas.keys()),
+            personas=personas,
+            provider=RecordingProvider(latency=0.001, seed=3),  # Calls yield to the loop
+            output_dir=str(tmp_path),
+            seed=3,
+            summarize_rounds=True,
+        )
+
+        runner = GameRunner(config)
+        result = await runner.run()
+
+        assert result.rounds >= 3
+        assert runner.summarizer.summaries
+        assert any("[YOUR TASK: SUMMARIZE ROUND]" in prompt for prompt in prompts)
+        assert any("Summary: Fake summary." in prompt for prompt in prompts)
+
+
 class TestSpeakingOrder:
     """Tests for speaking order rotation."""
 
@@ -1106,3 +1187,72 @@ class TestMafiaCoordination:
         assert final_vote.data.get("coordination_round") == 2
         assert final_vote.data.get("decided_by") == expected_decider
         assert final_vote.data.get("final_target") == targets[0]
+
+
+class TestRuntimeMonitor:
+    """Event-loop lag and in-flight call monitor."""
+
+    async def test_flags_stall_with_blocking_stack(self):
+        """A blocking call on the loop is reported with its stack and task."""
+        monitor = RuntimeMonitor(interval=0.01, stall_threshold=0.05)
+
+        async def serialize_log():
+            time.sleep(0.2)  # Stands in for CPU-heavy work on the loop
+
+        async with monitor:
+            await asyncio.sleep(0.03)
+            await asyncio.create_task(serialize_log(), name="game-log")
+            await asyncio.sleep(0.05)
+
+        assert monitor.stall_count == 1
+        stall = monitor.stalls[0]
+        assert stall.task == "game-log"
+        assert any("serialize_log" in line for line in stall.stack)
+        assert not stall.ongoing
+        assert stall.duration >= 0.15
+        assert monitor.snapshot()["loop_lag_ms"]["max"] >= 150
+
+    async def test_serves_in_flight_calls_per_game(self, tmp_path):
+        """The HTTP endpoint reports in-flight calls for running games."""
+        personas = get_personas()
+        monitor = RuntimeMonitor(interval=0.01)
+        monitor.add_queue("rate_limiter", lambda: 3)
+        runners = [
+            GameRunner(
+                GameConfig(
+                    player_names=list(personas),
+                    personas=personas,
+                    provider=FakeProvider(latency=0.005, seed=seed),
+                    output_dir=str(tmp_path),
+                    seed=seed,
+                    monitor=monitor,
+                )
+            )
+            for seed in range(2)
+        ]
+
+        async def fetch() -> dict:
+            reader, writer = await asyncio.open_connection("127.0.0.1", monitor.port)
+            writer.write(b"GET / HTTP/1.1\r\nhost: localhost\r\n\r\n")
+            response = await reader.read()
+            writer.close()
+            return json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+        await monitor.start(port=0, dump_path=tmp_path / "monitor.json", dump_interval=0.05)
+        try:
+            games = asyncio.gather(*(runner.run() for runner in runners))
+            await asyncio.sleep(0.1)
+            during = await fetch()
+            await games
+            await asyncio.sleep(0.06)
+            after = await fetch()
+        finally:
+            await monitor.stop()
+
+        assert during["games"] == 2
+        assert set(during["in_flight"]["by_game"]) == {r.event_log.game_id for r in runners}
+        assert during["in_flight"]["total"] >= 1
+        assert during["queues"] == {"rate_limiter": 3}
+        assert after["games"] == 0
+        assert after["provider_calls"] == sum(r.config.provider.calls for r in runners)
+        assert json.loads((tmp_path / "monitor.json").read_text())["loop_lag_ms"]["samples"] > 0
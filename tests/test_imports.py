@@ -0,0 +1,96 @@
+"""Import-time regression tests for CLI startup."""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.providers.registry import create_provider, get_provider_class
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Microseconds of imports allowed for `python -m src.engine.run --help`.
+# About 0.3s here (pydantic schemas dominate); eager imports took 2.7s.
+HELP_IMPORT_BUDGET_US = 1_000_000
+
+# Modules that a run without any game must not load
+HEAVY_MODULES = ("anthropic", "google.genai", "langfuse", "rich", "pydantic_settings")
+
+_IMPORT_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\S+)")
+
+# Runs a module as `python -m` does (argv included), ignoring its exit
+_RUN_MODULE = """
+import runpy, sys
+sys.argv = [{module!r}, *{args!r}]
+try:
+    runpy.run_module({module!r}, run_name="__main__", alter_sys=True)
+except SystemExit:
+    pass
+"""
+
+
+def _run(code: str) -> tuple[set[str], int]:
+    """
+    Run code in a fresh interpreter with -X importtime.
+
+    Modules are read from sys.modules afterwards: imports made through
+    importlib.import_module are loaded but not listed by -X importtime.
+
+    Returns:
+        (modules loaded, total microseconds spent in top-level imports)
+    """
+    code += "\nimport sys\nprint('\\n'.join(sys.modules), file=sys.__stdout__)\n"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Nested imports are indented and already counted in their parent's total
+    lines = result.stderr.splitlines()
+    total = sum(int(match.group(1)) for match in map(_IMPORT_LINE.match, lines) if match)
+    return set(result.stdout.split()), total
+
+
+def _heavy(modules: set[str]) -> list[str]:
+    return sorted(
+        name
+        for name in modules
+        if name.startswith("src.personas.")
+        or any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    )
+
+
+class TestCliImports:
+    def test_help_stays_within_import_budget(self):
+        """--help skips the engine, provider SDKs, telemetry and personas."""
+        modules, total = _run(_RUN_MODULE.format(module="src.engine.run", args=["--help"]))
+
+        assert "argparse" in modules
+        assert _heavy(modules) == []
+        assert "src.engine.game" not in modules
+        assert total < HELP_IMPORT_BUDGET_US
+
+    def test_providers_package_does_not_load_sdks(self):
+        """Lazy provider exports leave the SDK modules unloaded."""
+        modules, _ = _run("from src.providers import FakeProvider, RetryBudget")
+
+        assert "src.providers.fake" in modules
+        assert _heavy(modules) == []
+
+
+class TestProviderRegistry:
+    def test_create_registered_provider(self):
+        """Providers are created by name."""
+        provider = create_provider("fake", model="fake-model")
+
+        assert provider.model == "fake-model"
+        assert get_provider_class("fake").__name__ == "FakeProvider"
+
+    def test_unknown_provider_raises(self):
+        """Unknown names list the registered ones."""
+        with pytest.raises(ValueError, match="anthropic, fake, google"):
+            get_provider_class("openai")
@@ -0,0 +1,112 @@
+"""Tests for critical-path latency analysis of game logs."""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.analysis.latency import analyze_log, main, summarize
+from src.engine.game import GameConfig, GameRunner
+from src.personas.initial import get_personas
+from src.providers.fake import FakeProvider
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _log(events: list[tuple[float, str, dict]]) -> dict:
+    """Game log whose events happen at the given offsets in seconds."""
+    return {
+        "game_id": "g1",
+        "players": [
+            {"name": "Alice", "persona_id": "Alice", "role": "mafia"},
+            {"name": "Bob", "persona_id": "Bob", "role": "doctor"},
+            {"name": "Cara", "persona_id": "Cara", "role": "detective"},
+            {"name": "Dan", "persona_id": "Dan", "role": "town"},
+        ],
+        "events": [
+            {
+                "type": kind,
+                "timestamp": (START + timedelta(seconds=offset)).isoformat(),
+                "data": data,
+            }
+            for offset, kind, data in events
+        ],
+    }
+
+
+class TestLatencyAnalysis:
+    def test_attributes_gaps_to_calls_and_stages(self):
+        """Event gaps become call latencies; vote gaps are shared by voters."""
+        day = {"phase": "day_1"}
+        night = {"phase": "night_1"}
+        log = _log([
+            (0, "phase_start", day),
+            (2, "speech", {**day, "speaker": "Alice"}),
+            (5, "speech", {**day, "speaker": "Bob"}),
+            (9, "vote_round", {**day, "round": 1, "votes": {"Alice": "Bob", "Bob": "Alice"}}),
+            (10, "phase_start", night),
+            (13, "mafia_discussion", {**night, "speaker": "Alice", "coordination_round": 1}),
+            (13, "mafia_vote", night),
+            (15, "doctor_protection", {**night, "protector": "Bob"}),
+            (16, "investigation", {**night, "target": "Alice"}),
+            (16, "night_resolution", night),
+        ])
+
+        game = analyze_log(log)
+
+        calls = [(c.stage, c.player, c.seconds, c.estimated) for c in game.calls]
+        assert calls == [
+            ("discussion", "Alice", 2, False),
+            ("discussion", "Bob", 3, False),
+            ("vote", "Alice", 2, True),
+            ("vote", "Bob", 2, True),
+            ("mafia_round_1", "Alice", 3, False),
+            ("doctor", "Bob", 2, False),
+            ("detective", "Cara", 1, False),
+        ]
+        assert game.wall == 16
+        assert game.stages[("day_1", "vote")] == 4
+        assert game.stages[("night_1", "engine")] == 1
+        # Two voters could overlap (4 s -> 2 s); night roles 3 + 2 + 1 -> 3 s
+        assert game.parallel_savings() == pytest.approx({"vote": 2.0, "night_roles": 3.0})
+
+    def test_timeout_merges_with_logged_action(self):
+        """A timed-out call is charged up to its action event, once."""
+        day = {"phase": "day_1"}
+        log = _log([
+            (0, "phase_start", day),
+            (30, "timeout", {**day, "player": "Dan", "action_type": "speak"}),
+            (30.5, "speech", {**day, "speaker": "Dan"}),
+            (32, "speech", {**day, "speaker": "Alice"}),
+        ])
+
+        game = analyze_log(log)
+
+        assert [(c.player, c.seconds, c.timed_out) for c in game.calls] == [
+            ("Dan", 30.5, True),
+            ("Alice", 1.5, False),
+        ]
+
+    async def test_summary_over_real_logs(self, tmp_path, capsys):
+        """Logs written by GameRunner are analyzed end to end."""
+        personas = get_personas()
+        for seed in range(2):
+            config = GameConfig(
+                player_names=list(personas),
+                personas=personas,
+                provider=FakeProvider(seed=seed),
+                output_dir=str(tmp_path),
+                seed=seed,
+            )
+            await GameRunner(config).run()
+
+        output = tmp_path / "latency.json"
+        assert main([str(tmp_path), "--json", str(output)]) == 0
+
+        summary = json.loads(output.read_text())
+        assert summary["games"] == 2
+        assert {"speak", "vote"} <= set(summary["by_action"])
+        assert {"day", "night", "night_zero"} <= set(summary["by_phase"])
+        assert "discussion" in summary["critical_path"]
+        assert "Potential savings" in capsys.readouterr().out
+        assert summarize([])["calls"] == 0
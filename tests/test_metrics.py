@@ -0,0 +1,115 @@
+"""Tests for the in-process metrics registry."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.engine.game import GameConfig, GameRunner
+from src.metrics import (
+    MetricsRegistry,
+    reset_game_metrics,
+    set_game_metrics,
+    start_metrics_server,
+)
+from src.personas.initial import get_personas
+from src.providers.fake import FakeProvider
+
+
+class TestMetricsRegistry:
+    def test_render_prometheus_text(self):
+        """Counters, gauges and histograms render in the text exposition format."""
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls made", ("action",))
+        calls.inc(action="speak")
+        calls.inc(2, action='say "hi"\n')
+        registry.gauge("in_progress", "Running").set(3)
+        latency = registry.histogram("latency_seconds", "Latency", ("action",), (0.1, 1.0))
+        latency.observe(0.05, action="vote")
+        latency.observe(0.1, action="vote")
+        latency.observe(5.0, action="vote")
+
+        text = registry.render()
+
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{action="speak"} 1' in text
+        assert 'calls_total{action="say \\"hi\\"\\n"} 2' in text
+        assert "in_progress 3" in text
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{action="vote",le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{action="vote",le="1"} 2' in text
+        assert 'latency_seconds_bucket{action="vote",le="+Inf"} 3' in text
+        assert 'latency_seconds_sum{action="vote"} 5.15' in text
+        assert 'latency_seconds_count{action="vote"} 3' in text
+
+    def test_labels_must_match_definition(self):
+        """Missing or unknown labels are rejected."""
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls made", ("action",))
+        with pytest.raises(ValueError, match="takes labels"):
+            calls.inc()
+        with pytest.raises(ValueError, match="takes labels"):
+            calls.inc(action="speak", model="x")
+        with pytest.raises(ValueError, match="different type"):
+            registry.gauge("calls_total", "Calls made", ("action",))
+
+    async def test_game_registry_mirrors_updates_in_its_context(self):
+        """Updates from a game's tasks reach that game's registry only."""
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls made", ("action",))
+        games = [MetricsRegistry(), MetricsRegistry()]
+
+        async def play(game: MetricsRegistry, count: int) -> None:
+            token = set_game_metrics(game)
+            try:
+                for _ in range(count):
+                    await asyncio.sleep(0)
+                    calls.inc(action="speak")
+            finally:
+                reset_game_metrics(token)
+
+        await asyncio.gather(play(games[0], 2), play(games[1], 3))
+
+        assert calls.value(action="speak") == 5
+        assert games[0].get("calls_total").value(action="speak") == 2
+        assert games[1].snapshot()["calls_total"]["samples"] == [
+            {"labels": {"action": "speak"}, "value": 3.0}
+        ]
+
+    async def test_game_log_snapshot_and_endpoint(self, tmp_path):
+        """Each game log carries its own metrics; the endpoint serves process totals."""
+        personas = get_personas()
+        runner = GameRunner(
+            GameConfig(
+                player_names=list(personas),
+                personas=personas,
+                provider=FakeProvider(seed=5),
+                output_dir=str(tmp_path),
+                seed=5,
+            )
+        )
+
+        result = await runner.run()
+
+        with open(result.log_path) as f:
+            metrics = json.load(f)["metadata"]["metrics"]
+        finished = metrics["mafia_games_finished_total"]["samples"]
+        assert finished == [{"labels": {"winner": result.winner}, "value": 1.0}]
+        assert metrics["mafia_games_started_total"]["samples"][0]["value"] == 1.0
+        actions = sum(s["value"] for s in metrics["mafia_agent_actions_total"]["samples"])
+        assert actions == runner.config.provider.calls
+        phases = {s["labels"]["phase"] for s in metrics["mafia_phase_seconds"]["samples"]}
+        assert {"night_zero", "day", "night"} <= phases
+
+        server = await start_metrics_server(0)
+        try:
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /metrics HTTP/1.1\r\nhost: localhost\r\n\r\n")
+            response = (await reader.read()).decode()
+            writer.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+        assert response.startswith("HTTP/1.1 200 OK")
+        assert "# TYPE mafia_games_finished_total counter" in response
@@ -0,0 +1,111 @@
+"""Tests for the compiled persona store."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import src.config
+import src.personas.initial
+from src.engine.run import parse_args, run_game_cli
+from src.personas.initial import get_personas
+from src.personas.store import (
+    COMPILED_PATH,
+    PERSONA_DIR,
+    PersonaStore,
+    build_store,
+    source_digest,
+)
+from src.schemas import Persona
+
+
+def _write_persona(directory, persona_id, name, tags, **overrides):
+    source = json.loads((PERSONA_DIR / "sherlock_holmes.json").read_text())
+    source.update(id=persona_id, tags=tags, **overrides)
+    source["identity"] = {**source["identity"], "name": name}
+    (directory / f"{persona_id}.json").write_text(json.dumps(source))
+
+
+class TestPersonaStore:
+    def test_compiled_store_is_up_to_date(self):
+        """The shipped compiled file matches the persona sources."""
+        store = PersonaStore.load(COMPILED_PATH)
+
+        assert store.source_digest == source_digest(PERSONA_DIR), (
+            "run `python -m src.personas.store build`"
+        )
+        assert len(store) == len(list(PERSONA_DIR.glob("*.json")))
+
+    def test_initial_roster_matches_sources(self):
+        """The default roster is the ten validated source personas, by player name."""
+        personas = get_personas()
+
+        assert len(personas) == 10
+        for path in PERSONA_DIR.glob("*.json"):
+            data = json.loads(path.read_text())
+            persona = Persona.model_validate(
+                {key: value for key, value in data.items() if key not in ("id", "tags")}
+            )
+            assert personas[persona.identity.name].model_dump() == persona.model_dump()
+
+    def test_large_store_builds_only_selected_personas(self, tmp_path, monkeypatch):
+        """A tournament-sized store loads without building every persona."""
+        sources = tmp_path / "data"
+        sources.mkdir()
+        for index in range(120):
+            tags = ["league", "even" if index % 2 == 0 else "odd"]
+            _write_persona(sources, f"p{index:03}", f"Player {index}", tags)
+        path = build_store(sources, tmp_path / "compiled.json")
+
+        built: list[str] = []
+        validate = Persona.model_validate
+
+        def counting(data, *args, **kwargs):
+            built.append(data["identity"]["name"])
+            return validate(data, *args, **kwargs)
+
+        monkeypatch.setattr(Persona, "model_validate", counting)
+        store = PersonaStore.load(path)
+        assert built == []
+        roster = store.roster(tag="even", count=10, seed=3)
+
+        assert sorted(built) == sorted(roster)  # Each selected persona built once
+        assert len(store) == 120
+        assert store.tags() == {"league", "even", "odd"}
+        assert len(store.ids("odd")) == 60
+        assert roster == store.roster(tag="even", count=10, seed=3)
+        assert len(roster) == 10
+        assert all(int(name.split()[1]) % 2 == 0 for name in roster)
+        assert store.by_name("Player 7") is store.get("p007")
+
+    def test_build_rejects_invalid_and_duplicate_personas(self, tmp_path):
+        """Validation errors name the offending file."""
+        _write_persona(tmp_path, "a", "Same Name", [])
+        _write_persona(tmp_path, "b", "Same Name", [])
+        with pytest.raises(ValueError, match="Duplicate persona name 'Same Name' in b.json"):
+            build_store(tmp_path, tmp_path / "out.json")
+
+        _write_persona(tmp_path, "b", "Other", [], tactics={"town": ["only one"]})
+        with pytest.raises(ValueError, match="Invalid persona b.json"):
+            build_store(tmp_path, tmp_path / "out.json")
+
+    def test_roster_count_larger_than_matches(self):
+        """Asking for more personas than match a tag fails clearly."""
+        with pytest.raises(ValueError, match="Need 11 personas tagged 'initial'"):
+            PersonaStore.load(COMPILED_PATH).roster(tag="initial", count=11)
+
+    async def test_cli_reports_missing_store(self, monkeypatch, capsys):
+        """The game CLI points at the store build command when loading fails."""
+        def missing():
+            raise FileNotFoundError(COMPILED_PATH)
+
+        monkeypatch.setattr("sys.argv", ["run"])
+        monkeypatch.setattr(
+            src.config, "get_settings", lambda: SimpleNamespace(gemini_api_key="key")
+        )
+        monkeypatch.setattr(src.personas.initial, "get_personas", missing)
+
+        assert await run_game_cli(parse_args()) == 1
+        out = capsys.readouterr().out
+        assert "python -m src.personas.store build" in out
+        assert "initial.py" not in out
@@ -1,13 +1,20 @@
 """Tests for player agent and action handling."""
 
+import asyncio
+import time
 from unittest.mock import AsyncMock
 
 import pytest
 
+from src.engine.events import EventLog
+from src.engine.phases import NightPhase
+from src.metrics import MetricsRegistry, reset_game_metrics, set_game_metrics
 from src.players.actions import ActionHandler, ActionValidationError
 from src.players.agent import PlayerAgent
 from src.providers.base import InvalidResponseError, ProviderError, RetryExhausted
-from src.schemas import ActionType, GameState, PlayerMemory
+from src.providers.retry import RetryBudget, reset_game_retry_budget, set_game_retry_budget
+from src.providers.routing import ActionRoute, ActionRouter, RouteRule, RoutingPolicy
+from src.schemas import ActionType, DayRoundTranscript, GameState, PlayerMemory, Speech
 from tests.sgr_helpers import (
     make_investigation_response,
     make_night_kill_response,
@@ -456,6 +463,186 @@ class TestPlayerAgent:
         assert mock_provider.act.call_count == 1
         assert response.output["nomination"] in game_state.living_players
 
+    async def test_act_passes_route_when_router_configured(
+        self, mock_provider, sample_persona, game_state, memory
+    ):
+        """Router picks a route per action and charges each call to the budget."""
+        policy = RoutingPolicy(
+            rules=[
+                RouteRule(
+                    action_type=ActionType.SPEAK,
+                    route=ActionRoute(thinking_level="LOW", cost=0.01),
+                )
+            ]
+        )
+        router = ActionRouter(policy)
+        agent = PlayerAgent(
+            name="Alice",
+            persona=sample_persona,
+            role="town",
+            seat=0,
+            provider=mock_provider,
+            router=router,
+        )
+        mock_provider.act = AsyncMock(return_value=make_speak_response(nomination="Bob"))
+
+        await agent.act(game_state, [], memory, ActionType.SPEAK)
+
+        route = mock_provider.act.call_args.kwargs["route"]
+        assert route.thinking_level == "LOW"
+        assert router.calls == 1
+        assert router.spent_cost == pytest.approx(0.01)
+
+    async def test_act_times_out_to_default(
+        self, mock_provider, sample_persona, game_state, memory
+    ):
+        """A hung provider degrades to the default action and logs a timeout."""
+        event_log = EventLog()
+        agent = PlayerAgent(
+            name="Alice",
+            persona=sample_persona,
+            role="town",
+            seat=0,
+            provider=mock_provider,
+            deadlines={ActionType.VOTE: 0.05},
+            event_log=event_log,
+        )
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        mock_provider.act = hang
+
+        response = await agent.act(game_state, [], memory, ActionType.VOTE)
+
+        assert response.output["vote"] == "skip"
+        timeouts = event_log.get_events_of_type("timeout")
+        assert len(timeouts) == 1
+        assert timeouts[0].data["player"] == "Alice"
+        assert timeouts[0].data["reason"] == "action_deadline"
+        # Timeouts are operational details, hidden from the public view
+        assert event_log.get_public_view() == []
+
+    async def test_act_skips_provider_after_game_deadline(
+        self, agent, mock_provider, game_state, memory
+    ):
+        """Once the game budget is spent, actions default without calling the provider."""
+        agent.event_log = EventLog()
+        agent.game_deadline = time.monotonic() - 1
+        mock_provider.act = AsyncMock(return_value=make_speak_response(nomination="Bob"))
+
+        response = await agent.act(game_state, [], memory, ActionType.SPEAK)
+
+        mock_provider.act.assert_not_called()
+        assert response.output["nomination"] in game_state.living_players
+        event = agent.event_log.get_events_of_type("timeout")[0]
+        assert event.data["reason"] == "game_deadline"
+
+    async def test_reasks_stop_when_game_retry_budget_spent(
+        self, agent, mock_provider, game_state, memory
+    ):
+        """Invalid answers are only re-asked while the game retry budget allows."""
+        mock_provider.act = AsyncMock(
+            return_value=make_speak_response(nomination="InvalidPlayer")
+        )
+        token = set_game_retry_budget(RetryBudget(ratio=0.0, initial=1.0))
+        try:
+            response = await agent.act(game_state, [], memory, ActionType.SPEAK)
+        finally:
+            reset_game_retry_budget(token)
+
+        # One paid re-ask, then the default action
+        assert mock_provider.act.call_count == 2
+        assert response.output["nomination"] in game_state.living_players
+
+    async def test_act_records_validation_metrics(
+        self, agent, mock_provider, game_state, memory
+    ):
+        """Rejected answers are counted by reason, as are re-asks and the fallback."""
+        mock_provider.act = AsyncMock(
+            return_value=make_speak_response(nomination="InvalidPlayer")
+        )
+        registry = MetricsRegistry()
+        token = set_game_metrics(registry)
+        try:
+            await agent.act(game_state, [], memory, ActionType.SPEAK)
+        finally:
+            reset_game_metrics(token)
+
+        failures = registry.get("mafia_agent_validation_failures_total")
+        assert failures.value(action="speak", reason="invalid_nomination") == 3
+        assert registry.get("mafia_agent_retries_total").value(action="speak") == 2
+        assert registry.get("mafia_agent_provider_calls_total").value(action="speak") == 3
+        defaults = registry.get("mafia_agent_defaults_total")
+        assert defaults.value(action="speak", reason="invalid") == 1
+
+    async def test_session_mode_sends_only_new_turns(
+        self, mock_provider, sample_persona, game_state, memory
+    ):
+        """In session mode the static prompt is sent once and history grows per turn."""
+        agent = PlayerAgent(
+            name="Alice",
+            persona=sample_persona,
+            role="town",
+            seat=0,
+            provider=mock_provider,
+            sessions=True,
+        )
+        mock_provider.act = AsyncMock(return_value=make_speak_response(nomination="Bob"))
+        transcript = [
+            DayRoundTranscript(
+                round_number=1,
+                night_kill=None,
+                last_words=None,
+                speeches=[Speech(speaker="Bob", text="Hi all", nomination="Charlie")],
+                votes={},
+                vote_outcome="pending",
+            )
+        ]
+
+        await agent.act(game_state, transcript, memory, ActionType.SPEAK)
+        first_turn = mock_provider.act.call_args.args[1]
+        transcript[0].speeches.append(
+            Speech(speaker="Charlie", text="Hello", nomination="Bob")
+        )
+        await agent.act(game_state, transcript, memory, ActionType.SPEAK)
+        second_turn = mock_provider.act.call_args.args[1]
+
+        session = mock_provider.act.call_args.kwargs["session"]
+        assert session is agent.session
+        assert "[GAME RULES]" in session.system
+        assert "[GAME RULES]" not in first_turn
+        assert 'Bob: "Hi all"' in first_turn
+        assert 'Bob: "Hi all"' not in second_turn
+        assert 'Charlie: "Hello"' in second_turn
+        assert "[YOUR TASK: SPEAK]" in second_turn
+        assert [m["role"] for m in session.messages] == ["user", "assistant"] * 2
+        assert session.messages[2]["content"] == second_turn
+
+    async def test_session_skips_defaults_and_compacts(
+        self, mock_provider, sample_persona, game_state, memory
+    ):
+        """Defaulted actions are not recorded; a full session is compacted."""
+        agent = PlayerAgent(
+            name="Alice",
+            persona=sample_persona,
+            role="town",
+            seat=0,
+            provider=mock_provider,
+            sessions=True,
+        )
+        mock_provider.act = AsyncMock(side_effect=ProviderError("down"))
+        await agent.act(game_state, [], memory, ActionType.SPEAK)
+        assert agent.session.messages == []
+
+        mock_provider.act = AsyncMock(return_value=make_speak_response(nomination="Bob"))
+        agent.session.max_turns = 2
+        for _ in range(3):
+            await agent.act(game_state, [], memory, ActionType.SPEAK)
+
+        assert agent.session.compactions == 1
+        assert agent.session.turns == 1
+
     async def test_act_updates_memory_vote(self, agent, mock_provider, memory):
         """Vote action returns updated memory."""
         game_state = GameState(
@@ -585,6 +772,25 @@ class TestPlayerAgentRoles:
         assert extra["results"][0]["target"] == "Bob"
         assert extra["results"][1]["result"] == "Mafia"
 
+    def test_night_history_leaves_earlier_memory_unchanged(self):
+        """Recording an investigation derives a new memory with appended history."""
+        before = PlayerMemory(
+            facts={"investigation_results": [{"target": "Bob", "result": "Not Mafia"}]},
+            beliefs={"suspicions": "Charlie"},
+        )
+        memories = {"Alice": before}
+
+        NightPhase()._record_detective_investigation_history(
+            memories, "Alice", "Charlie", "Mafia", {"reasoning": "quiet"}
+        )
+
+        after = memories["Alice"]
+        assert after.beliefs is before.beliefs
+        assert [r["target"] for r in after.facts["investigation_results"]] == ["Bob", "Charlie"]
+        assert len(after.facts["investigation_history"]) == 1
+        assert after.facts["last_investigation"]["reasoning"] == "quiet"
+        assert len(before.facts["investigation_results"]) == 1
+
     def test_town_agent_has_no_extra(self, mock_provider, sample_persona):
         """Town agent has no special extra context."""
         agent = PlayerAgent(
@@ -0,0 +1,75 @@
+"""Tests for the prompt-size breakdown."""
+
+import json
+
+from src.analysis.prompt_sizes import (
+    PromptSize,
+    format_report,
+    load_prompts,
+    measure_prompt,
+    record_fake_games,
+    summarize,
+)
+from src.engine.context import TranscriptStyle
+
+CONTEXT = "\n\n".join([
+    "[YOUR IDENTITY]\nYou are Alice.",
+    "[GAME RULES]\nRules text",
+    "[CURRENT STATE]\nPhase: day_2\nRound: 2\nLiving players: Alice, Bob",
+    "[TRANSCRIPT]\n\n--- Day 1 (full) ---\n\nBob: \"hello\"",
+    "[YOUR TASK: VOTE]\nVote now.",
+])
+
+
+class TestPromptSizes:
+    def test_measure_prompt_reads_sections_and_round(self):
+        """Sections are measured separately; phase and round come from the state."""
+        prompt = measure_prompt("vote", CONTEXT)
+
+        assert prompt.phase == "day_2"
+        assert prompt.round == 2
+        assert prompt.sections["rules"] == len("[GAME RULES]\nRules text")
+        assert prompt.sections["transcript"] == len(
+            "[TRANSCRIPT]\n\n--- Day 1 (full) ---\n\nBob: \"hello\""
+        )
+        assert prompt.chars == len(CONTEXT) - 2 * 4
+
+    def test_summary_tracks_growth_per_round(self):
+        """Growth lists mean tokens per section for each round."""
+        prompts = [
+            PromptSize("speak", "day_1", 1, {"rules": 400, "transcript": 40}),
+            PromptSize("vote", "day_2", 2, {"rules": 400, "transcript": 800}),
+            PromptSize("vote", "day_2", 2, {"rules": 400, "transcript": 1200}),
+        ]
+
+        summary = summarize(prompts)
+
+        assert list(summary["heaviest"]) == ["transcript", "rules"]
+        assert summary["growth"]["transcript"] == {1: 10, 2: 250}
+        assert summary["growth"]["rules"] == {1: 100, 2: 100}
+        assert summary["by_action"]["vote"]["calls"] == 2
+        assert "transcript" in format_report(summary)
+
+    def test_load_prompts_from_telemetry(self, tmp_path):
+        """Generation events in a telemetry file are measured; others skipped."""
+        path = tmp_path / "telemetry.jsonl"
+        events = [
+            {"type": "generation", "action": "vote", "input": CONTEXT},
+            {"type": "game", "winner": "town"},
+        ]
+        path.write_text("".join(json.dumps(event) + "\n" for event in events))
+
+        prompts = load_prompts([str(path)])
+
+        assert [(p.action, p.round) for p in prompts] == [("vote", 2)]
+
+    async def test_compact_transcript_ab(self):
+        """The same seeded game has a smaller transcript under the compact style."""
+        full = await record_fake_games(1, seed=2)
+        compact = await record_fake_games(1, seed=2, transcript_style=TranscriptStyle.COMPACT)
+
+        assert [p.action for p in full] == [p.action for p in compact]
+        full_transcript = sum(p.sections["transcript"] for p in full)
+        compact_transcript = sum(p.sections["transcript"] for p in compact)
+        assert compact_transcript < 0.8 * full_transcript
+        assert [p.sections["rules"] for p in full] == [p.sections["rules"] for p in compact]
@@ -1,17 +1,45 @@
 """Tests for LLM providers."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.metrics import MetricsRegistry, reset_game_metrics, set_game_metrics
+from src.players.session import PlayerSession
 from src.providers import (
+    ActionRoute,
+    ActionRouter,
+    AnthropicProvider,
+    CircuitBreaker,
+    CircuitState,
+    FailoverProvider,
+    FakeProvider,
     GoogleGenAIProvider,
+    HedgedProvider,
     InvalidResponseError,
+    NonRetryableError,
+    ProviderError,
+    RateLimiter,
+    RetryBudget,
     RetryExhausted,
+    RetryPolicy,
+    RoutingPolicy,
     retry_with_backoff,
 )
+from src.providers import retry as retry_module
+from src.providers.fake import build_fake_output, parse_valid_options
+from src.providers.fake_server import FakeLLMServer, FakeServerConfig
+from src.providers.retry import (
+    ErrorClass,
+    classify_error,
+    get_retry_after,
+    reset_game_retry_budget,
+    set_game_retry_budget,
+)
 from src.schemas import ActionType, SpeakingOutput
+from src.telemetry import TelemetryExporter, configure_telemetry
 from tests.sgr_helpers import make_speak_response
 
 
@@ -79,6 +107,120 @@ class TestRetryDecorator:
         assert call_count == 1
 
 
+class _HTTPError(Exception):
+    """Stand-in for an SDK error carrying an HTTP response."""
+
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = MagicMock(headers=headers or {})
+
+
+class TestRetryPolicy:
+    @pytest.fixture(autouse=True)
+    def fresh_global_budget(self, monkeypatch):
+        monkeypatch.setattr(retry_module, "GLOBAL_RETRY_BUDGET", RetryBudget())
+
+    def test_classifies_status_codes(self):
+        """4xx is fatal except timeouts, conflicts and rate limits."""
+        assert classify_error(_HTTPError(400)) == ErrorClass.FATAL
+        assert classify_error(_HTTPError(422)) == ErrorClass.FATAL
+        assert classify_error(_HTTPError(408)) == ErrorClass.TRANSIENT
+        assert classify_error(_HTTPError(429)) == ErrorClass.RATE_LIMITED
+        assert classify_error(_HTTPError(503)) == ErrorClass.TRANSIENT
+        assert classify_error(ConnectionError("reset")) == ErrorClass.TRANSIENT
+
+    def test_classifies_through_cause_chain(self):
+        """Wrapped SDK errors keep their classification."""
+        try:
+            try:
+                raise _HTTPError(400)
+            except _HTTPError as e:
+                raise RuntimeError("wrapped") from e
+        except RuntimeError as wrapped:
+            assert classify_error(wrapped) == ErrorClass.FATAL
+
+    def test_parses_retry_after(self):
+        """Retry-After is read in seconds, milliseconds or as an HTTP date."""
+        assert get_retry_after(_HTTPError(429, {"retry-after": "3"})) == 3.0
+        assert get_retry_after(_HTTPError(429, {"retry-after-ms": "250"})) == 0.25
+        past = {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        assert get_retry_after(_HTTPError(429, past)) == 0.0
+        assert get_retry_after(ValueError("no response")) is None
+
+    def test_full_jitter_within_cap(self):
+        """Delays are drawn between zero and the capped exponential."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+        delays = [policy.delay(5) for _ in range(200)]
+        assert all(0 <= d <= 4.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_after_overrides_jitter(self):
+        """Rate-limit hints are honoured up to max_retry_after."""
+        policy = RetryPolicy(max_retry_after=10.0)
+        assert policy.delay(0, ErrorClass.RATE_LIMITED, 2.5) == 2.5
+        assert policy.delay(0, ErrorClass.RATE_LIMITED, 99.0) == 10.0
+
+    async def test_fatal_errors_not_retried(self):
+        """4xx request errors raise NonRetryableError on the first attempt."""
+        call_count = 0
+
+        @retry_with_backoff(max_attempts=3, base_delay=0.01)
+        async def bad_request():
+            nonlocal call_count
+            call_count += 1
+            raise _HTTPError(400)
+
+        with pytest.raises(NonRetryableError):
+            await bad_request()
+        assert call_count == 1
+
+    async def test_rate_limit_sleeps_for_retry_after(self):
+        """A 429 waits for the server's hint instead of the jittered delay."""
+        attempts = [_HTTPError(429, {"retry-after": "7"})]
+
+        @retry_with_backoff(max_attempts=3, base_delay=0.01)
+        async def rate_limited():
+            if attempts:
+                raise attempts.pop()
+            return "ok"
+
+        with patch("src.providers.base.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await rate_limited() == "ok"
+        sleep.assert_awaited_once_with(7.0)
+
+    async def test_game_budget_stops_retry_storm(self):
+        """Once the game budget is spent, failures are not retried."""
+        budget = RetryBudget(ratio=0.0, initial=1.0)
+        call_count = 0
+
+        @retry_with_backoff(max_attempts=3, base_delay=0.0)
+        async def always_fails():
+            nonlocal call_count
+            call_count += 1
+            raise _HTTPError(503)
+
+        token = set_game_retry_budget(budget)
+        try:
+            with pytest.raises(RetryExhausted, match="budget exhausted"):
+                await always_fails()
+        finally:
+            reset_game_retry_budget(token)
+
+        # One paid retry, then denied
+        assert call_count == 2
+        assert budget.summary()["retries"] == 1
+        assert budget.summary()["denied"] == 1
+
+    def test_budget_refills_with_requests(self):
+        """First attempts earn retries at the configured ratio."""
+        budget = RetryBudget(ratio=0.5, initial=0.0)
+        assert not budget.can_retry()
+        budget.record_request()
+        budget.record_request()
+        assert budget.can_retry()
+
+
 class TestGoogleGenAIProvider:
     @pytest.fixture
     def mock_genai_client(self):
@@ -170,15 +312,13 @@ class TestGoogleGenAIProvider:
                 context="Test context",
             )
 
-    async def test_records_usage_with_langfuse(
-        self, provider, mock_genai_client, sample_response, monkeypatch
+    async def test_records_usage_through_telemetry_exporter(
+        self, provider, mock_genai_client, sample_response
     ):
-        """Langfuse receives usage details when available."""
-        from src.providers import google as provider_module
-
-        mock_langfuse = MagicMock()
-        monkeypatch.setattr(provider_module, "LANGFUSE_AVAILABLE", True)
-        monkeypatch.setattr(provider_module, "Langfuse", MagicMock(return_value=mock_langfuse))
+        """Usage is handed to the background exporter instead of a per-call client."""
+        sink = MagicMock()
+        exporter = TelemetryExporter([sink], sample_rate=1.0)
+        previous = configure_telemetry(exporter)
 
         usage = MagicMock()
         usage.prompt_token_count = 12
@@ -186,15 +326,20 @@ class TestGoogleGenAIProvider:
         sample_response.usage_metadata = usage
         mock_genai_client.aio.models.generate_content = AsyncMock(return_value=sample_response)
 
-        await provider.act(
-            action_type=ActionType.SPEAK,
-            context="Test context",
-        )
+        try:
+            await provider.act(
+                action_type=ActionType.SPEAK,
+                context="Test context",
+            )
+        finally:
+            configure_telemetry(previous)
+            exporter.close()
 
-        mock_langfuse.update_current_generation.assert_called_once()
-        call_kwargs = mock_langfuse.update_current_generation.call_args.kwargs
-        assert call_kwargs["model"] == "gemini-3-flash-preview"
-        assert call_kwargs["usage_details"]["total"] == 20
+        (batch,), _ = sink.export.call_args
+        assert batch[0]["type"] == "generation"
+        assert batch[0]["model"] == "gemini-3-flash-preview"
+        assert batch[0]["action"] == "speak"
+        assert batch[0]["usage"]["total"] == 20
 
     async def test_act_retries_on_provider_error(
         self, provider, mock_genai_client, sample_response
@@ -227,3 +372,445 @@ class TestGoogleGenAIProvider:
                 action_type=ActionType.SPEAK,
                 context="Test context",
             )
+
+    async def test_act_applies_route_overrides(
+        self, provider, mock_genai_client, sample_response
+    ):
+        """Route overrides model, thinking level and request timeout."""
+        mock_genai_client.aio.models.generate_content = AsyncMock(
+            return_value=sample_response
+        )
+
+        await provider.act(
+            action_type=ActionType.SPEAK,
+            context="Test context",
+            route=ActionRoute(model="gemini-lite", thinking_level="LOW", timeout=2.5),
+        )
+
+        call_kwargs = mock_genai_client.aio.models.generate_content.call_args.kwargs
+        assert call_kwargs["model"] == "gemini-lite"
+        assert call_kwargs["config"]["thinking_config"].thinking_level == "LOW"
+        assert call_kwargs["config"]["http_options"] == {"timeout": 2500}
+
+
+    async def test_act_sends_session_history(
+        self, provider, mock_genai_client, sample_response
+    ):
+        """A session becomes the system instruction plus prior turns."""
+        mock_genai_client.aio.models.generate_content = AsyncMock(
+            return_value=sample_response
+        )
+        session = PlayerSession(system="[YOUR IDENTITY]\nYou are Alice.")
+        session.record("turn 1", '{"speech": "hi"}', {})
+
+        await provider.act(action_type=ActionType.SPEAK, context="turn 2", session=session)
+
+        call_kwargs = mock_genai_client.aio.models.generate_content.call_args.kwargs
+        assert call_kwargs["config"]["system_instruction"] == session.system
+        assert call_kwargs["contents"] == [
+            {"role": "user", "parts": [{"text": "turn 1"}]},
+            {"role": "model", "parts": [{"text": '{"speech": "hi"}'}]},
+            {"role": "user", "parts": [{"text": "turn 2"}]},
+        ]
+
+
+class TestRoutingPolicy:
+    @pytest.fixture
+    def policy(self):
+        return RoutingPolicy.from_dict(
+            {
+                "default": {"model": "big", "thinking_level": "HIGH", "cost": 0.01},
+                "rules": [
+                    {"action_type": "vote", "thinking_level": "LOW", "cost": 0.002},
+                    {"action_type": "speak", "phase": "day_1", "timeout": 60},
+                    {"role": "detective", "model": "detective-model"},
+                ],
+                "downgrade": {"model": "small", "thinking_level": "MINIMAL"},
+                "low_stakes": ["vote", "last_words"],
+                "budget": {"cost": 0.01, "reserve": 0.2},
+            }
+        )
+
+    def test_first_matching_rule_wins(self, policy):
+        """Rules are matched in order and merged over the default route."""
+        route = policy.resolve(ActionType.VOTE, "day_2", "detective")
+        assert route.model == "big"
+        assert route.thinking_level == "LOW"
+
+    def test_rule_without_cost_inherits_default_cost(self, policy):
+        """Omitted fields, cost included, fall back to the default route."""
+        route = policy.resolve(ActionType.INVESTIGATION, "night_1", "detective")
+        assert route.cost == 0.01
+
+        router = ActionRouter(policy)
+        router.record(route, latency=1.0)
+        assert router.summary()["spent_cost"] == 0.01
+        assert router.select(ActionType.VOTE, "day_1", "town").model == "small"
+
+    def test_phase_selector_is_prefix(self, policy):
+        """Phase selectors match by prefix so day_1 does not match day_2."""
+        assert policy.resolve(ActionType.SPEAK, "day_1", "town").timeout == 60
+        assert policy.resolve(ActionType.SPEAK, "day_2", "town").timeout is None
+
+    def test_phase_prefix_stops_at_underscore(self):
+        """day_1 does not match day_10, while day still matches every day."""
+        policy = RoutingPolicy.from_dict(
+            {
+                "rules": [
+                    {"phase": "day_1", "timeout": 60},
+                    {"phase": "day", "timeout": 30},
+                ],
+            }
+        )
+
+        assert policy.resolve(ActionType.SPEAK, "day_1", "town").timeout == 60
+        assert policy.resolve(ActionType.SPEAK, "day_10", "town").timeout == 30
+        assert policy.resolve(ActionType.SPEAK, "day_11", "town").timeout == 30
+
+    def test_role_selector(self, policy):
+        """Role rules apply across action types."""
+        route = policy.resolve(ActionType.INVESTIGATION, "night_1", "detective")
+        assert route.model == "detective-model"
+
+    def test_unknown_action_type_rejected(self):
+        """Invalid config fails loudly."""
+        with pytest.raises(ValueError, match="Unknown action type"):
+            RoutingPolicy.from_dict({"rules": [{"action_type": "dance"}]})
+        with pytest.raises(ValueError, match="Unknown route fields"):
+            RoutingPolicy.from_dict({"default": {"temperature": 1}})
+
+    def test_router_downgrades_low_stakes_when_budget_short(self, policy):
+        """Once spend crosses the reserve line, low-stakes actions downgrade."""
+        router = ActionRouter(policy)
+        assert router.select(ActionType.VOTE, "day_1", "town").model == "big"
+
+        router.record(ActionRoute(cost=0.009), latency=1.0)
+
+        vote_route = router.select(ActionType.VOTE, "day_1", "town")
+        assert vote_route.model == "small"
+        assert vote_route.thinking_level == "MINIMAL"
+        # High-stakes actions keep their tier
+        assert router.select(ActionType.SPEAK, "day_2", "town").model == "big"
+        assert router.summary()["downgraded_calls"] == 1
+
+
+class TestHedgedProvider:
+    class _SlowFirstProvider:
+        """Stand-in whose first request hangs and later requests answer quickly."""
+
+        model = "stand-in"
+
+        def __init__(self, slow: float = 5.0, fast: float = 0.0):
+            self.slow = slow
+            self.fast = fast
+            self.started = 0
+            self.cancelled = 0
+
+        async def act(self, action_type, context, **kwargs):
+            self.started += 1
+            delay = self.slow if self.started == 1 else self.fast
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            return make_speak_response(speech=f"answer from request {self.started}")
+
+    async def test_slow_call_is_hedged_and_loser_cancelled(self):
+        """A hedge fires after the delay, wins, and the slow request is cancelled."""
+        inner = self._SlowFirstProvider()
+        provider = HedgedProvider(inner, initial_delay=0.02)
+
+        result = await provider.act(ActionType.SPEAK, "context")
+        await asyncio.sleep(0)
+
+        assert result["speech"] == "answer from request 2"
+        assert inner.started == 2
+        assert inner.cancelled == 1
+        record = provider.calls[-1]
+        assert record.hedged
+        assert record.winner == 1
+        assert provider.summary()["hedge_wins"] == 1
+
+    async def test_hedged_call_records_latency_from_call_start(self):
+        """The cancelled primary still counts, timed from the original start."""
+        provider = HedgedProvider(self._SlowFirstProvider(fast=0.02), initial_delay=0.03)
+
+        await provider.act(ActionType.SPEAK, "context")
+
+        samples = list(provider._latencies["speak"])
+        assert len(samples) == 1
+        assert samples[0] >= 0.05  # Hedge delay + hedge latency, not 0.02
+
+    async def test_hedges_are_counted_in_game_metrics(self):
+        """Fired, won and cancelled hedges reach the per-game metrics snapshot."""
+        registry = MetricsRegistry()
+        token = set_game_metrics(registry)
+        try:
+            provider = HedgedProvider(self._SlowFirstProvider(), initial_delay=0.02)
+            await provider.act(ActionType.SPEAK, "context")
+        finally:
+            reset_game_metrics(token)
+
+        samples = registry.snapshot()["mafia_provider_hedges_total"]["samples"]
+        counts = {sample["labels"]["outcome"]: sample["value"] for sample in samples}
+        assert counts == {"fired": 1, "won": 1, "cancelled": 1}
+
+    async def test_fast_call_is_not_hedged(self):
+        """Calls that finish before the delay issue a single request."""
+        inner = self._SlowFirstProvider(slow=0.0)
+        provider = HedgedProvider(inner, initial_delay=1.0)
+
+        await provider.act(ActionType.VOTE, "context")
+
+        assert inner.started == 1
+        assert not provider.calls[-1].hedged
+
+    async def test_delay_adapts_to_latency_percentile(self):
+        """After min_samples, the hedge delay follows observed latencies."""
+        provider = HedgedProvider(AsyncMock(), min_samples=4, percentile=0.75, min_delay=0.0)
+        for latency in (0.1, 0.2, 0.3, 4.0):
+            provider._record_latency(ActionType.SPEAK, latency)
+
+        assert provider.hedge_delay(ActionType.SPEAK) == pytest.approx(0.3)
+        # Other action types keep the initial delay until they have samples
+        assert provider.hedge_delay(ActionType.VOTE) == provider.initial_delay
+
+    async def test_hedges_take_rate_limiter_tokens(self):
+        """Both the first request and the hedge draw from the shared limiter."""
+        limiter = RateLimiter(rate=0.01, burst=10)
+        inner = self._SlowFirstProvider()
+        provider = HedgedProvider(inner, initial_delay=0.02, rate_limiter=limiter)
+
+        await provider.act(ActionType.SPEAK, "context")
+
+        assert limiter._tokens == pytest.approx(8, abs=0.01)
+
+    async def test_error_propagates_when_all_requests_fail(self):
+        """A failing call surfaces the provider error."""
+        inner = AsyncMock()
+        inner.act = AsyncMock(side_effect=InvalidResponseError("bad"))
+        provider = HedgedProvider(inner, initial_delay=1.0)
+
+        with pytest.raises(InvalidResponseError):
+            await provider.act(ActionType.SPEAK, "context")
+        assert provider.calls[-1].error is not None
+
+
+class TestFakeProvider:
+    def test_parses_valid_options_from_prompt(self):
+        """The last "Valid ...:" line of the prompt lists the legal targets."""
+        context = "intro\nValid nomination targets: Alice, Bob, skip\n\nfields"
+        assert parse_valid_options(context) == ["Alice", "Bob", "skip"]
+
+    def test_builds_schema_valid_output_with_legal_target(self):
+        """Targeted actions pick a listed player; other fields are filled."""
+        context = "Valid targets: Charlie, Diana"
+        output = build_fake_output(ActionType.NIGHT_KILL, context)
+        assert output["target"] in {"Charlie", "Diana"}
+        assert output["message"]
+
+    async def test_injects_outage(self):
+        """A downed fake raises the configured error."""
+        provider = FakeProvider(error=ConnectionError)
+        provider.down = True
+        with pytest.raises(ConnectionError):
+            await provider.act(ActionType.DEFENSE, "context")
+        assert provider.failures == 1
+
+
+class TestFailoverProvider:
+    class _Clock:
+        def __init__(self):
+            self.now = 0.0
+
+        def __call__(self) -> float:
+            return self.now
+
+    def test_breaker_opens_after_consecutive_failures(self):
+        """The circuit opens at the failure threshold and probes after cooldown."""
+        clock = self._Clock()
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=10.0, clock=clock)
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+
+        clock.now = 10.0
+        assert breaker.allow()
+        # Only one probe at a time
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_breaker_opens_on_error_rate(self):
+        """An error rate over the window opens the circuit without a failure streak."""
+        breaker = CircuitBreaker(failure_threshold=100, error_rate=0.5, min_calls=4)
+        for _ in range(2):
+            breaker.record_success()
+            breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+    def test_failed_probe_reopens(self):
+        """A failing probe waits out another full cooldown."""
+        clock = self._Clock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=5.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 5.0
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        clock.now = 9.0
+        assert not breaker.allow()
+
+    async def test_routes_around_failing_primary(self):
+        """Failures fall through to the next provider and then skip the open circuit."""
+        primary = FakeProvider(model="primary")
+        primary.down = True
+        secondary = FakeProvider(model="secondary")
+        provider = FailoverProvider(
+            [primary, secondary],
+            breaker_factory=lambda: CircuitBreaker(failure_threshold=2),
+        )
+
+        for _ in range(4):
+            result = await provider.act(ActionType.VOTE, "Valid vote options: Bob, skip")
+            assert result["vote"] == "Bob"
+
+        # Two failures opened the primary circuit; later calls skip it
+        assert primary.calls == 2
+        assert secondary.calls == 4
+        summary = provider.summary()
+        assert summary["failovers"] == 4
+        assert summary["providers"]["0:primary"]["state"] == "open"
+        assert summary["providers"]["1:secondary"]["state"] == "closed"
+
+    async def test_invalid_response_is_not_failed_over(self):
+        """Schema problems go back to the agent instead of the next provider."""
+        primary = FakeProvider(error=InvalidResponseError)
+        primary.down = True
+        secondary = FakeProvider()
+        provider = FailoverProvider([primary, secondary])
+
+        with pytest.raises(InvalidResponseError):
+            await provider.act(ActionType.SPEAK, "context")
+        assert secondary.calls == 0
+        assert provider.health[0].breaker.state == CircuitState.CLOSED
+
+    async def test_raises_provider_error_when_all_fail(self):
+        """With every provider down the agent gets a ProviderError to default on."""
+        first, second = FakeProvider(), FakeProvider()
+        first.down = second.down = True
+        provider = FailoverProvider([first, second])
+
+        with pytest.raises(ProviderError, match="available providers failed"):
+            await provider.act(ActionType.SPEAK, "context")
+
+    async def test_strips_route_model_on_fallback(self):
+        """Fallback providers keep the route's timeout but not its model name."""
+        seen = []
+
+        class _Recorder:
+            model = "recorder"
+
+            async def act(self, action_type, context, route=None):
+                seen.append(route)
+                return {}
+
+        primary = FakeProvider()
+        primary.down = True
+        provider = FailoverProvider([primary, _Recorder()])
+
+        await provider.act(
+            ActionType.VOTE, "context", route=ActionRoute(model="gemini-x", timeout=5.0)
+        )
+        assert seen == [ActionRoute(model=None, timeout=5.0)]
+
+
+class TestFakeLLMServer:
+    """The real SDK clients talk to the local fake over HTTP."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_global_budget(self, monkeypatch):
+        monkeypatch.setattr(retry_module, "GLOBAL_RETRY_BUDGET", RetryBudget())
+
+    async def test_anthropic_tool_use_round_trip(self):
+        """Forced tool_use calls return schema-valid input with a legal target."""
+        async with FakeLLMServer(FakeServerConfig(seed=1)) as server:
+            provider = AnthropicProvider(api_key="test", base_url=server.base_url)
+            result = await provider.act(ActionType.VOTE, "Valid vote options: Bob, skip")
+
+        assert result["vote"] == "Bob"
+        assert server.statuses[200] == 1
+
+    async def test_anthropic_session_round_trip(self):
+        """Session requests (cached system blocks, history) reach the action prompt."""
+        session = PlayerSession(system="[YOUR IDENTITY]\nYou are Alice.")
+        session.record("Valid vote options: Dan, skip", '{"vote": "Dan"}', {})
+        async with FakeLLMServer(FakeServerConfig(seed=1)) as server:
+            provider = AnthropicProvider(api_key="test", base_url=server.base_url)
+            result = await provider.act(
+                ActionType.VOTE, "Valid vote options: Bob, skip", session=session
+            )
+
+        assert result["vote"] in {"Bob", "skip"}
+        assert server.statuses[200] == 1
+
+    async def test_gemini_json_schema_round_trip(self):
+        """generateContent answers match the requested action schema."""
+        async with FakeLLMServer(FakeServerConfig(seed=1)) as server:
+            provider = GoogleGenAIProvider(api_key="test", base_url=server.base_url)
+            result = await provider.act(ActionType.INVESTIGATION, "Valid targets: Carol")
+            speech = await provider.act(ActionType.DEFENSE, "context")
+
+        assert result["target"] == "Carol"
+        assert set(speech) == {"reasoning", "text"}
+
+    async def test_rate_limit_sends_retry_after(self):
+        """Over-limit requests get 429 with Retry-After, and the client retries."""
+        config = FakeServerConfig(rate_limit_rps=20, rate_limit_burst=1, retry_after=0.1)
+        async with FakeLLMServer(config) as server:
+            provider = AnthropicProvider(api_key="test", base_url=server.base_url)
+            await provider.act(ActionType.DEFENSE, "context")
+            await provider.act(ActionType.DEFENSE, "context")
+
+        assert server.statuses[429] == 1
+        assert server.statuses[200] == 2
+        # Both requests reused one pooled connection
+        assert server.connections == 1
+
+    async def test_injected_errors_exhaust_retries(self):
+        """A server that always fails surfaces as RetryExhausted."""
+        async with FakeLLMServer(FakeServerConfig(error_rate=1.0)) as server:
+            provider = AnthropicProvider(api_key="test", base_url=server.base_url)
+            with (
+                patch("src.providers.base.asyncio.sleep", new=AsyncMock()),
+                pytest.raises(RetryExhausted),
+            ):
+                await provider.act(ActionType.DEFENSE, "context")
+
+        assert sum(server.statuses[code] for code in (500, 503)) == 3
+
+    async def test_metrics_share_provider_label(self):
+        """Retries, errors, latency and tokens are all labelled with provider_name."""
+        registry = MetricsRegistry()
+        config = FakeServerConfig(rate_limit_rps=20, rate_limit_burst=1, retry_after=0.1)
+        token = set_game_metrics(registry)
+        try:
+            async with FakeLLMServer(config) as server:
+                provider = AnthropicProvider(api_key="test", base_url=server.base_url)
+                await provider.act(ActionType.DEFENSE, "context")
+                await provider.act(ActionType.DEFENSE, "context")
+        finally:
+            reset_game_metrics(token)
+
+        snapshot = registry.snapshot()
+        for name in (
+            "mafia_provider_errors_total",
+            "mafia_provider_retries_total",
+            "mafia_provider_request_seconds",
+            "mafia_provider_tokens_total",
+        ):
+            labels = {sample["labels"]["provider"] for sample in snapshot[name]["samples"]}
+            assert labels == {AnthropicProvider.provider_name}, name
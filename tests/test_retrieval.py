@@ -0,0 +1,151 @@
+"""Tests for BM25 speech retrieval."""
+
+import pytest
+
+from src.engine.context import ContextBuilder, TranscriptStyle
+from src.engine.retrieval import IndexedSpeech, SpeechIndex, tokenize
+from src.engine.transcript import TranscriptManager
+from src.schemas import ActionType, DefenseSpeech, GameState, PlayerMemory
+
+
+class TestSpeechIndex:
+    @pytest.fixture
+    def index(self):
+        index = SpeechIndex()
+        index.add(IndexedSpeech(1, "Alice", "Bob has been too quiet, I distrust Bob", "Bob"))
+        index.add(IndexedSpeech(1, "Bob", "I am a simple villager", "Charlie"))
+        index.add(IndexedSpeech(1, "Charlie", "Nothing stands out yet", "Diana"))
+        index.add(IndexedSpeech(2, "Diana", "Alice claimed detective yesterday", "Eve"))
+        return index
+
+    def test_tokenize_drops_stopwords(self):
+        """Tokens are lowercased and function words removed."""
+        assert tokenize("I think Bob IS the Mafia!") == ["think", "bob", "mafia"]
+
+    def test_speeches_about_player_rank_first(self, index):
+        """Speeches naming a player outrank the one they merely nominated from."""
+        results = index.search("Bob", k=2)
+
+        assert [speech.speaker for _, speech in results] == ["Alice", "Bob"]
+        assert results[0][0] > results[1][0]
+
+    def test_top_k_and_no_match(self, index):
+        """At most k results; speeches without a query term are never returned."""
+        assert len(index.search("Alice Bob Charlie Diana", k=2)) == 2
+        assert index.search("Zelda") == []
+        assert index.search("Bob", k=0) == []
+
+    def test_exclude_rounds(self, index):
+        """Rounds already shown in full are skipped."""
+        results = index.search("Alice", k=5, exclude_rounds={2})
+
+        assert {speech.round_number for _, speech in results} == {1}
+
+    def test_index_is_incremental(self, index):
+        """New speeches are searchable right after they are added."""
+        index.add(IndexedSpeech(3, "Eve", "Frank voted with the wolves", "Frank"))
+
+        results = index.search("Frank", k=1)
+
+        assert len(index) == 5
+        assert results[0][1].speaker == "Eve"
+
+
+class TestRetrievedContext:
+    @pytest.fixture
+    def manager(self):
+        manager = TranscriptManager(full_rounds=1)
+        manager.add_speech("Alice", "Bob dodged every question", "Bob")
+        manager.add_speech("Charlie", "I agree with nothing", "Diana")
+        manager.finalize_round(
+            1,
+            None,
+            {"Alice": "Bob", "Charlie": "Bob"},
+            "revote",
+            last_words="I was the doctor",
+            defense_speeches=[DefenseSpeech(speaker="Bob", text="Alice is lying")],
+            revote={"Alice": "Bob", "Charlie": "Bob"},
+            revote_outcome="eliminated:Bob",
+        )
+        manager.start_round(2, "Eve")
+        return manager
+
+    def test_finalized_rounds_are_indexed(self, manager):
+        """Speeches, defenses and last words all go into the index."""
+        kinds = [(speech.speaker, speech.kind) for speech in manager.speech_index.speeches]
+
+        assert kinds == [
+            ("Alice", "speech"),
+            ("Charlie", "speech"),
+            ("Bob", "defense"),
+            ("Bob", "last_words"),
+        ]
+
+    def test_clear_keeps_builder_index_in_sync(self, manager):
+        """A builder holding the manager's index sees speeches added after clear()."""
+        builder = ContextBuilder(speech_index=manager.speech_index, retrieved_speeches=3)
+
+        manager.clear()
+        manager.add_speech("Eve", "Frank is hiding something", "Frank")
+        manager.finalize_round(1, None, {"Eve": "Frank"}, "no_elimination")
+
+        assert builder.speech_index is manager.speech_index
+        results = builder.speech_index.search("Frank Bob", 3)
+        assert [speech.speaker for _, speech in results] == ["Eve"]
+
+    def test_retrieved_section_replaces_previous_round(self, manager, sample_persona):
+        """With one full round, earlier speeches come back only when relevant."""
+        builder = ContextBuilder(speech_index=manager.speech_index, retrieved_speeches=3)
+        state = GameState(
+            phase="day_2",
+            round_number=2,
+            living_players=["Alice", "Charlie", "Diana"],
+            dead_players=["Bob", "Eve"],
+            nominated_players=[],
+        )
+        memory = PlayerMemory(facts={}, beliefs={"suspicions": "Alice seems off"})
+
+        context = builder.build_context(
+            player_name="Diana",
+            role="town",
+            persona=sample_persona,
+            game_state=state,
+            transcript=manager.get_transcript_for_player(current_round=2),
+            memory=memory,
+            action_type=ActionType.SPEAK,
+        )
+
+        assert "Day 1 (summary)" in context
+        assert "[RELEVANT PAST SPEECHES]" in context
+        assert 'Day 1 Bob (defense): "Alice is lying"' in context
+        assert 'Day 1 Alice: "Bob dodged every question" Nominated: Bob' in context
+        assert 'Day 1 Charlie: "I agree with nothing" Nominated: Diana' in context
+        assert "I was the doctor" not in context  # Matches no one in the query
+
+    def test_compact_style_aliases_speakers(self, manager, sample_persona):
+        """Compact transcripts alias speakers and nominees in retrieved speeches."""
+        builder = ContextBuilder(
+            transcript_style=TranscriptStyle.COMPACT,
+            seats={"Alice": 0, "Bob": 1, "Charlie": 2, "Diana": 3, "Eve": 4},
+            speech_index=manager.speech_index,
+            retrieved_speeches=1,
+        )
+        state = GameState(
+            phase="day_2",
+            round_number=2,
+            living_players=["Alice", "Charlie", "Diana"],
+            dead_players=["Bob", "Eve"],
+            nominated_players=["Charlie"],
+        )
+
+        context = builder.build_context(
+            player_name="Diana",
+            role="town",
+            persona=sample_persona,
+            game_state=state,
+            transcript=manager.get_transcript_for_player(current_round=2),
+            memory=PlayerMemory(facts={}, beliefs={}),
+            action_type=ActionType.VOTE,
+        )
+
+        assert 'Day 1 #2: "I agree with nothing" Nominated: #3' in context
@@ -5,6 +5,7 @@ from pydantic import ValidationError
 
 from src.schemas import (
     ActionType,
+    AppendLog,
     CompressedRoundSummary,
     DayRoundTranscript,
     DefenseOutput,
@@ -43,8 +44,8 @@ class TestGameState:
         assert len(sample_game_state.living_players) == 10
 
     def test_game_state_validation(self):
-        """GameState validates required fields."""
-        with pytest.raises(ValidationError):
+        """GameState requires every field."""
+        with pytest.raises(TypeError):
             GameState()  # Missing required fields
 
 
@@ -59,6 +60,49 @@ class TestPlayerMemory:
         assert empty_memory.facts == {}
         assert empty_memory.beliefs == {}
 
+    def test_update_shares_unchanged_dicts(self, sample_memory):
+        """Updates copy only the dict they change and never mutate the original."""
+        updated = sample_memory.update(beliefs={"strategy": "lay low"})
+
+        assert updated.facts is sample_memory.facts
+        assert updated.beliefs["strategy"] == "lay low"
+        assert sample_memory.beliefs["strategy"] == "find the Mafia"
+        assert sample_memory.update() is sample_memory
+
+    def test_history_snapshots_and_branches(self, empty_memory):
+        """Older memories keep their history; appending to one branches it."""
+        first = empty_memory.update(facts={"log": empty_memory.history("log").append(1)})
+        second = first.update(facts={"log": first.history("log").append(2)})
+        branch = first.update(facts={"log": first.history("log").append(3)})
+
+        assert first.facts["log"] == [1]
+        assert second.facts["log"] == [1, 2]
+        assert branch.facts["log"] == [1, 3]
+        assert second.history("log")[-1] == 2
+
+
+class TestAppendLog:
+    def test_sequence_behaviour(self):
+        """An AppendLog reads like the list it was built from."""
+        log = AppendLog(["a", "b"]).append("c")
+
+        assert list(log) == ["a", "b", "c"]
+        assert log[0] == "a"
+        assert log[-1] == "c"
+        assert log[1:] == ["b", "c"]
+        assert log == ("a", "b", "c")
+        with pytest.raises(IndexError):
+            log[3]
+
+    def test_tip_appends_share_storage(self):
+        """Extending the newest log does not copy earlier entries."""
+        base = AppendLog(range(1000))
+        extended = base.append(1000).append(1001)
+
+        assert extended._items is base._items
+        assert len(base) == 1000
+        assert list(base)[-1] == 999
+
 
 class TestPlayerResponse:
     def test_create_response(self, sample_memory):
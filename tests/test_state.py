@@ -2,9 +2,10 @@
 
 import pytest
 
+from src.analysis.latency import load_logs
 from src.engine.events import EventLog
 from src.engine.state import GameStateManager
-from src.storage.json_logs import GameLogWriter, PlayerEntry
+from src.storage.json_logs import GameLogWriter, PlayerEntry, sidecar_path
 
 
 class TestGameStateManager:
@@ -480,6 +481,34 @@ class TestEventLog:
         events = log.get_events_since_timestamp("2024-01-01T00:00:00Z")
         assert events == [second]
 
+    def test_public_view_is_extended_incrementally(self):
+        """New events are projected on the next call; since_index is a sequence number."""
+        log = EventLog()
+        log.add("speech", {"speaker": "Alice", "text": "Hi", "reasoning": "x"}, ["reasoning"])
+        log.add("investigation", {"target": "Bob"}, ["target"])
+        first = log.get_public_view()
+
+        log.add("speech", {"speaker": "Bob", "text": "Hello"})
+
+        assert log.next_seq == 3
+        assert [e.data["speaker"] for e in log.get_public_view()] == ["Alice", "Bob"]
+        assert log.get_public_view()[0] is first[0]
+        assert [e.data["speaker"] for e in log.get_public_view(1)] == ["Bob"]
+        assert log.get_public_view(3) == []
+
+    def test_type_and_phase_indexes(self):
+        """Type and phase queries return matching events in log order."""
+        log = EventLog()
+        log.add_phase_start("day_1", 1)
+        log.add_speech("Alice", "Hello", "Bob", {}, phase="day_1", round_number=1)
+        log.add_phase_start("night_1", 1)
+        log.add_speech("Bob", "Late", "Alice", {}, phase="day_2", round_number=2)
+
+        assert [e.data["speaker"] for e in log.get_events_of_type("speech")] == ["Alice", "Bob"]
+        assert [e.type for e in log.get_events_of_phase("day_1")] == ["phase_start", "speech"]
+        assert log.get_events_of_type("game_end") == []
+        assert log.get_events_of_phase("night_3") == []
+
     def test_convenience_methods(self):
         """Convenience methods create correct event types."""
         log = EventLog()
@@ -643,6 +672,17 @@ class TestGameLogWriter:
         assert "game1" in games
         assert "game2" in games
 
+    def test_list_games_skips_sidecars(self, tmp_path):
+        """Files derived from a log are not listed as games."""
+        writer = GameLogWriter(str(tmp_path))
+        log_path = writer.write("game1", "t1", "t2", "town", [], EventLog().get_full_view())
+        sidecar = sidecar_path(log_path, "prompts")
+        sidecar.parent.mkdir()
+        sidecar.write_text("{}")
+
+        assert writer.list_games() == ["game1"]
+        assert [log["game_id"] for log in load_logs([str(tmp_path)])] == ["game1"]
+
     async def test_write_game_log(self, tmp_path):
         """Async write_game_log writes to disk."""
         writer = GameLogWriter(str(tmp_path))
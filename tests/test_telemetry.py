@@ -0,0 +1,182 @@
+"""Tests for the background telemetry exporter."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.engine.game import GameConfig, GameRunner
+from src.personas.initial import get_personas
+from src.providers import AnthropicProvider
+from src.providers.fake import FakeProvider
+from src.providers.fake_server import FakeLLMServer, FakeServerConfig
+from src.schemas import ActionType
+from src.telemetry import (
+    JsonlFileSink,
+    LangfuseSink,
+    TelemetryExporter,
+    configure_telemetry,
+    emit,
+    reset_game_trace,
+    start_game_trace,
+)
+
+
+class RecordingSink:
+    def __init__(self, block: threading.Event | None = None, fail: bool = False):
+        self.batches: list[list[dict]] = []
+        self.block = block
+        self.fail = fail
+        self.closed = False
+
+    def export(self, batch: list[dict]) -> None:
+        if self.block is not None:
+            self.block.wait()
+        if self.fail:
+            raise RuntimeError("collector unavailable")
+        self.batches.append(batch)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestTelemetryExporter:
+    def test_batches_events_and_flushes_on_close(self):
+        """Queued events are exported in batches and flushed by close()."""
+        sink = RecordingSink()
+        exporter = TelemetryExporter([sink], batch_size=10, flush_interval=0.01)
+        for index in range(25):
+            exporter.emit({"type": "test", "index": index})
+        exporter.close()
+
+        events = [event for batch in sink.batches for event in batch]
+        assert [event["index"] for event in events] == list(range(25))
+        assert all(len(batch) <= 10 for batch in sink.batches)
+        assert sink.closed
+        assert exporter.summary()["exported"] == 25
+
+    def test_drops_when_queue_is_full(self):
+        """A stalled sink never blocks emit(); overflow is dropped and counted."""
+        release = threading.Event()
+        sink = RecordingSink(block=release)
+        exporter = TelemetryExporter([sink], max_queue=5, batch_size=1)
+        for index in range(50):
+            exporter.emit({"type": "test", "index": index})
+        assert exporter.dropped >= 40
+        release.set()
+        exporter.close()
+        assert exporter.exported + exporter.dropped == 50
+
+    def test_sink_failures_are_contained(self):
+        """A failing sink is logged and counted without raising."""
+        exporter = TelemetryExporter([RecordingSink(fail=True)], flush_interval=0.01)
+        exporter.emit({"type": "test"})
+        exporter.close()
+        assert exporter.failed == 1
+
+    def test_samples_games(self):
+        """Only sampled games export detailed events; summaries always go out."""
+        sink = RecordingSink()
+        exporter = TelemetryExporter([sink], sample_rate=0.5)
+        previous = configure_telemetry(exporter)
+        game_ids = [f"game-{index}" for index in range(200)]
+        try:
+            for game_id in game_ids:
+                token = start_game_trace(game_id)
+                emit({"type": "generation"})
+                emit({"type": "game"}, always=True)
+                reset_game_trace(token)
+        finally:
+            configure_telemetry(previous)
+            exporter.close()
+
+        events = [event for batch in sink.batches for event in batch]
+        traced = {e["game_id"] for e in events if e["type"] == "generation"}
+        assert {e["game_id"] for e in events if e["type"] == "game"} == set(game_ids)
+        assert traced == {game_id for game_id in game_ids if exporter.is_sampled(game_id)}
+        assert 50 < len(traced) < 150
+        assert exporter.sampled_out == 200 - len(traced)
+
+    async def test_game_summary_written_to_file_sink(self, tmp_path):
+        """A game emits its summary to the local JSONL sink."""
+        path = tmp_path / "telemetry.jsonl"
+        exporter = TelemetryExporter([JsonlFileSink(path)], sample_rate=0.0)
+        previous = configure_telemetry(exporter)
+        personas = get_personas()
+        runner = GameRunner(
+            GameConfig(
+                player_names=list(personas),
+                personas=personas,
+                provider=FakeProvider(seed=2),
+                output_dir=str(tmp_path),
+                seed=2,
+            )
+        )
+        try:
+            result = await runner.run()
+        finally:
+            configure_telemetry(previous)
+            exporter.close()
+
+        events = [json.loads(line) for line in path.read_text().splitlines()]
+        assert events == [
+            {
+                "type": "game",
+                "model": "fake",
+                "seed": 2,
+                "winner": result.winner,
+                "rounds": result.rounds,
+                "log_path": result.log_path,
+                "game_id": runner.event_log.game_id,
+                "timestamp": events[0]["timestamp"],
+            }
+        ]
+
+    async def test_generation_carries_call_timing(self):
+        """Provider generations record when the call started and how long it took."""
+        sink = RecordingSink()
+        exporter = TelemetryExporter([sink], sample_rate=1.0)
+        previous = configure_telemetry(exporter)
+        try:
+            async with FakeLLMServer(FakeServerConfig(seed=1)) as server:
+                provider = AnthropicProvider(api_key="test", base_url=server.base_url)
+                before = time.time()
+                await provider.act(ActionType.VOTE, "Valid vote options: Bob, skip")
+                after = time.time()
+        finally:
+            configure_telemetry(previous)
+            exporter.close()
+
+        (event,) = [e for batch in sink.batches for e in batch if e["type"] == "generation"]
+        assert event["provider"] == "anthropic"
+        assert before <= event["start_time"] <= event["end_time"] <= after
+        assert event["end_time"] - event["start_time"] == pytest.approx(event["latency"], abs=1e-6)
+
+
+class TestLangfuseSink:
+    def test_generation_uses_call_times(self):
+        """Generations are backdated to the call instead of the export time."""
+        sink = LangfuseSink.__new__(LangfuseSink)
+        sink.client = MagicMock()
+        generation = sink.client.start_observation.return_value
+
+        sink.export([
+            {"type": "game"},
+            {
+                "type": "generation",
+                "game_id": "g",
+                "action": "vote",
+                "start_time": 100.0,
+                "end_time": 102.5,
+                "latency": 2.5,
+            },
+        ])
+
+        kwargs = sink.client.start_observation.call_args.kwargs
+        assert kwargs["name"] == "llm_call.vote"
+        assert kwargs["metadata"]["latency"] == 2.5
+        assert generation._otel_span._start_time == 100_000_000_000
+        generation.end.assert_called_once_with(end_time=102_500_000_000)
+
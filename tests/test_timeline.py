@@ -0,0 +1,140 @@
+"""Tests for the replay timeline compiler."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.engine.events import EventLog
+from src.engine.game import GameConfig, GameRunner
+from src.personas.initial import get_personas
+from src.providers.fake import FakeProvider
+from src.storage.json_logs import GameLogWriter
+from src.storage.timeline import (
+    INITIAL_SCENE,
+    ModeTimeline,
+    main,
+    step_scene,
+    view_events,
+)
+
+
+def _state(phase, living, dead=(), nominated=()):
+    return {
+        "phase": phase,
+        "round_number": int(phase.split("_")[1]),
+        "living": list(living),
+        "dead": list(dead),
+        "nominated": list(nominated),
+    }
+
+
+@pytest.fixture
+def small_log():
+    """Day 1 vote, a night kill and the start of day 2."""
+    log = EventLog()
+    day1 = _state("day_1", ["Alice", "Bob", "Charlie", "Diana"], nominated=["Bob"])
+    log.add_phase_start("day_1", 1, state_public=day1)
+    log.add_speech("Alice", "Bob is odd", "Bob", {"why": "gut"}, phase="day_1", round_number=1)
+    log.add_vote_round(
+        {"Alice": "Bob", "Charlie": "Bob", "Diana": "skip"},
+        "no_elimination",
+        round=1,
+        phase="day_1",
+        round_number=1,
+        state_public=day1,
+    )
+    night = _state("night_1", ["Alice", "Bob", "Charlie", "Diana"])
+    log.add_investigation("Bob", "Mafia", {}, phase="night_1", round_number=1, state_public=night)
+    day2 = _state("day_2", ["Alice", "Bob", "Charlie"], dead=["Diana"])
+    log.add_phase_start("day_2", 2, state_public=day2)
+    return {"game_id": "g", "players": [], "events": log.get_all_events()}
+
+
+class TestViewEvents:
+    def test_public_mode_hides_private_data(self, small_log):
+        """Public events lose private fields; fully private events disappear."""
+        events = view_events(small_log, "public")
+
+        assert "investigation" not in [e["type"] for e in events]
+        speech = next(e for e in events if e["type"] == "speech")
+        assert "reasoning" not in speech["data"]
+        assert "investigation" in [e["type"] for e in view_events(small_log, "omniscient")]
+
+    def test_day_announcement_follows_overnight_deaths(self, small_log):
+        """Day start keeps the previous state; the announcement carries the deaths."""
+        events = view_events(small_log, "public")
+
+        start, announcement = events[-2:]
+        assert start["type"] == "phase_start"
+        assert "Diana" in start["data"]["state_public"]["living"]
+        assert announcement["data"]["text"] == "Diana was killed during the night."
+        assert [e["index"] for e in events] == list(range(len(events)))
+
+
+class TestModeTimeline:
+    def test_scene_state_tracks_votes_and_phases(self, small_log):
+        """Vote tallies reset at phase start; scene kind follows the mode."""
+        timeline = ModeTimeline.compile(small_log, "omniscient", interval=2)
+
+        vote = timeline.state_at(2)
+        assert vote["votes"] == {"Bob": 2, "skip": 1}
+        assert timeline.state_at(3)["scene"] == "detective"
+        last = timeline.state_at(len(timeline.events) - 1)
+        assert last["phase"] == "day_2"
+        assert last["votes"] == {}
+        assert last["dead"] == ["Diana"]
+
+    async def test_seek_matches_linear_replay(self, tmp_path):
+        """Every index seeks to the same state as replaying from the start."""
+        personas = get_personas()
+        config = GameConfig(
+            player_names=list(personas),
+            personas=personas,
+            provider=FakeProvider(seed=6),
+            output_dir=str(tmp_path),
+            seed=6,
+            timeline=True,
+        )
+        result = await GameRunner(config).run()
+        log = json.loads(Path(result.log_path).read_text())
+        compiled = json.loads(Path(result.timeline_path).read_text())
+
+        for mode in ("public", "omniscient"):
+            timeline = ModeTimeline.compile(log, mode, interval=4)
+            assert len(timeline.keyframes) == -(-len(timeline.events) // 4)
+            assert compiled["modes"][mode]["events"] == timeline.events
+            scene = INITIAL_SCENE
+            for index, event in enumerate(timeline.events):
+                scene = step_scene(scene, event, mode)
+                assert timeline.state_at(index) == scene
+
+    def test_invalid_interval_rejected(self, small_log):
+        """Keyframe intervals must be positive."""
+        with pytest.raises(ValueError, match="must be positive"):
+            ModeTimeline.compile(small_log, "public", interval=0)
+
+
+class TestTimelineCli:
+    def test_writes_timeline_next_to_log(self, small_log, tmp_path, capsys):
+        """The CLI compiles a log into timelines/<log name>, out of the log glob."""
+        log_path = tmp_path / "game_g.json"
+        log_path.write_text(json.dumps(small_log))
+
+        assert main([str(log_path), "--interval", "3"]) == 0
+
+        timeline = json.loads((tmp_path / "timelines" / "game_g.json").read_text())
+        assert GameLogWriter(str(tmp_path)).list_games() == ["g"]
+        assert timeline["timeline_version"] == 1
+        assert timeline["keyframe_interval"] == 3
+        assert set(timeline["modes"]) == {"public", "omniscient"}
+        assert "Wrote" in capsys.readouterr().out
+
+    def test_missing_log_is_reported(self, tmp_path, capsys):
+        """An unreadable log path is reported on stderr instead of raising."""
+        missing = tmp_path / "game_missing.json"
+
+        assert main([str(missing)]) == 1
+
+        assert str(missing) in capsys.readouterr().err
+
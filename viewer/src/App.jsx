@@ -4,6 +4,7 @@ import Subtitles from './components/Subtitles'
 import VoteTokens from './components/VoteTokens'
 import useGameStore from './stores/gameStore'
 import { findActiveSpeaker } from './utils/logParser'
+import { sceneAt } from './utils/timeline'
 import { useVoteSequence } from './hooks/useVoteSequence'
 import { usePlayback } from './hooks/usePlayback'
 import { useNightDialogue } from './hooks/useNightDialogue'
@@ -73,6 +74,7 @@ function getLivingForEvent(event, voteSequence, mode) {
 function App() {
   const {
     log,
+    timeline,
     events,
     eventIndex,
     mode,
@@ -108,7 +110,12 @@ function App() {
     focusMode = 'speaker'
   }
 
-  const living = getLivingForEvent(currentEvent, voteSequence, mode)
+  // Compiled timelines know the scene even for events without a state snapshot
+  const scene = useMemo(
+    () => sceneAt(timeline, mode, eventIndex),
+    [timeline, mode, eventIndex],
+  )
+  const living = getLivingForEvent(currentEvent, voteSequence, mode) || scene?.living || null
   const sceneKind = getSceneKind(currentEvent, mode)
   const scenePlayers = getVisiblePlayers(players, currentEvent, mode)
 
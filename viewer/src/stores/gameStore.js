@@ -1,5 +1,6 @@
 import { create } from 'zustand'
 import { parseLog } from '../utils/logParser'
+import { isTimeline, timelineEvents } from '../utils/timeline'
 
 const DEFAULT_MODE = 'omniscient'
 
@@ -8,20 +9,28 @@ const clampIndex = (index, length) => {
   return Math.max(0, Math.min(index, length - 1))
 }
 
+// A compiled timeline already holds the events of every mode
+const eventsFor = (log, timeline, mode) => {
+  if (timeline) return timelineEvents(timeline, mode)
+  return log ? parseLog(log, { mode }) : []
+}
+
 const useGameStore = create((set, get) => ({
   log: null,
+  timeline: null,
   events: [],
   eventIndex: 0,
   mode: DEFAULT_MODE,
   playing: false,
   setLog: (log) => {
     const mode = get().mode
-    const events = parseLog(log, { mode })
-    set({ log, events, eventIndex: 0, playing: false })
+    const timeline = isTimeline(log) ? log : null
+    const events = eventsFor(log, timeline, mode)
+    set({ log, timeline, events, eventIndex: 0, playing: false })
   },
   setMode: (mode) => {
-    const log = get().log
-    const events = log ? parseLog(log, { mode }) : []
+    const { log, timeline } = get()
+    const events = eventsFor(log, timeline, mode)
     set({ mode, events, eventIndex: 0, playing: false })
   },
   nextEvent: () =>
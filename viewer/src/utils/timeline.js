@@ -0,0 +1,74 @@
+// Compiled replay timelines (python -m src.storage.timeline).
+// Events are precomputed per mode and the scene state is stored every
+// `keyframe_interval` events; stepScene mirrors step_scene in
+// src/storage/timeline.py for the short replay after a keyframe.
+
+export const TIMELINE_VERSION = 1
+
+export function isTimeline(json) {
+  return json?.timeline_version === TIMELINE_VERSION && json.modes != null
+}
+
+export function timelineEvents(timeline, mode) {
+  return timeline?.modes?.[mode]?.events || []
+}
+
+function sceneKind(event, mode) {
+  const night = event.phase.startsWith('night')
+  if (mode !== 'omniscient') return night ? 'night' : 'day'
+  if (event.type === 'night_zero_strategy' || event.type === 'night_kill') return 'mafia'
+  if (event.type === 'investigation') return 'detective'
+  return night ? 'night' : 'day'
+}
+
+function tallyVotes(votes) {
+  return Object.values(votes || {}).reduce((acc, target) => {
+    acc[target] = (acc[target] || 0) + 1
+    return acc
+  }, {})
+}
+
+export function stepScene(scene, event, mode) {
+  const data = event.data || {}
+  let snapshot = data.state_public
+  if (event.type === 'night_kill' && mode === 'omniscient') {
+    snapshot = data.state_before || snapshot
+  } else if (event.type === 'vote_round' || event.type === 'elimination') {
+    snapshot = data.state_after || snapshot
+  } else if (event.type === 'last_words') {
+    snapshot = data.state_before || snapshot
+  }
+
+  const next = { ...scene, index: event.index, scene: sceneKind(event, mode) }
+  if (event.phase !== 'unknown') next.phase = event.phase
+  if (event.roundNumber != null) next.round_number = event.roundNumber
+  if (snapshot) {
+    next.living = [...(snapshot.living || [])]
+    next.dead = [...(snapshot.dead || [])]
+    next.nominated = [...(snapshot.nominated || [])]
+  }
+  if (event.type === 'last_words' && data.speaker && !next.living.includes(data.speaker)) {
+    next.living = [...next.living, data.speaker]
+  }
+  if (event.type === 'phase_start') {
+    next.votes = {}
+  } else if (event.type === 'vote_round') {
+    next.votes = tallyVotes(data.votes)
+  }
+  return next
+}
+
+// Scene state at an index: nearest keyframe plus at most interval - 1 steps
+export function sceneAt(timeline, mode, index) {
+  const modeTimeline = timeline?.modes?.[mode]
+  if (!modeTimeline || !modeTimeline.events.length) return null
+  const { events, keyframes } = modeTimeline
+  const interval = timeline.keyframe_interval
+  const target = Math.max(0, Math.min(index, events.length - 1))
+  const start = Math.floor(target / interval)
+  let scene = keyframes[start]
+  for (let i = start * interval + 1; i <= target; i += 1) {
+    scene = stepScene(scene, events[i], mode)
+  }
+  return scene
+}